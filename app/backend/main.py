@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import sys
 import os
+import asyncio
 import datetime
 import logging
 
@@ -13,6 +14,7 @@ sys.path.append(root_dir)
 from app.backend.routes import trading, hedge_fund, monitoring, health
 from .middleware.error_handler import error_handler
 from .middleware.monitoring import monitoring_middleware
+from src.warm_cache import schedule_warm_cache
 
 # 配置日志
 logging.basicConfig(
@@ -39,6 +41,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 按计划在开盘前预热数据缓存（设置 HEDGE_FUND_WARMUP_TICKERS 和 HEDGE_FUND_WARMUP_AT 后启用）
+@app.on_event("startup")
+async def start_cache_warmup():
+    tickers = os.environ.get("HEDGE_FUND_WARMUP_TICKERS")
+    at = os.environ.get("HEDGE_FUND_WARMUP_AT")
+    if not tickers or not at:
+        return
+    analysts = os.environ.get("HEDGE_FUND_WARMUP_ANALYSTS")
+    app.state.cache_warmup = asyncio.create_task(
+        schedule_warm_cache(
+            tickers=[ticker.strip() for ticker in tickers.split(",")],
+            at=at,
+            lookback_days=int(os.environ.get("HEDGE_FUND_WARMUP_LOOKBACK_DAYS", "365")),
+            analysts=[analyst.strip() for analyst in analysts.split(",")] if analysts else None,
+        )
+    )
+
+
+@app.on_event("shutdown")
+async def stop_cache_warmup():
+    if task := getattr(app.state, "cache_warmup", None):
+        task.cancel()
+
+
 # 1. 先挂载前端静态文件到根路径
 frontend_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "frontend", "dist")
 if os.path.exists(frontend_path):
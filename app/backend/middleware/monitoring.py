@@ -2,9 +2,16 @@ from fastapi import Request
 import time
 import logging
 from ..monitoring.metrics import SystemMetrics
+from src.data.metrics import add_metrics_listener
+from src.data.rate_limit import add_wait_listener
+from src.llm.usage import add_usage_listener
 
 logger = logging.getLogger(__name__)
 metrics = SystemMetrics()
+add_wait_listener(metrics.record_rate_limit_wait)
+# 数据层的缓存命中率、未命中原因、API延迟直方图和传输字节数
+add_metrics_listener(metrics.record_metric)
+add_usage_listener(metrics.record_llm_call)
 
 async def monitoring_middleware(request: Request, call_next):
     """监控中间件，用于收集API调用指标"""
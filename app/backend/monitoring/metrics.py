@@ -105,6 +105,27 @@ class SystemMetrics(MetricsCollector):
         self.record_metric(f"api_latency_{endpoint}", duration)
         self.record_metric(f"api_status_{endpoint}_{status_code}", 1)
 
+    def record_rate_limit_wait(self, endpoint: str, wait_seconds: float) -> None:
+        """记录数据API请求在限流队列中的等待时间"""
+        self.record_metric(f"data_api_rate_limit_wait_{endpoint}", wait_seconds)
+
+    def record_llm_call(self, call: Dict[str, Any]) -> None:
+        """记录一次LLM调用的令牌数、成本、延迟、重试和回退情况（按代理和模型；按股票的汇总只保留在每次运行的LLMUsage中）"""
+        agent = call["agent"] or "unknown"
+        model = f"{call['provider']}_{call['model']}"
+        for scope in (f"agent_{agent}", f"model_{model}"):
+            self.record_metric(f"llm_prompt_tokens_{scope}", call["prompt_tokens"])
+            self.record_metric(f"llm_completion_tokens_{scope}", call["completion_tokens"])
+            if call["cost"] is not None:
+                self.record_metric(f"llm_cost_{scope}", call["cost"])
+            # 缓存命中不耗时，不计入延迟
+            if not call["cached"]:
+                self.record_metric(f"llm_latency_{scope}", call["latency_seconds"])
+        self.record_metric(f"llm_retries_agent_{agent}", call["retries"])
+        self.record_metric(f"llm_rate_limited_agent_{agent}", call["rate_limited"])
+        self.record_metric(f"llm_fallback_agent_{agent}", int(call["fallback"]))
+        self.record_metric(f"llm_cached_agent_{agent}", int(call["cached"]))
+
     def record_agent_performance(self, agent_id: str, metrics: Dict[str, float]) -> None:
         """记录代理性能指标"""
         for name, value in metrics.items():
@@ -4,9 +4,11 @@ from langchain_core.messages import HumanMessage
 from langgraph.graph import END, StateGraph
 
 from src.agents.portfolio_manager import portfolio_management_agent
-from src.agents.risk_manager import risk_management_agent
+from src.llm.usage import LLMUsage
+from src.agents.risk_manager import risk_management_agent, DATA_REQUIREMENTS as RISK_MANAGEMENT_DATA_REQUIREMENTS
 from src.main import start
-from src.utils.analysts import ANALYST_CONFIG
+from src.tools.prefetch import create_prefetch_node
+from src.utils.analysts import ANALYST_CONFIG, get_analyst_data_requirements
 from src.graph.state import AgentState
 
 
@@ -22,11 +24,16 @@ def create_graph(selected_agents: list[str]) -> StateGraph:
     # Get analyst nodes from the configuration
     analyst_nodes = {key: (f"{key}_agent", config["agent_func"]) for key, config in ANALYST_CONFIG.items()}
 
+    # Fetch the data all selected agents need in one concurrent pass before they run
+    requirements = get_analyst_data_requirements(selected_agents) + [RISK_MANAGEMENT_DATA_REQUIREMENTS]
+    graph.add_node("data_prefetch", create_prefetch_node(requirements))
+    graph.add_edge("start_node", "data_prefetch")
+
     # Add selected analyst nodes
     for agent_name in selected_agents:
         node_name, node_func = analyst_nodes[agent_name]
         graph.add_node(node_name, node_func)
-        graph.add_edge("start_node", node_name)
+        graph.add_edge("data_prefetch", node_name)
 
     # Always add risk and portfolio management (for now)
     graph.add_node("risk_management_agent", risk_management_agent)
@@ -91,6 +98,7 @@ def run_graph(
                 "model_name": model_name,
                 "model_provider": model_provider,
                 "request": request,  # Pass the request for agent-specific model access
+                "llm_usage": LLMUsage(),  # Per-run LLM token, cost and latency totals
             },
         },
     )
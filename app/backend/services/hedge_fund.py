@@ -5,13 +5,7 @@ from datetime import datetime, timedelta
 from ..utils.errors import ValidationError, ServiceError
 from ..models.portfolio import Portfolio
 from ..models.agent import Agent
-from src.tools.api import (
-    get_prices,
-    get_financial_metrics,
-    get_market_cap,
-    get_insider_trades,
-    get_company_news
-)
+from src.tools.async_api import fetch_many
 
 logger = logging.getLogger(__name__)
 
@@ -146,38 +140,26 @@ class HedgeFundService:
             end_date_str = end_date.strftime("%Y-%m-%d")
             start_date_str = start_date.strftime("%Y-%m-%d")
 
+            # 并发获取所有股票的价格、财务指标、市值、内部交易和新闻
+            fetched = await fetch_many(
+                tickers,
+                end_date=end_date_str,
+                start_date=start_date_str,
+                metrics_period="ttm",
+                metrics_limit=4,
+            )
+
             market_data = {}
-            for ticker in tickers:
-                # 获取价格数据
-                prices = get_prices(ticker, start_date_str, end_date_str)
-                
-                # 获取财务指标
-                metrics = get_financial_metrics(ticker, end_date_str, period="ttm", limit=4)
-                
-                # 获取市值
-                market_cap = get_market_cap(ticker, end_date_str)
-                
-                # 获取内部交易数据
-                insider_trades = get_insider_trades(
-                    ticker, 
-                    end_date=end_date_str, 
-                    start_date=start_date_str
-                )
-                
-                # 获取公司新闻
-                news = get_company_news(
-                    ticker, 
-                    end_date=end_date_str, 
-                    start_date=start_date_str
-                )
+            for ticker, data in fetched.items():
+                metrics = data["financial_metrics"]
 
                 # 整合数据
                 market_data[ticker] = {
-                    "prices": [p.model_dump() for p in prices],
+                    "prices": [p.model_dump() for p in data["prices"]],
                     "metrics": [m.model_dump() for m in metrics] if metrics else [],
-                    "market_cap": market_cap,
-                    "insider_trades": [t.model_dump() for t in insider_trades],
-                    "news": [n.model_dump() for n in news],
+                    "market_cap": data["market_cap"],
+                    "insider_trades": [t.model_dump() for t in data["insider_trades"]],
+                    "news": [n.model_dump() for n in data["company_news"]],
                     "last_update": end_date.isoformat()
                 }
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+from functools import partial
+from typing import Awaitable, Callable
 from typing_extensions import Literal
 from pydantic import BaseModel
 
@@ -8,12 +10,13 @@ from src.graph.state import AgentState, show_agent_reasoning
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 
+from src.data.requirements import DataRequirements, FinancialMetricsRequirement, LineItemsRequirement
 from src.tools.api import (
     get_financial_metrics,
     get_market_cap,
     search_line_items,
 )
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm, call_llm_batch
 from src.utils.progress import progress
 
 
@@ -23,6 +26,24 @@ class AswathDamodaranSignal(BaseModel):
     reasoning: str
 
 
+LINE_ITEMS = [
+    "free_cash_flow",
+    "ebit",
+    "interest_expense",
+    "capital_expenditure",
+    "depreciation_and_amortization",
+    "outstanding_shares",
+    "net_income",
+    "total_debt",
+]
+
+DATA_REQUIREMENTS = DataRequirements(
+    financial_metrics=[FinancialMetricsRequirement(period="ttm", limit=5)],
+    line_items=[LineItemsRequirement(line_items=LINE_ITEMS, period="ttm", limit=10)],
+    market_cap=True,
+)
+
+
 def aswath_damodaran_agent(state: AgentState):
     """
     Analyze US equities through Aswath Damodaran's intrinsic-value lens:
@@ -38,6 +59,7 @@ def aswath_damodaran_agent(state: AgentState):
 
     analysis_data: dict[str, dict] = {}
     damodaran_signals: dict[str, dict] = {}
+    llm_calls: dict[str, Callable[[], Awaitable]] = {}
 
     for ticker in tickers:
         # ─── Fetch core data ────────────────────────────────────────────────────
@@ -47,16 +69,7 @@ def aswath_damodaran_agent(state: AgentState):
         progress.update_status("aswath_damodaran_agent", ticker, "Fetching financial line items")
         line_items = search_line_items(
             ticker,
-            [
-                "free_cash_flow",
-                "ebit",
-                "interest_expense",
-                "capital_expenditure",
-                "depreciation_and_amortization",
-                "outstanding_shares",
-                "net_income",
-                "total_debt",
-            ],
+            LINE_ITEMS,
             end_date,
         )
 
@@ -113,12 +126,14 @@ def aswath_damodaran_agent(state: AgentState):
 
         # ─── LLM: craft Damodaran-style narrative ──────────────────────────────
         progress.update_status("aswath_damodaran_agent", ticker, "Generating Damodaran analysis")
-        damodaran_output = generate_damodaran_output(
+        llm_calls[ticker] = generate_damodaran_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
         )
 
+    # The LLM calls of all tickers run concurrently
+    for ticker, damodaran_output in call_llm_batch(llm_calls).items():
         damodaran_signals[ticker] = damodaran_output.model_dump()
 
         progress.update_status("aswath_damodaran_agent", ticker, "Done", analysis=damodaran_output.reasoning)
@@ -360,7 +375,7 @@ def generate_damodaran_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
-) -> AswathDamodaranSignal:
+) -> Callable[[], Awaitable[AswathDamodaranSignal]]:
     """
     Ask the LLM to channel Prof. Damodaran's analytical style:
       • Story → Numbers → Value narrative
@@ -407,10 +422,12 @@ def generate_damodaran_output(
             reasoning="Parsing error; defaulting to neutral",
         )
 
-    return call_llm(
+    return partial(
+        acall_llm,
         prompt=prompt,
         pydantic_model=AswathDamodaranSignal,
         agent_name="aswath_damodaran_agent",
         state=state,
         default_factory=default_signal,
+        ticker=ticker,
     )
@@ -1,12 +1,15 @@
 from src.graph.state import AgentState, show_agent_reasoning
+from src.data.requirements import DataRequirements, FinancialMetricsRequirement, LineItemsRequirement
 from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
+from functools import partial
+from typing import Awaitable, Callable
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm, call_llm_batch
 import math
 
 
@@ -16,6 +19,26 @@ class BenGrahamSignal(BaseModel):
     reasoning: str
 
 
+LINE_ITEMS = [
+    "earnings_per_share",
+    "revenue",
+    "net_income",
+    "book_value_per_share",
+    "total_assets",
+    "total_liabilities",
+    "current_assets",
+    "current_liabilities",
+    "dividends_and_other_cash_distributions",
+    "outstanding_shares",
+]
+
+DATA_REQUIREMENTS = DataRequirements(
+    financial_metrics=[FinancialMetricsRequirement(period="annual", limit=10)],
+    line_items=[LineItemsRequirement(line_items=LINE_ITEMS, period="annual", limit=10)],
+    market_cap=True,
+)
+
+
 def ben_graham_agent(state: AgentState):
     """
     Analyzes stocks using Benjamin Graham's classic value-investing principles:
@@ -30,13 +53,14 @@ def ben_graham_agent(state: AgentState):
 
     analysis_data = {}
     graham_analysis = {}
+    llm_calls = {}
 
     for ticker in tickers:
         progress.update_status("ben_graham_agent", ticker, "Fetching financial metrics")
         metrics = get_financial_metrics(ticker, end_date, period="annual", limit=10)
 
         progress.update_status("ben_graham_agent", ticker, "Gathering financial line items")
-        financial_line_items = search_line_items(ticker, ["earnings_per_share", "revenue", "net_income", "book_value_per_share", "total_assets", "total_liabilities", "current_assets", "current_liabilities", "dividends_and_other_cash_distributions", "outstanding_shares"], end_date, period="annual", limit=10)
+        financial_line_items = search_line_items(ticker, LINE_ITEMS, end_date, period="annual", limit=10)
 
         progress.update_status("ben_graham_agent", ticker, "Getting market cap")
         market_cap = get_market_cap(ticker, end_date)
@@ -66,12 +90,14 @@ def ben_graham_agent(state: AgentState):
         analysis_data[ticker] = {"signal": signal, "score": total_score, "max_score": max_possible_score, "earnings_analysis": earnings_analysis, "strength_analysis": strength_analysis, "valuation_analysis": valuation_analysis}
 
         progress.update_status("ben_graham_agent", ticker, "Generating Ben Graham analysis")
-        graham_output = generate_graham_output(
+        llm_calls[ticker] = generate_graham_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
         )
 
+    # The LLM calls of all tickers run concurrently
+    for ticker, graham_output in call_llm_batch(llm_calls).items():
         graham_analysis[ticker] = {"signal": graham_output.signal, "confidence": graham_output.confidence, "reasoning": graham_output.reasoning}
 
         progress.update_status("ben_graham_agent", ticker, "Done", analysis=graham_output.reasoning)
@@ -280,7 +306,7 @@ def generate_graham_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
-) -> BenGrahamSignal:
+) -> Callable[[], Awaitable[BenGrahamSignal]]:
     """
     Generates an investment decision in the style of Benjamin Graham:
     - Value emphasis, margin of safety, net-nets, conservative balance sheet, stable earnings.
@@ -335,10 +361,12 @@ def generate_graham_output(
     def create_default_ben_graham_signal():
         return BenGrahamSignal(signal="neutral", confidence=0.0, reasoning="Error in generating analysis; defaulting to neutral.")
 
-    return call_llm(
+    return partial(
+        acall_llm,
         prompt=prompt,
         pydantic_model=BenGrahamSignal,
         agent_name="ben_graham_agent",
         state=state,
         default_factory=create_default_ben_graham_signal,
+        ticker=ticker,
     )
@@ -1,13 +1,16 @@
 from langchain_openai import ChatOpenAI
 from src.graph.state import AgentState, show_agent_reasoning
+from src.data.requirements import DataRequirements, FinancialMetricsRequirement, LineItemsRequirement
 from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
+from functools import partial
+from typing import Awaitable, Callable
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm, call_llm_batch
 
 
 class BillAckmanSignal(BaseModel):
@@ -16,6 +19,26 @@ class BillAckmanSignal(BaseModel):
     reasoning: str
 
 
+LINE_ITEMS = [
+    "revenue",
+    "operating_margin",
+    "debt_to_equity",
+    "free_cash_flow",
+    "total_assets",
+    "total_liabilities",
+    "dividends_and_other_cash_distributions",
+    "outstanding_shares",
+    # Optional: intangible_assets if available
+    # "intangible_assets"
+]
+
+DATA_REQUIREMENTS = DataRequirements(
+    financial_metrics=[FinancialMetricsRequirement(period="annual", limit=5)],
+    line_items=[LineItemsRequirement(line_items=LINE_ITEMS, period="annual", limit=5)],
+    market_cap=True,
+)
+
+
 def bill_ackman_agent(state: AgentState):
     """
     Analyzes stocks using Bill Ackman's investing principles and LLM reasoning.
@@ -28,6 +51,7 @@ def bill_ackman_agent(state: AgentState):
     
     analysis_data = {}
     ackman_analysis = {}
+    llm_calls = {}
     
     for ticker in tickers:
         progress.update_status("bill_ackman_agent", ticker, "Fetching financial metrics")
@@ -37,18 +61,7 @@ def bill_ackman_agent(state: AgentState):
         # Request multiple periods of data (annual or TTM) for a more robust long-term view.
         financial_line_items = search_line_items(
             ticker,
-            [
-                "revenue",
-                "operating_margin",
-                "debt_to_equity",
-                "free_cash_flow",
-                "total_assets",
-                "total_liabilities",
-                "dividends_and_other_cash_distributions",
-                "outstanding_shares",
-                # Optional: intangible_assets if available
-                # "intangible_assets"
-            ],
+            LINE_ITEMS,
             end_date,
             period="annual",
             limit=5
@@ -97,12 +110,14 @@ def bill_ackman_agent(state: AgentState):
         }
         
         progress.update_status("bill_ackman_agent", ticker, "Generating Bill Ackman analysis")
-        ackman_output = generate_ackman_output(
+        llm_calls[ticker] = generate_ackman_output(
             ticker=ticker, 
             analysis_data=analysis_data,
             state=state,
         )
-        
+
+    # The LLM calls of all tickers run concurrently
+    for ticker, ackman_output in call_llm_batch(llm_calls).items():
         ackman_analysis[ticker] = {
             "signal": ackman_output.signal,
             "confidence": ackman_output.confidence,
@@ -398,7 +413,7 @@ def generate_ackman_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
-) -> BillAckmanSignal:
+) -> Callable[[], Awaitable[BillAckmanSignal]]:
     """
     Generates investment decisions in the style of Bill Ackman.
     Includes more explicit references to brand strength, activism potential, 
@@ -456,10 +471,12 @@ def generate_ackman_output(
             reasoning="Error in analysis, defaulting to neutral"
         )
 
-    return call_llm(
+    return partial(
+        acall_llm,
         prompt=prompt, 
         pydantic_model=BillAckmanSignal, 
         agent_name="bill_ackman_agent", 
         state=state,
         default_factory=create_default_bill_ackman_signal,
+        ticker=ticker,
     )
@@ -1,12 +1,15 @@
 from src.graph.state import AgentState, show_agent_reasoning
+from src.data.requirements import DataRequirements, FinancialMetricsRequirement, LineItemsRequirement
 from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
+from functools import partial
+from typing import Awaitable, Callable
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm, call_llm_batch
 
 
 class CathieWoodSignal(BaseModel):
@@ -15,6 +18,28 @@ class CathieWoodSignal(BaseModel):
     reasoning: str
 
 
+LINE_ITEMS = [
+    "revenue",
+    "gross_margin",
+    "operating_margin",
+    "debt_to_equity",
+    "free_cash_flow",
+    "total_assets",
+    "total_liabilities",
+    "dividends_and_other_cash_distributions",
+    "outstanding_shares",
+    "research_and_development",
+    "capital_expenditure",
+    "operating_expense",
+]
+
+DATA_REQUIREMENTS = DataRequirements(
+    financial_metrics=[FinancialMetricsRequirement(period="annual", limit=5)],
+    line_items=[LineItemsRequirement(line_items=LINE_ITEMS, period="annual", limit=5)],
+    market_cap=True,
+)
+
+
 def cathie_wood_agent(state: AgentState):
     """
     Analyzes stocks using Cathie Wood's investing principles and LLM reasoning.
@@ -29,6 +54,7 @@ def cathie_wood_agent(state: AgentState):
 
     analysis_data = {}
     cw_analysis = {}
+    llm_calls = {}
 
     for ticker in tickers:
         progress.update_status("cathie_wood_agent", ticker, "Fetching financial metrics")
@@ -38,20 +64,7 @@ def cathie_wood_agent(state: AgentState):
         # Request multiple periods of data (annual or TTM) for a more robust view.
         financial_line_items = search_line_items(
             ticker,
-            [
-                "revenue",
-                "gross_margin",
-                "operating_margin",
-                "debt_to_equity",
-                "free_cash_flow",
-                "total_assets",
-                "total_liabilities",
-                "dividends_and_other_cash_distributions",
-                "outstanding_shares",
-                "research_and_development",
-                "capital_expenditure",
-                "operating_expense",
-            ],
+            LINE_ITEMS,
             end_date,
             period="annual",
             limit=5,
@@ -83,12 +96,14 @@ def cathie_wood_agent(state: AgentState):
         analysis_data[ticker] = {"signal": signal, "score": total_score, "max_score": max_possible_score, "disruptive_analysis": disruptive_analysis, "innovation_analysis": innovation_analysis, "valuation_analysis": valuation_analysis}
 
         progress.update_status("cathie_wood_agent", ticker, "Generating Cathie Wood analysis")
-        cw_output = generate_cathie_wood_output(
+        llm_calls[ticker] = generate_cathie_wood_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
         )
 
+    # The LLM calls of all tickers run concurrently
+    for ticker, cw_output in call_llm_batch(llm_calls).items():
         cw_analysis[ticker] = {"signal": cw_output.signal, "confidence": cw_output.confidence, "reasoning": cw_output.reasoning}
 
         progress.update_status("cathie_wood_agent", ticker, "Done", analysis=cw_output.reasoning)
@@ -361,7 +376,7 @@ def generate_cathie_wood_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
-) -> CathieWoodSignal:
+) -> Callable[[], Awaitable[CathieWoodSignal]]:
     """
     Generates investment decisions in the style of Cathie Wood.
     """
@@ -420,12 +435,14 @@ def generate_cathie_wood_output(
     def create_default_cathie_wood_signal():
         return CathieWoodSignal(signal="neutral", confidence=0.0, reasoning="Error in analysis, defaulting to neutral")
 
-    return call_llm(
+    return partial(
+        acall_llm,
         prompt=prompt,
         pydantic_model=CathieWoodSignal,
         agent_name="cathie_wood_agent",
         state=state,
         default_factory=create_default_cathie_wood_signal,
+        ticker=ticker,
     )
 
 
@@ -1,12 +1,15 @@
 from src.graph.state import AgentState, show_agent_reasoning
+from src.data.requirements import DataRequirements, EventsRequirement, FinancialMetricsRequirement, LineItemsRequirement
 from src.tools.api import get_financial_metrics, get_market_cap, search_line_items, get_insider_trades, get_company_news
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
+from functools import partial
+from typing import Awaitable, Callable
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm, call_llm_batch
 
 class CharlieMungerSignal(BaseModel):
     signal: Literal["bullish", "bearish", "neutral"]
@@ -14,6 +17,32 @@ class CharlieMungerSignal(BaseModel):
     reasoning: str
 
 
+LINE_ITEMS = [
+    "revenue",
+    "net_income",
+    "operating_income",
+    "return_on_invested_capital",
+    "gross_margin",
+    "operating_margin",
+    "free_cash_flow",
+    "capital_expenditure",
+    "cash_and_equivalents",
+    "total_debt",
+    "shareholders_equity",
+    "outstanding_shares",
+    "research_and_development",
+    "goodwill_and_intangible_assets",
+]
+
+DATA_REQUIREMENTS = DataRequirements(
+    financial_metrics=[FinancialMetricsRequirement(period="annual", limit=10)],
+    line_items=[LineItemsRequirement(line_items=LINE_ITEMS, period="annual", limit=10)],
+    market_cap=True,
+    insider_trades=[EventsRequirement(limit=100)],
+    company_news=[EventsRequirement(limit=100)],
+)
+
+
 def charlie_munger_agent(state: AgentState):
     """
     Analyzes stocks using Charlie Munger's investing principles and mental models.
@@ -25,6 +54,7 @@ def charlie_munger_agent(state: AgentState):
     
     analysis_data = {}
     munger_analysis = {}
+    llm_calls = {}
     
     for ticker in tickers:
         progress.update_status("charlie_munger_agent", ticker, "Fetching financial metrics")
@@ -33,22 +63,7 @@ def charlie_munger_agent(state: AgentState):
         progress.update_status("charlie_munger_agent", ticker, "Gathering financial line items")
         financial_line_items = search_line_items(
             ticker,
-            [
-                "revenue",
-                "net_income",
-                "operating_income",
-                "return_on_invested_capital",
-                "gross_margin",
-                "operating_margin",
-                "free_cash_flow",
-                "capital_expenditure",
-                "cash_and_equivalents",
-                "total_debt",
-                "shareholders_equity",
-                "outstanding_shares",
-                "research_and_development",
-                "goodwill_and_intangible_assets",
-            ],
+            LINE_ITEMS,
             end_date,
             period="annual",
             limit=10  # Munger examines long-term trends
@@ -121,12 +136,14 @@ def charlie_munger_agent(state: AgentState):
         }
         
         progress.update_status("charlie_munger_agent", ticker, "Generating Charlie Munger analysis")
-        munger_output = generate_munger_output(
+        llm_calls[ticker] = generate_munger_output(
             ticker=ticker, 
             analysis_data=analysis_data,
             state=state,
         )
-        
+
+    # The LLM calls of all tickers run concurrently
+    for ticker, munger_output in call_llm_batch(llm_calls).items():
         munger_analysis[ticker] = {
             "signal": munger_output.signal,
             "confidence": munger_output.confidence,
@@ -677,7 +694,7 @@ def generate_munger_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
-) -> CharlieMungerSignal:
+) -> Callable[[], Awaitable[CharlieMungerSignal]]:
     """
     Generates investment decisions in the style of Charlie Munger.
     """
@@ -747,10 +764,12 @@ def generate_munger_output(
             reasoning="Error in analysis, defaulting to neutral"
         )
 
-    return call_llm(
+    return partial(
+        acall_llm,
         prompt=prompt,
         state=state,
         pydantic_model=CharlieMungerSignal, 
         agent_name="charlie_munger_agent", 
         default_factory=create_default_charlie_munger_signal,
+        ticker=ticker,
     )
\ No newline at end of file
@@ -3,8 +3,13 @@ from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
 import json
 
+from src.data.requirements import DataRequirements, FinancialMetricsRequirement
 from src.tools.api import get_financial_metrics
 
+DATA_REQUIREMENTS = DataRequirements(
+    financial_metrics=[FinancialMetricsRequirement(period="ttm", limit=10)],
+)
+
 
 ##### Fundamental Agent #####
 def fundamentals_analyst_agent(state: AgentState):
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 import json
+from functools import partial
+from typing import Awaitable, Callable
 from typing_extensions import Literal
 
 from src.graph.state import AgentState, show_agent_reasoning
@@ -9,6 +11,7 @@ from langchain_core.messages import HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel
 
+from src.data.requirements import DataRequirements, EventsRequirement, FinancialMetricsRequirement, LineItemsRequirement
 from src.tools.api import (
     get_company_news,
     get_financial_metrics,
@@ -16,7 +19,7 @@ from src.tools.api import (
     get_market_cap,
     search_line_items,
 )
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm, call_llm_batch
 from src.utils.progress import progress
 
 __all__ = [
@@ -42,6 +45,26 @@ class MichaelBurrySignal(BaseModel):
 ###############################################################################
 
 
+LINE_ITEMS = [
+    "free_cash_flow",
+    "net_income",
+    "total_debt",
+    "cash_and_equivalents",
+    "total_assets",
+    "total_liabilities",
+    "outstanding_shares",
+    "issuance_or_purchase_of_equity_shares",
+]
+
+DATA_REQUIREMENTS = DataRequirements(
+    financial_metrics=[FinancialMetricsRequirement(period="ttm", limit=5)],
+    line_items=[LineItemsRequirement(line_items=LINE_ITEMS, period="ttm", limit=10)],
+    market_cap=True,
+    insider_trades=[EventsRequirement(limit=1000, lookback_days=365)],
+    company_news=[EventsRequirement(limit=250, lookback_days=365)],
+)
+
+
 def michael_burry_agent(state: AgentState):  # noqa: C901  (complexity is fine here)
     """Analyse stocks using Michael Burry's deep‑value, contrarian framework."""
 
@@ -54,6 +77,7 @@ def michael_burry_agent(state: AgentState):  # noqa: C901  (complexity is fine h
 
     analysis_data: dict[str, dict] = {}
     burry_analysis: dict[str, dict] = {}
+    llm_calls: dict[str, Callable[[], Awaitable]] = {}
 
     for ticker in tickers:
         # ------------------------------------------------------------------
@@ -65,16 +89,7 @@ def michael_burry_agent(state: AgentState):  # noqa: C901  (complexity is fine h
         progress.update_status("michael_burry_agent", ticker, "Fetching line items")
         line_items = search_line_items(
             ticker,
-            [
-                "free_cash_flow",
-                "net_income",
-                "total_debt",
-                "cash_and_equivalents",
-                "total_assets",
-                "total_liabilities",
-                "outstanding_shares",
-                "issuance_or_purchase_of_equity_shares",
-            ],
+            LINE_ITEMS,
             end_date,
         )
 
@@ -140,12 +155,14 @@ def michael_burry_agent(state: AgentState):  # noqa: C901  (complexity is fine h
         }
 
         progress.update_status("michael_burry_agent", ticker, "Generating LLM output")
-        burry_output = _generate_burry_output(
+        llm_calls[ticker] = _generate_burry_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
         )
 
+    # The LLM calls of all tickers run concurrently
+    for ticker, burry_output in call_llm_batch(llm_calls).items():
         burry_analysis[ticker] = {
             "signal": burry_output.signal,
             "confidence": burry_output.confidence,
@@ -328,7 +345,7 @@ def _generate_burry_output(
     ticker: str,
     analysis_data: dict,
     state: AgentState,
-) -> MichaelBurrySignal:
+) -> Callable[[], Awaitable[MichaelBurrySignal]]:
     """Call the LLM to craft the final trading signal in Burry's voice."""
 
     template = ChatPromptTemplate.from_messages(
@@ -377,10 +394,12 @@ def _generate_burry_output(
     def create_default_michael_burry_signal():
         return MichaelBurrySignal(signal="neutral", confidence=0.0, reasoning="Parsing error – defaulting to neutral")
 
-    return call_llm(
+    return partial(
+        acall_llm,
         prompt=prompt,
         pydantic_model=MichaelBurrySignal,
         agent_name="michael_burry_agent",
         state=state,
         default_factory=create_default_michael_burry_signal,
+        ticker=ticker,
     )
@@ -1,4 +1,5 @@
 from src.graph.state import AgentState, show_agent_reasoning
+from src.data.requirements import DataRequirements, EventsRequirement, FinancialMetricsRequirement, LineItemsRequirement
 from src.tools.api import (
     get_financial_metrics,
     get_market_cap,
@@ -11,9 +12,11 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
+from functools import partial
+from typing import Awaitable, Callable
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm, call_llm_batch
 
 
 class PeterLynchSignal(BaseModel):
@@ -25,6 +28,31 @@ class PeterLynchSignal(BaseModel):
     reasoning: str
 
 
+LINE_ITEMS = [
+    "revenue",
+    "earnings_per_share",
+    "net_income",
+    "operating_income",
+    "gross_margin",
+    "operating_margin",
+    "free_cash_flow",
+    "capital_expenditure",
+    "cash_and_equivalents",
+    "total_debt",
+    "shareholders_equity",
+    "outstanding_shares",
+]
+
+DATA_REQUIREMENTS = DataRequirements(
+    financial_metrics=[FinancialMetricsRequirement(period="annual", limit=5)],
+    line_items=[LineItemsRequirement(line_items=LINE_ITEMS, period="annual", limit=5)],
+    market_cap=True,
+    insider_trades=[EventsRequirement(limit=50)],
+    company_news=[EventsRequirement(limit=50)],
+    prices=True,
+)
+
+
 def peter_lynch_agent(state: AgentState):
     """
     Analyzes stocks using Peter Lynch's investing principles:
@@ -47,6 +75,7 @@ def peter_lynch_agent(state: AgentState):
 
     analysis_data = {}
     lynch_analysis = {}
+    llm_calls = {}
 
     for ticker in tickers:
         progress.update_status("peter_lynch_agent", ticker, "Fetching financial metrics")
@@ -56,20 +85,7 @@ def peter_lynch_agent(state: AgentState):
         # Relevant line items for Peter Lynch's approach
         financial_line_items = search_line_items(
             ticker,
-            [
-                "revenue",
-                "earnings_per_share",
-                "net_income",
-                "operating_income",
-                "gross_margin",
-                "operating_margin",
-                "free_cash_flow",
-                "capital_expenditure",
-                "cash_and_equivalents",
-                "total_debt",
-                "shareholders_equity",
-                "outstanding_shares",
-            ],
+            LINE_ITEMS,
             end_date,
             period="annual",
             limit=5,
@@ -136,12 +152,14 @@ def peter_lynch_agent(state: AgentState):
         }
 
         progress.update_status("peter_lynch_agent", ticker, "Generating Peter Lynch analysis")
-        lynch_output = generate_lynch_output(
+        llm_calls[ticker] = generate_lynch_output(
             ticker=ticker,
             analysis_data=analysis_data[ticker],
             state=state,
         )
 
+    # The LLM calls of all tickers run concurrently
+    for ticker, lynch_output in call_llm_batch(llm_calls).items():
         lynch_analysis[ticker] = {
             "signal": lynch_output.signal,
             "confidence": lynch_output.confidence,
@@ -441,7 +459,7 @@ def generate_lynch_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
-) -> PeterLynchSignal:
+) -> Callable[[], Awaitable[PeterLynchSignal]]:
     """
     Generates a final JSON signal in Peter Lynch's voice & style.
     """
@@ -496,10 +514,12 @@ def generate_lynch_output(
             reasoning="Error in analysis; defaulting to neutral"
         )
 
-    return call_llm(
+    return partial(
+        acall_llm,
         prompt=prompt,
         pydantic_model=PeterLynchSignal,
         agent_name="peter_lynch_agent",
         state=state,
         default_factory=create_default_signal,
+        ticker=ticker,
     )
@@ -1,4 +1,5 @@
 from src.graph.state import AgentState, show_agent_reasoning
+from src.data.requirements import DataRequirements, EventsRequirement, FinancialMetricsRequirement, LineItemsRequirement
 from src.tools.api import (
     get_financial_metrics,
     get_market_cap,
@@ -10,9 +11,11 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
+from functools import partial
+from typing import Awaitable, Callable
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm, call_llm_batch
 import statistics
 
 
@@ -22,6 +25,31 @@ class PhilFisherSignal(BaseModel):
     reasoning: str
 
 
+LINE_ITEMS = [
+    "revenue",
+    "net_income",
+    "earnings_per_share",
+    "free_cash_flow",
+    "research_and_development",
+    "operating_income",
+    "operating_margin",
+    "gross_margin",
+    "total_debt",
+    "shareholders_equity",
+    "cash_and_equivalents",
+    "ebit",
+    "ebitda",
+]
+
+DATA_REQUIREMENTS = DataRequirements(
+    financial_metrics=[FinancialMetricsRequirement(period="annual", limit=5)],
+    line_items=[LineItemsRequirement(line_items=LINE_ITEMS, period="annual", limit=5)],
+    market_cap=True,
+    insider_trades=[EventsRequirement(limit=50)],
+    company_news=[EventsRequirement(limit=50)],
+)
+
+
 def phil_fisher_agent(state: AgentState):
     """
     Analyzes stocks using Phil Fisher's investing principles:
@@ -40,6 +68,7 @@ def phil_fisher_agent(state: AgentState):
 
     analysis_data = {}
     fisher_analysis = {}
+    llm_calls = {}
 
     for ticker in tickers:
         progress.update_status("phil_fisher_agent", ticker, "Fetching financial metrics")
@@ -53,21 +82,7 @@ def phil_fisher_agent(state: AgentState):
         #   - Valuation: net_income, free_cash_flow (for P/E, P/FCF), ebit, ebitda
         financial_line_items = search_line_items(
             ticker,
-            [
-                "revenue",
-                "net_income",
-                "earnings_per_share",
-                "free_cash_flow",
-                "research_and_development",
-                "operating_income",
-                "operating_margin",
-                "gross_margin",
-                "total_debt",
-                "shareholders_equity",
-                "cash_and_equivalents",
-                "ebit",
-                "ebitda",
-            ],
+            LINE_ITEMS,
             end_date,
             period="annual",
             limit=5,
@@ -139,12 +154,14 @@ def phil_fisher_agent(state: AgentState):
         }
 
         progress.update_status("phil_fisher_agent", ticker, "Generating Phil Fisher-style analysis")
-        fisher_output = generate_fisher_output(
+        llm_calls[ticker] = generate_fisher_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
         )
 
+    # The LLM calls of all tickers run concurrently
+    for ticker, fisher_output in call_llm_batch(llm_calls).items():
         fisher_analysis[ticker] = {
             "signal": fisher_output.signal,
             "confidence": fisher_output.confidence,
@@ -530,7 +547,7 @@ def generate_fisher_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
-) -> PhilFisherSignal:
+) -> Callable[[], Awaitable[PhilFisherSignal]]:
     """
     Generates a JSON signal in the style of Phil Fisher.
     """
@@ -591,10 +608,12 @@ def generate_fisher_output(
             reasoning="Error in analysis, defaulting to neutral"
         )
 
-    return call_llm(
+    return partial(
+        acall_llm,
         prompt=prompt,
         pydantic_model=PhilFisherSignal,
         state=state,
         agent_name="phil_fisher_agent",
         default_factory=create_default_signal,
+        ticker=ticker,
     )
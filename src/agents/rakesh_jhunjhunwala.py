@@ -3,9 +3,12 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
+from functools import partial
+from typing import Awaitable, Callable
 from typing_extensions import Literal
+from src.data.requirements import DataRequirements, FinancialMetricsRequirement, LineItemsRequirement
 from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm, call_llm_batch
 from src.utils.progress import progress
 
 class RakeshJhunjhunwalaSignal(BaseModel):
@@ -13,6 +16,30 @@ class RakeshJhunjhunwalaSignal(BaseModel):
     confidence: float
     reasoning: str
 
+
+LINE_ITEMS = [
+    "net_income",
+    "earnings_per_share",
+    "ebit",
+    "operating_income",
+    "revenue",
+    "operating_margin",
+    "total_assets",
+    "total_liabilities",
+    "current_assets",
+    "current_liabilities",
+    "free_cash_flow",
+    "dividends_and_other_cash_distributions",
+    "issuance_or_purchase_of_equity_shares",
+]
+
+DATA_REQUIREMENTS = DataRequirements(
+    financial_metrics=[FinancialMetricsRequirement(period="ttm", limit=5)],
+    line_items=[LineItemsRequirement(line_items=LINE_ITEMS, period="ttm", limit=10)],
+    market_cap=True,
+)
+
+
 def rakesh_jhunjhunwala_agent(state: AgentState):
     """Analyzes stocks using Rakesh Jhunjhunwala's principles and LLM reasoning."""
     data = state["data"]
@@ -22,6 +49,7 @@ def rakesh_jhunjhunwala_agent(state: AgentState):
     # Collect all analysis for LLM reasoning
     analysis_data = {}
     jhunjhunwala_analysis = {}
+    llm_calls = {}
 
     for ticker in tickers:
 
@@ -32,21 +60,7 @@ def rakesh_jhunjhunwala_agent(state: AgentState):
         progress.update_status("rakesh_jhunjhunwala_agent", ticker, "Fetching financial line items")
         financial_line_items = search_line_items(
             ticker,
-            [
-                "net_income",
-                "earnings_per_share",
-                "ebit",
-                "operating_income",
-                "revenue",
-                "operating_margin",
-                "total_assets",
-                "total_liabilities",
-                "current_assets",
-                "current_liabilities",
-                "free_cash_flow",
-                "dividends_and_other_cash_distributions",
-                "issuance_or_purchase_of_equity_shares"
-            ],
+            LINE_ITEMS,
             end_date,
         )
 
@@ -134,12 +148,14 @@ def rakesh_jhunjhunwala_agent(state: AgentState):
 
         # ─── LLM: craft Jhunjhunwala‑style narrative ──────────────────────────────
         progress.update_status("rakesh_jhunjhunwala_agent", ticker, "Generating Jhunjhunwala analysis")
-        jhunjhunwala_output = generate_jhunjhunwala_output(
+        llm_calls[ticker] = generate_jhunjhunwala_output(
             ticker=ticker,
             analysis_data=analysis_data[ticker],
             state=state,
         )
 
+    # The LLM calls of all tickers run concurrently
+    for ticker, jhunjhunwala_output in call_llm_batch(llm_calls).items():
         jhunjhunwala_analysis[ticker] = jhunjhunwala_output.model_dump()
 
         progress.update_status("rakesh_jhunjhunwala_agent", ticker, "Done", analysis=jhunjhunwala_output.reasoning)
@@ -642,7 +658,7 @@ def generate_jhunjhunwala_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
-) -> RakeshJhunjhunwalaSignal:
+) -> Callable[[], Awaitable[RakeshJhunjhunwalaSignal]]:
     """Get investment decision from LLM with Jhunjhunwala's principles"""
     template = ChatPromptTemplate.from_messages(
         [
@@ -695,10 +711,12 @@ def generate_jhunjhunwala_output(
     def create_default_rakesh_jhunjhunwala_signal():
         return RakeshJhunjhunwalaSignal(signal="neutral", confidence=0.0, reasoning="Error in analysis, defaulting to neutral")
 
-    return call_llm(
+    return partial(
+        acall_llm,
         prompt=prompt,
         pydantic_model=RakeshJhunjhunwalaSignal,
         state=state,
         agent_name="rakesh_jhunjhunwala_agent",
         default_factory=create_default_rakesh_jhunjhunwala_signal,
+        ticker=ticker,
     )
\ No newline at end of file
@@ -1,10 +1,16 @@
 from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
-from src.tools.api import get_prices, prices_to_df
+from src.data.requirements import DataRequirements
+from src.tools.api import get_price_data
 import json
 
 
+DATA_REQUIREMENTS = DataRequirements(
+    prices=True,
+)
+
+
 ##### Risk Management Agent #####
 def risk_management_agent(state: AgentState):
     """Controls position sizing based on real-world risk factors for multiple tickers."""
@@ -22,17 +28,15 @@ def risk_management_agent(state: AgentState):
     for ticker in all_tickers:
         progress.update_status("risk_management_agent", ticker, "Fetching price data")
         
-        prices = get_prices(
+        prices_df = get_price_data(
             ticker=ticker,
             start_date=data["start_date"],
             end_date=data["end_date"],
         )
 
-        if not prices:
+        if prices_df.empty:
             progress.update_status("risk_management_agent", ticker, "Warning: No price data found")
             continue
-
-        prices_df = prices_to_df(prices)
         
         if not prices_df.empty:
             current_price = prices_df["close"].iloc[-1]
@@ -5,9 +5,16 @@ import pandas as pd
 import numpy as np
 import json
 
+from src.data.requirements import DataRequirements, EventsRequirement
 from src.tools.api import get_insider_trades, get_company_news
 
 
+DATA_REQUIREMENTS = DataRequirements(
+    insider_trades=[EventsRequirement(limit=1000)],
+    company_news=[EventsRequirement(limit=100)],
+)
+
+
 ##### Sentiment Agent #####
 def sentiment_analyst_agent(state: AgentState):
     """Analyzes market sentiment and generates trading signals for multiple tickers."""
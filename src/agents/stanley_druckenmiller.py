@@ -1,4 +1,5 @@
 from src.graph.state import AgentState, show_agent_reasoning
+from src.data.requirements import DataRequirements, EventsRequirement, FinancialMetricsRequirement, LineItemsRequirement
 from src.tools.api import (
     get_financial_metrics,
     get_market_cap,
@@ -11,9 +12,11 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
+from functools import partial
+from typing import Awaitable, Callable
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm, call_llm_batch
 import statistics
 
 
@@ -23,6 +26,33 @@ class StanleyDruckenmillerSignal(BaseModel):
     reasoning: str
 
 
+LINE_ITEMS = [
+    "revenue",
+    "earnings_per_share",
+    "net_income",
+    "operating_income",
+    "gross_margin",
+    "operating_margin",
+    "free_cash_flow",
+    "capital_expenditure",
+    "cash_and_equivalents",
+    "total_debt",
+    "shareholders_equity",
+    "outstanding_shares",
+    "ebit",
+    "ebitda",
+]
+
+DATA_REQUIREMENTS = DataRequirements(
+    financial_metrics=[FinancialMetricsRequirement(period="annual", limit=5)],
+    line_items=[LineItemsRequirement(line_items=LINE_ITEMS, period="annual", limit=5)],
+    market_cap=True,
+    insider_trades=[EventsRequirement(limit=50)],
+    company_news=[EventsRequirement(limit=50)],
+    prices=True,
+)
+
+
 def stanley_druckenmiller_agent(state: AgentState):
     """
     Analyzes stocks using Stanley Druckenmiller's investing principles:
@@ -40,6 +70,7 @@ def stanley_druckenmiller_agent(state: AgentState):
 
     analysis_data = {}
     druck_analysis = {}
+    llm_calls = {}
 
     for ticker in tickers:
         progress.update_status("stanley_druckenmiller_agent", ticker, "Fetching financial metrics")
@@ -53,22 +84,7 @@ def stanley_druckenmiller_agent(state: AgentState):
         #   - Liquidity: cash_and_equivalents
         financial_line_items = search_line_items(
             ticker,
-            [
-                "revenue",
-                "earnings_per_share",
-                "net_income",
-                "operating_income",
-                "gross_margin",
-                "operating_margin",
-                "free_cash_flow",
-                "capital_expenditure",
-                "cash_and_equivalents",
-                "total_debt",
-                "shareholders_equity",
-                "outstanding_shares",
-                "ebit",
-                "ebitda",
-            ],
+            LINE_ITEMS,
             end_date,
             period="annual",
             limit=5,
@@ -134,12 +150,14 @@ def stanley_druckenmiller_agent(state: AgentState):
         }
 
         progress.update_status("stanley_druckenmiller_agent", ticker, "Generating Stanley Druckenmiller analysis")
-        druck_output = generate_druckenmiller_output(
+        llm_calls[ticker] = generate_druckenmiller_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
         )
 
+    # The LLM calls of all tickers run concurrently
+    for ticker, druck_output in call_llm_batch(llm_calls).items():
         druck_analysis[ticker] = {
             "signal": druck_output.signal,
             "confidence": druck_output.confidence,
@@ -524,7 +542,7 @@ def generate_druckenmiller_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
-) -> StanleyDruckenmillerSignal:
+) -> Callable[[], Awaitable[StanleyDruckenmillerSignal]]:
     """
     Generates a JSON signal in the style of Stanley Druckenmiller.
     """
@@ -586,10 +604,12 @@ def generate_druckenmiller_output(
             reasoning="Error in analysis, defaulting to neutral"
         )
 
-    return call_llm(
+    return partial(
+        acall_llm,
         prompt=prompt,
         pydantic_model=StanleyDruckenmillerSignal,
         agent_name="stanley_druckenmiller_agent",
         state=state,
         default_factory=create_default_signal,
+        ticker=ticker,
     )
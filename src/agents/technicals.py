@@ -8,7 +8,8 @@ import json
 import pandas as pd
 import numpy as np
 
-from src.tools.api import get_prices, prices_to_df
+from src.data.requirements import DataRequirements
+from src.tools.api import get_price_data
 from src.utils.progress import progress
 
 
@@ -31,6 +32,11 @@ def safe_float(value, default=0.0):
         return default
 
 
+DATA_REQUIREMENTS = DataRequirements(
+    prices=True,
+)
+
+
 ##### Technical Analyst #####
 def technical_analyst_agent(state: AgentState):
     """
@@ -53,19 +59,16 @@ def technical_analyst_agent(state: AgentState):
         progress.update_status("technical_analyst_agent", ticker, "Analyzing price data")
 
         # Get the historical price data
-        prices = get_prices(
+        prices_df = get_price_data(
             ticker=ticker,
             start_date=start_date,
             end_date=end_date,
         )
 
-        if not prices:
+        if prices_df.empty:
             progress.update_status("technical_analyst_agent", ticker, "Failed: No price data found")
             continue
 
-        # Convert prices to a DataFrame
-        prices_df = prices_to_df(prices)
-
         progress.update_status("technical_analyst_agent", ticker, "Calculating trend signals")
         trend_signals = calculate_trend_signals(prices_df)
 
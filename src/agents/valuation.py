@@ -12,12 +12,28 @@ from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
 
+from src.data.requirements import DataRequirements, FinancialMetricsRequirement, LineItemsRequirement
 from src.tools.api import (
     get_financial_metrics,
     get_market_cap,
     search_line_items,
 )
 
+LINE_ITEMS = [
+    "free_cash_flow",
+    "net_income",
+    "depreciation_and_amortization",
+    "capital_expenditure",
+    "working_capital",
+]
+
+DATA_REQUIREMENTS = DataRequirements(
+    financial_metrics=[FinancialMetricsRequirement(period="ttm", limit=8)],
+    line_items=[LineItemsRequirement(line_items=LINE_ITEMS, period="ttm", limit=2)],
+    market_cap=True,
+)
+
+
 def valuation_analyst_agent(state: AgentState):
     """Run valuation across tickers and write signals back to `state`."""
 
@@ -46,13 +62,7 @@ def valuation_analyst_agent(state: AgentState):
         progress.update_status("valuation_analyst_agent", ticker, "Gathering line items")
         line_items = search_line_items(
             ticker=ticker,
-            line_items=[
-                "free_cash_flow",
-                "net_income",
-                "depreciation_and_amortization",
-                "capital_expenditure",
-                "working_capital",
-            ],
+            line_items=LINE_ITEMS,
             end_date=end_date,
             period="ttm",
             limit=2,
@@ -3,9 +3,12 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
+from functools import partial
+from typing import Awaitable, Callable
 from typing_extensions import Literal
+from src.data.requirements import DataRequirements, FinancialMetricsRequirement, LineItemsRequirement
 from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm, call_llm_batch
 from src.utils.progress import progress
 
 
@@ -15,6 +18,28 @@ class WarrenBuffettSignal(BaseModel):
     reasoning: str
 
 
+LINE_ITEMS = [
+    "capital_expenditure",
+    "depreciation_and_amortization",
+    "net_income",
+    "outstanding_shares",
+    "total_assets",
+    "total_liabilities",
+    "shareholders_equity",
+    "dividends_and_other_cash_distributions",
+    "issuance_or_purchase_of_equity_shares",
+    "gross_profit",
+    "revenue",
+    "free_cash_flow",
+]
+
+DATA_REQUIREMENTS = DataRequirements(
+    financial_metrics=[FinancialMetricsRequirement(period="ttm", limit=10)],
+    line_items=[LineItemsRequirement(line_items=LINE_ITEMS, period="ttm", limit=10)],
+    market_cap=True,
+)
+
+
 def warren_buffett_agent(state: AgentState):
     """Analyzes stocks using Buffett's principles and LLM reasoning."""
     data = state["data"]
@@ -24,6 +49,7 @@ def warren_buffett_agent(state: AgentState):
     # Collect all analysis for LLM reasoning
     analysis_data = {}
     buffett_analysis = {}
+    llm_calls = {}
 
     for ticker in tickers:
         progress.update_status("warren_buffett_agent", ticker, "Fetching financial metrics")
@@ -33,20 +59,7 @@ def warren_buffett_agent(state: AgentState):
         progress.update_status("warren_buffett_agent", ticker, "Gathering financial line items")
         financial_line_items = search_line_items(
             ticker,
-            [
-                "capital_expenditure",
-                "depreciation_and_amortization",
-                "net_income",
-                "outstanding_shares",
-                "total_assets",
-                "total_liabilities",
-                "shareholders_equity",
-                "dividends_and_other_cash_distributions",
-                "issuance_or_purchase_of_equity_shares",
-                "gross_profit",
-                "revenue",
-                "free_cash_flow",
-            ],
+            LINE_ITEMS,
             end_date,
             period="ttm",
             limit=10,
@@ -120,12 +133,14 @@ def warren_buffett_agent(state: AgentState):
         }
 
         progress.update_status("warren_buffett_agent", ticker, "Generating Warren Buffett analysis")
-        buffett_output = generate_buffett_output(
+        llm_calls[ticker] = generate_buffett_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
         )
 
+    # The LLM calls of all tickers run concurrently
+    for ticker, buffett_output in call_llm_batch(llm_calls).items():
         # Store analysis in consistent format with other agents
         buffett_analysis[ticker] = {
             "signal": buffett_output.signal,
@@ -727,7 +742,7 @@ def generate_buffett_output(
     ticker: str,
     analysis_data: dict[str, any],
     state: AgentState,
-) -> WarrenBuffettSignal:
+) -> Callable[[], Awaitable[WarrenBuffettSignal]]:
     """Get investment decision from LLM with Buffett's principles"""
     template = ChatPromptTemplate.from_messages(
         [
@@ -825,10 +840,12 @@ def generate_buffett_output(
     def create_default_warren_buffett_signal():
         return WarrenBuffettSignal(signal="neutral", confidence=0.0, reasoning="Error in analysis, defaulting to neutral")
 
-    return call_llm(
+    return partial(
+        acall_llm,
         prompt=prompt,
         pydantic_model=WarrenBuffettSignal,
         agent_name="warren_buffett_agent",
         state=state,
         default_factory=create_default_warren_buffett_signal,
+        ticker=ticker,
     )
@@ -11,18 +11,19 @@ import numpy as np
 import itertools
 
 from src.llm.models import LLM_ORDER, OLLAMA_LLM_ORDER, get_model_info, ModelProvider
-from src.utils.analysts import ANALYST_ORDER
+from src.utils.analysts import ANALYST_ORDER, get_analyst_data_requirements
+from src.agents.risk_manager import DATA_REQUIREMENTS as RISK_MANAGEMENT_DATA_REQUIREMENTS
 from src.main import run_hedge_fund
 from src.tools.api import (
     get_company_news,
     get_price_data,
-    get_prices,
-    get_financial_metrics,
     get_insider_trades,
 )
+from src.tools.prefetch import plan_prefetch, run_prefetch
 from src.utils.display import print_backtest_results, format_backtest_row
 from typing_extensions import Callable
 from src.utils.ollama import ensure_ollama_and_model
+from src.data.fixtures import DATA_MODES, set_data_mode
 
 init(autoreset=True)
 
@@ -272,18 +273,17 @@ class Backtester:
         start_date_dt = end_date_dt - relativedelta(years=1)
         start_date_str = start_date_dt.strftime("%Y-%m-%d")
 
+        # The selected analysts' financial metrics and line items at the last backtest date.
+        # Their cached windows cover every earlier date of the backtest as well.
+        requirements = get_analyst_data_requirements(self.selected_analysts or None) + [RISK_MANAGEMENT_DATA_REQUIREMENTS]
+        calls = plan_prefetch(requirements, self.tickers, start_date_str, self.end_date)
         for ticker in self.tickers:
-            # Fetch price data for the entire period, plus 1 year
-            get_prices(ticker, start_date_str, self.end_date)
-
-            # Fetch financial metrics
-            get_financial_metrics(ticker, self.end_date, limit=10)
-
-            # Fetch insider trades
-            get_insider_trades(ticker, self.end_date, start_date=self.start_date, limit=1000)
-
-            # Fetch company news
-            get_company_news(ticker, self.end_date, start_date=self.start_date, limit=1000)
+            # Insider trades and company news for the whole backtest period
+            calls.append((get_insider_trades, {"ticker": ticker, "end_date": self.end_date, "start_date": self.start_date, "limit": 1000}))
+            calls.append((get_company_news, {"ticker": ticker, "end_date": self.end_date, "start_date": self.start_date, "limit": 1000}))
+        stats = run_prefetch(calls)
+        if stats["failed"]:
+            print(f"{stats['failed']} of {stats['calls']} pre-fetch requests failed; the agents will retry them.")
 
         print("Data pre-fetch complete.")
 
@@ -652,8 +652,11 @@ if __name__ == "__main__":
         help="Use all available analysts (overrides --analysts)",
     )
     parser.add_argument("--ollama", action="store_true", help="Use Ollama for local LLM inference")
+    parser.add_argument("--data-mode", choices=DATA_MODES, help="Fetch live data, record API responses as fixtures, or replay recorded fixtures without network access")
+    parser.add_argument("--fixtures-dir", type=str, help="Directory of recorded API responses. Defaults to fixtures/financial_data")
 
     args = parser.parse_args()
+    set_data_mode(args.data_mode, args.fixtures_dir)
 
     # Parse tickers from comma-separated string
     tickers = [ticker.strip() for ticker in args.tickers.split(",")] if args.tickers else []
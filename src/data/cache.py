@@ -1,65 +1,317 @@
+import os
+import threading
+import time
+
+from pydantic import BaseModel
+
+from src.data.date_ranges import merge_ranges
+from src.data.event_series import EventSeries
+from src.data.lru import LRUCache
+from src.data.models import CompanyFacts, CompanyNews, FinancialMetrics, InsiderTrade, Price
+from src.data.price_series import PriceSeries
+from src.data.store import CacheStore, create_store_from_env
+
+# Default in-memory budget per category in MB, sized so a long-running API server stays well
+# under a 512MB container. Override with HEDGE_FUND_CACHE_<CATEGORY>_MAX_MB (0 for no limit).
+DEFAULT_MEMORY_BUDGETS_MB = {
+    "prices": 64,
+    "financial_metrics": 32,
+    "line_items": 32,
+    "insider_trades": 32,
+    "company_news": 64,
+    "company_facts": 8,
+}
+
+# Categories whose entries may expire, configured with HEDGE_FUND_CACHE_<CATEGORY>_TTL in seconds.
+# Price, metric and line item history does not change once published and is tracked by coverage
+# records instead, so those categories never expire.
+EXPIRING_CATEGORIES = ("insider_trades", "company_news", "company_facts")
+
+# Default expiry of expiring categories in seconds. Company facts carry the current market cap,
+# which moves with the price, so they are only reused for a short while.
+DEFAULT_TTLS = {
+    "company_facts": 300,
+}
+
+# Categories held in memory as validated model objects, so cache hits return them without
+# re-validation. The store keeps them as JSON and, since only validated data is ever written,
+# they are rebuilt with model_construct on load.
+MODEL_CATEGORIES = {
+    "financial_metrics": FinancialMetrics,
+    "company_facts": CompanyFacts,
+}
+
+# Event categories, held in memory as compact EventSeries kept newest first: model and date field
+EVENT_CATEGORIES = {
+    "insider_trades": (InsiderTrade, "filing_date"),
+    "company_news": (CompanyNews, "date"),
+}
+
+
+def _memory_limits_from_env() -> tuple[dict[str, int | None], dict[str, float | None]]:
+    """Read per-category memory budgets (bytes) and TTLs (seconds) from the environment."""
+    budgets = {}
+    for category, default_mb in DEFAULT_MEMORY_BUDGETS_MB.items():
+        budget_mb = float(os.environ.get(f"HEDGE_FUND_CACHE_{category.upper()}_MAX_MB", default_mb))
+        budgets[category] = int(budget_mb * 1024 * 1024) if budget_mb > 0 else None
+    ttls = {}
+    for category in EXPIRING_CATEGORIES:
+        ttl = os.environ.get(f"HEDGE_FUND_CACHE_{category.upper()}_TTL", DEFAULT_TTLS.get(category))
+        ttls[category] = float(ttl) if ttl else None
+    return budgets, ttls
+
+
 class Cache:
-    """In-memory cache for API responses."""
+    """In-memory cache for API responses, optionally backed by a persistent store.
+
+    The in-memory tier acts as an L1 in front of the store: reads fall through to the
+    store on a miss and writes go to both tiers. Each category is an LRU bounded by a
+    memory budget; evicting data also drops its coverage record so the data is refetched
+    (or reloaded from the store) rather than reported as covered.
+
+    Updates merge into the cached entry, so each one reads, merges and writes under the lock
+    of its (category, key); callers that also record coverage hold the same lock around both
+    steps, so concurrent fetches for one ticker cannot overwrite each other.
+    """
+
+    def __init__(
+        self,
+        store: CacheStore | None = None,
+        memory_budgets: dict[str, int | None] | None = None,
+        ttls: dict[str, float | None] | None = None,
+    ):
+        self._price_coverage_cache = LRUCache()
+        self._financial_metrics_coverage_cache = LRUCache()
+        self._line_items_coverage_cache = LRUCache()
+        self._prices_cache = LRUCache(on_evict=self._price_coverage_cache.pop)
+        self._financial_metrics_cache = LRUCache(on_evict=self._financial_metrics_coverage_cache.pop)
+        self._line_items_cache = LRUCache(on_evict=self._line_items_coverage_cache.pop)
+        self._insider_trades_coverage_cache = LRUCache()
+        self._company_news_coverage_cache = LRUCache()
+        self._insider_trades_cache = LRUCache(on_evict=self._insider_trades_coverage_cache.pop)
+        self._company_news_cache = LRUCache(on_evict=self._company_news_coverage_cache.pop)
+        self._company_facts_cache = LRUCache()
+
+        # The default store and limits are resolved lazily so that .env files loaded after import are honoured
+        self._store = store
+        self._store_resolved = store is not None
+        self._limits_resolved = False
+        self._store_lock = threading.Lock()
+        self._entry_locks: dict[tuple[str, str], threading.RLock] = {}
+        self._entry_locks_lock = threading.Lock()
+        if memory_budgets is not None or ttls is not None:
+            self.set_memory_limits(memory_budgets or {}, ttls or {})
+
+    @property
+    def store(self) -> CacheStore | None:
+        """The persistent tier, or None when the cache is memory-only."""
+        if not self._store_resolved or not self._limits_resolved:
+            with self._store_lock:
+                if not self._store_resolved:
+                    self._store = create_store_from_env()
+                    self._store_resolved = True
+                if not self._limits_resolved:
+                    self._apply_memory_limits(*_memory_limits_from_env())
+        return self._store
+
+    def set_store(self, store: CacheStore | None):
+        """Replace the persistent tier (None makes the cache memory-only)."""
+        with self._store_lock:
+            self._store = store
+            self._store_resolved = True
+
+    def set_memory_limits(self, memory_budgets: dict[str, int | None], ttls: dict[str, float | None]):
+        """Replace the per-category memory budgets (bytes) and TTLs (seconds); None means unlimited."""
+        with self._store_lock:
+            self._apply_memory_limits(memory_budgets, ttls)
+
+    def _apply_memory_limits(self, memory_budgets: dict[str, int | None], ttls: dict[str, float | None]):
+        for category, cache in self._memory_tiers().items():
+            cache.max_bytes = memory_budgets.get(category)
+            cache.ttl = ttls.get(category)
+        self._limits_resolved = True
+
+    def lock(self, category: str, key: str) -> threading.RLock:
+        """Lock guarding the updates of one entry and its coverage, e.g. lock("prices", ticker)."""
+        with self._entry_locks_lock:
+            return self._entry_locks.setdefault((category, key), threading.RLock())
 
-    def __init__(self):
-        self._prices_cache: dict[str, list[dict[str, any]]] = {}
-        self._financial_metrics_cache: dict[str, list[dict[str, any]]] = {}
-        self._line_items_cache: dict[str, list[dict[str, any]]] = {}
-        self._insider_trades_cache: dict[str, list[dict[str, any]]] = {}
-        self._company_news_cache: dict[str, list[dict[str, any]]] = {}
+    def _memory_tiers(self) -> dict[str, LRUCache]:
+        return {
+            "prices": self._prices_cache,
+            "financial_metrics": self._financial_metrics_cache,
+            "line_items": self._line_items_cache,
+            "insider_trades": self._insider_trades_cache,
+            "company_news": self._company_news_cache,
+            "company_facts": self._company_facts_cache,
+        }
 
-    def _merge_data(self, existing: list[dict] | None, new_data: list[dict], key_field: str) -> list[dict]:
-        """Merge existing and new data, avoiding duplicates based on a key field."""
+    def memory_stats(self) -> dict[str, dict[str, any]]:
+        """Entry counts, estimated bytes and eviction counters of the in-memory tier per category."""
+        return {category: cache.stats() for category, cache in self._memory_tiers().items()}
+
+    def _merge_data(self, existing: list | None, new_data: list, key_field: str) -> list:
+        """Merge existing and new records, avoiding duplicates based on a key field."""
         if not existing:
-            return new_data
+            return list(new_data)
 
         # Create a set of existing keys for O(1) lookup
-        existing_keys = {item[key_field] for item in existing}
+        existing_keys = {getattr(item, key_field) for item in existing}
 
         # Only add items that don't exist yet
         merged = existing.copy()
-        merged.extend([item for item in new_data if item[key_field] not in existing_keys])
+        merged.extend([item for item in new_data if getattr(item, key_field) not in existing_keys])
         return merged
 
-    def get_prices(self, ticker: str) -> list[dict[str, any]] | None:
-        """Get cached price data if available."""
-        return self._prices_cache.get(ticker)
+    def _merge_events(self, existing: EventSeries | None, new_data: list | EventSeries, category: str) -> EventSeries:
+        """Merge events into a series, dropping exact duplicates and keeping the newest first."""
+        if not isinstance(new_data, EventSeries):
+            new_data = EventSeries.from_models(*EVENT_CATEGORIES[category], new_data)
+        if not existing:
+            return new_data
+        return existing.merge(new_data)
+
+    def _get(self, category: str, cache: LRUCache, key: str) -> any:
+        """Read from memory first, falling back to the persistent store."""
+        store = self.store
+        data = cache.get(key)
+        if data is not None or store is None:
+            return data
+        data = store.load(category, key)
+        if data is not None:
+            if category in EVENT_CATEGORIES:
+                data = EventSeries.from_records(*EVENT_CATEGORIES[category], data)
+            elif model := MODEL_CATEGORIES.get(category):
+                data = model.model_construct(**data) if isinstance(data, dict) else [model.model_construct(**row) for row in data]
+            elif category == "prices":
+                data = PriceSeries.from_rows(data)
+            cache.set(key, data)
+        return data
 
-    def set_prices(self, ticker: str, data: list[dict[str, any]]):
-        """Append new price data to cache."""
-        self._prices_cache[ticker] = self._merge_data(self._prices_cache.get(ticker), data, key_field="time")
+    def _put(self, category: str, cache: LRUCache, key: str, data: any, ttl: float | None = None):
+        """Write to memory and through to the persistent store."""
+        store = self.store
+        ttl = cache.ttl if ttl is None else ttl
+        cache.set(key, data, ttl=ttl)
+        if store is not None:
+            if category in EVENT_CATEGORIES:
+                data = data.to_rows()
+            elif category in MODEL_CATEGORIES:
+                data = data.model_dump() if isinstance(data, BaseModel) else [item.model_dump() for item in data]
+            elif category == "prices":
+                data = data.to_rows()
+            store.save(category, key, data, expires_at=time.time() + ttl if ttl is not None else None)
 
-    def get_financial_metrics(self, ticker: str) -> list[dict[str, any]]:
+    def get_prices(self, ticker: str) -> PriceSeries | None:
+        """Get the cached price series if available."""
+        return self._get("prices", self._prices_cache, ticker)
+
+    def set_prices(self, ticker: str, data: list[Price] | PriceSeries):
+        """Merge new price data into the cached series, which stays sorted by time."""
+        if not isinstance(data, PriceSeries):
+            data = PriceSeries.from_prices(data)
+        with self.lock("prices", ticker):
+            if (existing := self.get_prices(ticker)) is not None:
+                data = existing.merge(data)
+            self._put("prices", self._prices_cache, ticker, data)
+
+    def get_price_coverage(self, ticker: str) -> list[list[str]]:
+        """Get the [start, end] date ranges already fetched for a ticker."""
+        return self._get("price_coverage", self._price_coverage_cache, ticker) or []
+
+    def add_price_coverage(self, ticker: str, start_date: str, end_date: str):
+        """Record that prices for a ticker have been fetched for [start_date, end_date]."""
+        with self.lock("prices", ticker):
+            coverage = merge_ranges(self.get_price_coverage(ticker) + [[start_date, end_date]])
+            self._put("price_coverage", self._price_coverage_cache, ticker, coverage)
+
+    def get_financial_metrics(self, ticker: str) -> list[FinancialMetrics] | None:
         """Get cached financial metrics if available."""
-        return self._financial_metrics_cache.get(ticker)
+        return self._get("financial_metrics", self._financial_metrics_cache, ticker)
+
+    def set_financial_metrics(self, ticker: str, data: list[FinancialMetrics]):
+        """Append new financial metrics to cache, keeping the newest report period first."""
+        with self.lock("financial_metrics", ticker):
+            merged = self._merge_data(self.get_financial_metrics(ticker), data, key_field="report_period")
+            merged.sort(key=lambda metric: metric.report_period, reverse=True)
+            self._put("financial_metrics", self._financial_metrics_cache, ticker, merged)
 
-    def set_financial_metrics(self, ticker: str, data: list[dict[str, any]]):
-        """Append new financial metrics to cache."""
-        self._financial_metrics_cache[ticker] = self._merge_data(self._financial_metrics_cache.get(ticker), data, key_field="report_period")
+    def get_financial_metrics_coverage(self, ticker: str) -> dict[str, any] | None:
+        """Get the report period window already fetched for financial metrics."""
+        return self._get("financial_metrics_coverage", self._financial_metrics_coverage_cache, ticker)
+
+    def set_financial_metrics_coverage(self, ticker: str, window: dict[str, any]):
+        """Record the report period window fetched for financial metrics."""
+        with self.lock("financial_metrics", ticker):
+            self._put("financial_metrics_coverage", self._financial_metrics_coverage_cache, ticker, window)
 
     def get_line_items(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached line items if available."""
-        return self._line_items_cache.get(ticker)
+        return self._get("line_items", self._line_items_cache, ticker)
 
     def set_line_items(self, ticker: str, data: list[dict[str, any]]):
-        """Append new line items to cache."""
-        self._line_items_cache[ticker] = self._merge_data(self._line_items_cache.get(ticker), data, key_field="report_period")
+        """Merge new line items into cache, keeping the union of fields per report period."""
+        with self.lock("line_items", ticker):
+            rows = {row["report_period"]: dict(row) for row in self.get_line_items(ticker) or []}
+            for item in data:
+                rows.setdefault(item["report_period"], {}).update(item)
+            merged = sorted(rows.values(), key=lambda row: row["report_period"], reverse=True)
+            self._put("line_items", self._line_items_cache, ticker, merged)
+
+    def get_line_items_coverage(self, ticker: str) -> dict[str, dict[str, any]]:
+        """Get the report period window already fetched for each line item field."""
+        return self._get("line_items_coverage", self._line_items_coverage_cache, ticker) or {}
+
+    def set_line_items_coverage(self, ticker: str, coverage: dict[str, dict[str, any]]):
+        """Record the report period window fetched for each line item field."""
+        with self.lock("line_items", ticker):
+            self._put("line_items_coverage", self._line_items_coverage_cache, ticker, coverage)
 
-    def get_insider_trades(self, ticker: str) -> list[dict[str, any]] | None:
+    def get_insider_trades(self, ticker: str) -> EventSeries | None:
         """Get cached insider trades if available."""
-        return self._insider_trades_cache.get(ticker)
+        return self._get("insider_trades", self._insider_trades_cache, ticker)
+
+    def set_insider_trades(self, ticker: str, data: list[InsiderTrade] | EventSeries, ttl: float | None = None):
+        """Merge new insider trades into cache, optionally expiring after ttl seconds."""
+        with self.lock("insider_trades", ticker):
+            self._put("insider_trades", self._insider_trades_cache, ticker, self._merge_events(self.get_insider_trades(ticker), data, "insider_trades"), ttl=ttl)
+
+    def get_insider_trades_coverage(self, ticker: str) -> list[list[str]]:
+        """Get the [start, end] filing date ranges already fetched for a ticker."""
+        return self._get("insider_trades_coverage", self._insider_trades_coverage_cache, ticker) or []
 
-    def set_insider_trades(self, ticker: str, data: list[dict[str, any]]):
-        """Append new insider trades to cache."""
-        self._insider_trades_cache[ticker] = self._merge_data(self._insider_trades_cache.get(ticker), data, key_field="filing_date")  # Could also use transaction_date if preferred
+    def add_insider_trades_coverage(self, ticker: str, start_date: str, end_date: str):
+        """Record that insider trades for a ticker have been fetched for [start_date, end_date]."""
+        with self.lock("insider_trades", ticker):
+            coverage = merge_ranges(self.get_insider_trades_coverage(ticker) + [[start_date, end_date]])
+            self._put("insider_trades_coverage", self._insider_trades_coverage_cache, ticker, coverage)
 
-    def get_company_news(self, ticker: str) -> list[dict[str, any]] | None:
+    def get_company_news(self, ticker: str) -> EventSeries | None:
         """Get cached company news if available."""
-        return self._company_news_cache.get(ticker)
+        return self._get("company_news", self._company_news_cache, ticker)
+
+    def set_company_news(self, ticker: str, data: list[CompanyNews] | EventSeries, ttl: float | None = None):
+        """Merge new company news into cache, optionally expiring after ttl seconds."""
+        with self.lock("company_news", ticker):
+            self._put("company_news", self._company_news_cache, ticker, self._merge_events(self.get_company_news(ticker), data, "company_news"), ttl=ttl)
+
+    def get_company_news_coverage(self, ticker: str) -> list[list[str]]:
+        """Get the [start, end] date ranges of news already fetched for a ticker."""
+        return self._get("company_news_coverage", self._company_news_coverage_cache, ticker) or []
+
+    def add_company_news_coverage(self, ticker: str, start_date: str, end_date: str):
+        """Record that news for a ticker has been fetched for [start_date, end_date]."""
+        with self.lock("company_news", ticker):
+            coverage = merge_ranges(self.get_company_news_coverage(ticker) + [[start_date, end_date]])
+            self._put("company_news_coverage", self._company_news_coverage_cache, ticker, coverage)
+
+    def get_company_facts(self, ticker: str) -> CompanyFacts | None:
+        """Get cached company facts if available and not expired."""
+        return self._get("company_facts", self._company_facts_cache, ticker)
 
-    def set_company_news(self, ticker: str, data: list[dict[str, any]]):
-        """Append new company news to cache."""
-        self._company_news_cache[ticker] = self._merge_data(self._company_news_cache.get(ticker), data, key_field="date")
+    def set_company_facts(self, ticker: str, data: CompanyFacts):
+        """Cache company facts, expiring after the company_facts TTL."""
+        self._put("company_facts", self._company_facts_cache, ticker, data)
 
 
 # Global cache instance
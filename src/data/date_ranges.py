@@ -0,0 +1,35 @@
+from datetime import date, timedelta
+
+
+def _shift(day: str, days: int) -> str:
+    return (date.fromisoformat(day) + timedelta(days=days)).isoformat()
+
+
+def merge_ranges(ranges: list[list[str]]) -> list[list[str]]:
+    """Merge overlapping or adjacent [start, end] date ranges (inclusive, YYYY-MM-DD)."""
+    merged: list[list[str]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= _shift(merged[-1][1], 1):
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def missing_ranges(covered: list[list[str]], start: str, end: str) -> list[list[str]]:
+    """Return the parts of [start, end] that are not inside any of the covered ranges."""
+    gaps: list[list[str]] = []
+    cursor = start
+    for covered_start, covered_end in merge_ranges(covered):
+        if covered_end < cursor:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > cursor:
+            gaps.append([cursor, _shift(covered_start, -1)])
+        cursor = _shift(covered_end, 1)
+        if cursor > end:
+            return gaps
+    if cursor <= end:
+        gaps.append([cursor, end])
+    return gaps
@@ -0,0 +1,196 @@
+import os
+import sys
+import typing
+import zlib
+from collections.abc import Iterator, Sequence
+
+import numpy as np
+
+# Fields stored as one zlib-compressed block when HEDGE_FUND_CACHE_COMPRESS_TITLES is set.
+# Headlines are nearly all distinct, so dictionary encoding does not shrink them.
+COMPRESSIBLE_FIELDS = {"CompanyNews": ("title",)}
+
+# Rows materialized at a time while iterating
+ITER_CHUNK = 256
+
+# Rows per zlib block of a compressed column, so reading a few rows decompresses one block
+COMPRESSED_BLOCK_ROWS = ITER_CHUNK
+
+
+def _field_kind(annotation: any) -> str:
+    """Storage kind of a model field: "bool", "float" or "str"."""
+    types = set(typing.get_args(annotation)) or {annotation}
+    if bool in types:
+        return "bool"
+    if float in types:
+        return "float"
+    return "str"
+
+
+class _Strings:
+    """Dictionary-encoded strings: int32 codes into a table of distinct, interned values (-1 is None)."""
+
+    def __init__(self, values: list[str | None]):
+        table: dict[str, int] = {}
+        self.codes = np.fromiter((-1 if value is None else table.setdefault(value, len(table)) for value in values), dtype=np.int32, count=len(values))
+        self.values = [sys.intern(value) for value in table]
+        self.codes.flags.writeable = False
+
+    def decode(self, start: int, stop: int) -> list[str | None]:
+        values = self.values
+        return [None if code < 0 else values[code] for code in self.codes[start:stop].tolist()]
+
+
+class _CompressedStrings:
+    """
+    Strings concatenated as UTF-8 into zlib blocks of COMPRESSED_BLOCK_ROWS rows with byte offsets.
+
+    Only the blocks covering the decoded rows are decompressed. None is stored as an empty slot with a mask bit.
+    """
+
+    def __init__(self, values: list[str | None]):
+        encoded = [b"" if value is None else value.encode() for value in values]
+        self.offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=self.offsets[1:])
+        self.missing = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+        self.blocks = [zlib.compress(b"".join(encoded[i : i + COMPRESSED_BLOCK_ROWS])) for i in range(0, len(encoded), COMPRESSED_BLOCK_ROWS)]
+        self.offsets.flags.writeable = False
+        self.missing.flags.writeable = False
+
+    def decode(self, start: int, stop: int) -> list[str | None]:
+        if start >= stop:
+            return []
+        first_block, last_block = start // COMPRESSED_BLOCK_ROWS, (stop - 1) // COMPRESSED_BLOCK_ROWS
+        data = b"".join(zlib.decompress(block) for block in self.blocks[first_block : last_block + 1])
+        # Byte offsets relative to the first decompressed block
+        offsets = (self.offsets[start : stop + 1] - self.offsets[first_block * COMPRESSED_BLOCK_ROWS]).tolist()
+        missing = self.missing[start:stop].tolist()
+        return [None if missing[i] else data[offsets[i] : offsets[i + 1]].decode() for i in range(stop - start)]
+
+
+class _Numbers:
+    """Floats (NaN is None) or booleans (int8, -1 is None)."""
+
+    def __init__(self, values: list[any], kind: str):
+        self.kind = kind
+        if kind == "bool":
+            self.array = np.fromiter((-1 if value is None else int(value) for value in values), dtype=np.int8, count=len(values))
+        else:
+            self.array = np.fromiter((np.nan if value is None else value for value in values), dtype=np.float64, count=len(values))
+        self.array.flags.writeable = False
+
+    def decode(self, start: int, stop: int) -> list[any]:
+        if self.kind == "bool":
+            return [None if value < 0 else bool(value) for value in self.array[start:stop].tolist()]
+        return [None if value != value else value for value in self.array[start:stop].tolist()]
+
+
+class _Dates:
+    """ISO date strings split into int32 days since the epoch and an interned remainder, e.g. "T14:30:00Z"."""
+
+    def __init__(self, values: list[str]):
+        self.days = np.array([value[:10] for value in values], dtype="datetime64[D]").astype(np.int32)
+        self.suffixes = _Strings([value[10:] for value in values])
+        self.days.flags.writeable = False
+
+    def decode(self, start: int, stop: int) -> list[str]:
+        days = self.days[start:stop].astype("datetime64[D]").astype(str).tolist()
+        return [day + suffix for day, suffix in zip(days, self.suffixes.decode(start, stop))]
+
+
+class EventSeries(Sequence):
+    """
+    Compact columnar insider trades or news of one ticker, newest first.
+
+    Each model field is a column: strings are dictionary-encoded with interned values, numbers
+    and flags are numpy arrays and the date field is stored as day numbers. Models are only
+    built when items are read, so the cache holds columns rather than thousands of objects.
+    Slices share the columns of the series they come from and every column is read-only.
+    """
+
+    def __init__(self, model: type, date_field: str, columns: dict[str, any], start: int = 0, stop: int | None = None):
+        self.model = model
+        self.date_field = date_field
+        self.columns = columns
+        self.start = start
+        self.stop = len(columns[date_field].days) if stop is None else stop
+
+    @classmethod
+    def from_records(cls, model: type, date_field: str, records: list[dict[str, any]], compress: bool | None = None) -> "EventSeries":
+        """Build a series from model dumps, ordered newest first."""
+        if compress is None:
+            compress = os.environ.get("HEDGE_FUND_CACHE_COMPRESS_TITLES", "").lower() in ("1", "true", "yes")
+        records = sorted(records, key=lambda record: record[date_field], reverse=True)
+        compressible = COMPRESSIBLE_FIELDS.get(model.__name__, ()) if compress else ()
+        columns = {}
+        for name, field in model.model_fields.items():
+            values = [record.get(name) for record in records]
+            kind = _field_kind(field.annotation)
+            if name == date_field:
+                columns[name] = _Dates(values)
+            elif kind != "str":
+                columns[name] = _Numbers(values, kind)
+            elif name in compressible:
+                columns[name] = _CompressedStrings(values)
+            else:
+                columns[name] = _Strings(values)
+        return cls(model, date_field, columns)
+
+    @classmethod
+    def from_models(cls, model: type, date_field: str, items: list) -> "EventSeries":
+        return cls.from_records(model, date_field, [item.model_dump() for item in items])
+
+    def to_rows(self) -> list[dict[str, any]]:
+        return list(self._records(self.start, self.stop))
+
+    def _records(self, start: int, stop: int) -> Iterator[dict[str, any]]:
+        names = list(self.columns)
+        decoded = [self.columns[name].decode(start, stop) for name in names]
+        for values in zip(*decoded):
+            yield dict(zip(names, values))
+
+    def merge(self, other: "EventSeries") -> "EventSeries":
+        """Combine two series, dropping records present in both."""
+        seen = set()
+        records = []
+        for record in [*self._records(self.start, self.stop), *other._records(other.start, other.stop)]:
+            key = tuple(record.values())
+            if key not in seen:
+                seen.add(key)
+                records.append(record)
+        return EventSeries.from_records(self.model, self.date_field, records)
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return self.to_models()[index]
+            return EventSeries(self.model, self.date_field, self.columns, self.start + start, self.start + max(start, stop))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("EventSeries index out of range")
+        return self.model.model_construct(**next(self._records(self.start + index, self.start + index + 1)))
+
+    def __iter__(self) -> Iterator:
+        # Rows were validated before they were cached, so skip validation when rebuilding them
+        for chunk_start in range(self.start, self.stop, ITER_CHUNK):
+            for record in self._records(chunk_start, min(chunk_start + ITER_CHUNK, self.stop)):
+                yield self.model.model_construct(**record)
+
+    def slice(self, start_date: str, end_date: str) -> "EventSeries":
+        """Events dated within [start_date, end_date], sharing this series' columns."""
+        # Days are descending, so search their negation
+        days = -self.columns[self.date_field].days[self.start : self.stop]
+        start = self.start + int(np.searchsorted(days, -np.datetime64(end_date[:10], "D").astype(np.int32), side="left"))
+        stop = self.start + int(np.searchsorted(days, -np.datetime64(start_date[:10], "D").astype(np.int32), side="right"))
+        return EventSeries(self.model, self.date_field, self.columns, start, stop)
+
+    def to_models(self) -> list:
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"EventSeries({self.model.__name__}, {len(self)} events)"
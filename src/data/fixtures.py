@@ -0,0 +1,79 @@
+"""Recorded financial data API responses for reproducible, network-free runs.
+
+HEDGE_FUND_DATA_MODE selects how src.tools.api talks to the API:
+  live    - send requests to the API (default)
+  record  - send requests to the API and save every final response as a fixture
+  replay  - serve responses from fixtures only; unrecorded requests get a 404
+HEDGE_FUND_FIXTURES_DIR selects the fixture directory (default: fixtures/financial_data).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+DATA_MODES = ("live", "record", "replay")
+
+_stores: dict[Path, "FixtureStore"] = {}
+_stores_lock = threading.Lock()
+
+
+class FixtureStore:
+    """Recorded responses stored as one JSON file per request, named by a hash of the request."""
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory).expanduser()
+
+    @staticmethod
+    def request_key(method: str, url: str, body: dict | None = None) -> str:
+        request = json.dumps([method.upper(), url, body], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def _path(self, method: str, url: str, body: dict | None) -> Path:
+        return self.directory / f"{self.request_key(method, url, body)}.json"
+
+    def load(self, method: str, url: str, body: dict | None = None) -> dict[str, any] | None:
+        """Return the recorded {"status_code", "text"} for a request, or None if it was never recorded."""
+        path = self._path(method, url, body)
+        if not path.exists():
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, method: str, url: str, body: dict | None, status_code: int, text: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fixture = {"method": method.upper(), "url": url, "body": body, "status_code": status_code, "text": text}
+        # Write to a temporary file first so concurrent readers never see a partial fixture
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(fixture, f)
+        os.replace(tmp_path, self._path(method, url, body))
+
+
+def get_data_mode() -> str:
+    """The configured data mode: "live", "record" or "replay"."""
+    mode = os.environ.get("HEDGE_FUND_DATA_MODE", "live").lower()
+    if mode not in DATA_MODES:
+        raise ValueError(f"Unknown data mode: {mode}. Expected one of {', '.join(DATA_MODES)}")
+    return mode
+
+
+def get_fixture_store() -> FixtureStore:
+    """The fixture store of the configured directory."""
+    directory = Path(os.environ.get("HEDGE_FUND_FIXTURES_DIR", "fixtures/financial_data")).expanduser()
+    with _stores_lock:
+        if directory not in _stores:
+            _stores[directory] = FixtureStore(directory)
+        return _stores[directory]
+
+
+def set_data_mode(mode: str | None = None, fixtures_dir: str | None = None) -> None:
+    """Override the environment configuration, e.g. from command line flags."""
+    if mode is not None:
+        if mode not in DATA_MODES:
+            raise ValueError(f"Unknown data mode: {mode}. Expected one of {', '.join(DATA_MODES)}")
+        os.environ["HEDGE_FUND_DATA_MODE"] = mode
+    if fixtures_dir is not None:
+        os.environ["HEDGE_FUND_FIXTURES_DIR"] = fixtures_dir
@@ -0,0 +1,132 @@
+"""Size-bounded LRU mapping with optional expiry, used for the in-memory cache tier."""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+# Long lists of similar records are sized from a sample rather than walked in full
+_SIZE_SAMPLE = 32
+
+
+def estimate_size(value: any) -> int:
+    """Estimate the memory held by a cached value in bytes."""
+    if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return sys.getsizeof(value)
+    if hasattr(value, "nbytes"):
+        # NumPy arrays and containers of them
+        return int(value.nbytes) + sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = list(value)
+        if len(items) > _SIZE_SAMPLE:
+            step = len(items) / _SIZE_SAMPLE
+            sample = [items[int(i * step)] for i in range(_SIZE_SAMPLE)]
+            return sys.getsizeof(value) + int(sum(estimate_size(item) for item in sample) * len(items) / _SIZE_SAMPLE)
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in items)
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + estimate_size(vars(value))
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    Thread-safe mapping that evicts least recently used entries beyond max_bytes.
+
+    Entries may carry a time-to-live in seconds; expired entries are dropped on access.
+    on_evict is called with the key of every entry removed by eviction or expiry.
+    """
+
+    def __init__(self, max_bytes: int | None = None, ttl: float | None = None, on_evict: Callable[[str], None] | None = None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._on_evict = on_evict
+        self._lock = threading.Lock()
+        # key -> (value, size, expires_at)
+        self._entries: OrderedDict[str, tuple[any, int, float | None]] = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str, default: any = None) -> any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, _, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                self._remove(key)
+                self._expirations += 1
+                expired = True
+            else:
+                self._entries.move_to_end(key)
+                expired = False
+        if expired:
+            self._notify([key])
+            return default
+        return value
+
+    def set(self, key: str, value: any, ttl: float | None = None):
+        """Insert or replace an entry. ttl overrides the default time-to-live of the cache."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+            evicted = self._evict_over_budget()
+        self._notify(evicted)
+
+    def pop(self, key: str, default: any = None) -> any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+            return self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, any]:
+        """Current entry count, estimated size and eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    def _remove(self, key: str) -> any:
+        value, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        return value
+
+    def _evict_over_budget(self) -> list[str]:
+        evicted = []
+        if self.max_bytes is None:
+            return evicted
+        # The newest entry is always kept, even when it alone exceeds the budget
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self._evictions += 1
+            evicted.append(key)
+        return evicted
+
+    def _notify(self, keys: list[str]):
+        if self._on_evict is not None:
+            for key in keys:
+                self._on_evict(key)
@@ -0,0 +1,113 @@
+"""Hit, miss and request statistics of the financial data layer.
+
+Every cache lookup is counted per dataset as a hit or as a miss with its reason:
+
+- "cold": nothing is cached for the ticker (or it was evicted)
+- "expired": the cached data outlived its TTL while its coverage record remained
+- "partial": part of the requested window or fields is cached and the rest is fetched
+- "live": only the part of the window from today onwards is fetched again
+
+Every financial data API response is counted per endpoint with its latency, status code and
+body size. Listeners registered with add_metrics_listener receive each updated (metric name,
+value), which is how the backend's SystemMetrics collector exposes them on
+/api/monitoring/metrics; latencies go there as raw samples, and the fixed-bucket latency
+histogram is only available from DataMetrics.snapshot().
+"""
+
+import bisect
+import threading
+from typing import Callable
+
+MISS_REASONS = ("cold", "expired", "partial", "live")
+
+# Upper bounds in seconds of the request latency histogram buckets; slower requests go to "inf"
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _bucket_label(bound: float) -> str:
+    return f"{bound:g}s"
+
+
+class DataMetrics:
+    """Thread-safe counters of cache lookups per dataset and API requests per endpoint."""
+
+    def __init__(self):
+        self._lookups: dict[str, dict[str, int]] = {}
+        self._requests: dict[str, dict[str, any]] = {}
+        self._lock = threading.Lock()
+
+    def record_lookup(self, dataset: str, miss_reason: str | None = None) -> None:
+        """Count a cache hit, or a miss when a reason is given."""
+        with self._lock:
+            stats = self._lookups.setdefault(dataset, {"hits": 0, "misses": 0, **{f"misses_{reason}": 0 for reason in MISS_REASONS}})
+            if miss_reason is None:
+                stats["hits"] += 1
+                updates = {f"data_cache_hits_{dataset}": stats["hits"]}
+            else:
+                stats["misses"] += 1
+                stats[f"misses_{miss_reason}"] += 1
+                updates = {f"data_cache_misses_{dataset}_{miss_reason}": stats[f"misses_{miss_reason}"]}
+            updates[f"data_cache_hit_rate_{dataset}"] = stats["hits"] / (stats["hits"] + stats["misses"])
+        _notify(updates)
+
+    def record_request(self, endpoint: str, seconds: float, nbytes: int, status_code: int | None) -> None:
+        """Count an API response (status None for a transport error) with its latency and body size."""
+        bucket = _bucket_label(LATENCY_BUCKETS[index]) if (index := bisect.bisect_left(LATENCY_BUCKETS, seconds)) < len(LATENCY_BUCKETS) else "inf"
+        status = "error" if status_code is None else str(status_code)
+        with self._lock:
+            stats = self._requests.setdefault(
+                endpoint,
+                {"requests": 0, "seconds": 0.0, "bytes": 0, "status": {}, "latency_buckets": {**{_bucket_label(b): 0 for b in LATENCY_BUCKETS}, "inf": 0}},
+            )
+            stats["requests"] += 1
+            stats["seconds"] += seconds
+            stats["bytes"] += nbytes
+            stats["status"][status] = stats["status"].get(status, 0) + 1
+            stats["latency_buckets"][bucket] += 1
+            updates = {
+                f"data_api_latency_{endpoint}": seconds,
+                f"data_api_bytes_{endpoint}": nbytes,
+                f"data_api_bytes_total_{endpoint}": stats["bytes"],
+                f"data_api_status_{endpoint}_{status}": stats["status"][status],
+            }
+        _notify(updates)
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, any]]]:
+        """Copy of the counters: {"lookups": {dataset: ...}, "requests": {endpoint: ...}}."""
+        with self._lock:
+            lookups = {dataset: dict(stats) for dataset, stats in self._lookups.items()}
+            requests = {
+                endpoint: {**stats, "status": dict(stats["status"]), "latency_buckets": dict(stats["latency_buckets"])}
+                for endpoint, stats in self._requests.items()
+            }
+        for stats in lookups.values():
+            stats["hit_rate"] = stats["hits"] / (stats["hits"] + stats["misses"])
+        return {"lookups": lookups, "requests": requests}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._lookups.clear()
+            self._requests.clear()
+
+
+# Callbacks receiving (metric name, value) for every updated metric
+_metrics_listeners: list[Callable[[str, float], None]] = []
+
+_data_metrics = DataMetrics()
+
+
+def _notify(updates: dict[str, float]) -> None:
+    for listener in list(_metrics_listeners):
+        for name, value in updates.items():
+            listener(name, value)
+
+
+def add_metrics_listener(listener: Callable[[str, float], None]) -> None:
+    """Report data layer metrics to a metrics collector."""
+    if listener not in _metrics_listeners:
+        _metrics_listeners.append(listener)
+
+
+def get_data_metrics() -> DataMetrics:
+    """The process-wide data layer metrics."""
+    return _data_metrics
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+from src.data.models import Price
+
+# Column order of Price.model_dump(), kept so DataFrames match what prices_to_df used to build
+OHLC_COLUMNS = ["open", "close", "high", "low"]
+
+
+class PriceSeries:
+    """
+    Columnar daily price history of one ticker, sorted by time.
+
+    OHLC values live in one contiguous (n, 4) float64 block next to an int64 volume array and a
+    parsed DatetimeIndex, so DataFrames and arrays are views built without re-parsing. The arrays
+    are read-only because they are shared by every reader of the cache. Price objects are built
+    from the arrays on demand and never kept, so a cached series costs only its arrays.
+    """
+
+    def __init__(self, times: np.ndarray, index: pd.DatetimeIndex, ohlc: np.ndarray, volume: np.ndarray):
+        self.times = times
+        self.days = times.astype("U10")
+        self.index = index
+        self.ohlc = ohlc
+        self.volume = volume
+        for array in (self.times, self.days, self.ohlc, self.volume):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_prices(cls, prices: list[Price]) -> "PriceSeries":
+        prices = sorted(prices, key=lambda price: price.time)
+        times = np.array([price.time for price in prices], dtype=str)
+        ohlc = np.array([[price.open, price.close, price.high, price.low] for price in prices], dtype=np.float64).reshape(-1, 4)
+        volume = np.array([price.volume for price in prices], dtype=np.int64)
+        return cls(times, pd.DatetimeIndex(pd.to_datetime(times), name="Date"), ohlc, volume)
+
+    @classmethod
+    def from_rows(cls, rows: list[dict[str, any]]) -> "PriceSeries":
+        """Rebuild a series from to_rows() output, which holds previously validated data."""
+        return cls.from_prices([Price.model_construct(**row) for row in rows])
+
+    def to_rows(self) -> list[dict[str, any]]:
+        return [price.model_dump() for price in self.to_prices()]
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __iter__(self):
+        return (self._price(i) for i in range(len(self)))
+
+    def __getitem__(self, position: int | slice) -> Price | list[Price]:
+        if isinstance(position, slice):
+            return [self._price(i) for i in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("PriceSeries index out of range")
+        return self._price(position)
+
+    def merge(self, other: "PriceSeries") -> "PriceSeries":
+        """Combine two series, keeping this series' bar when both hold the same time."""
+        if not len(self):
+            return other
+        if not len(other):
+            return self
+        times = np.concatenate([self.times, other.times])
+        # np.unique returns the first occurrence of each time, in sorted order
+        _, positions = np.unique(times, return_index=True)
+        return PriceSeries(
+            times[positions],
+            self.index.append(other.index)[positions],
+            np.concatenate([self.ohlc, other.ohlc])[positions],
+            np.concatenate([self.volume, other.volume])[positions],
+        )
+
+    def slice(self, start_date: str, end_date: str) -> "PriceSeries":
+        """Bars whose date falls within [start_date, end_date], sharing this series' memory."""
+        start = int(np.searchsorted(self.days, start_date, side="left"))
+        end = int(np.searchsorted(self.days, end_date, side="right"))
+        if start == 0 and end == len(self):
+            return self
+        return PriceSeries(self.times[start:end], self.index[start:end], self.ohlc[start:end], self.volume[start:end])
+
+    def to_prices(self) -> list[Price]:
+        """A fresh list of Price objects; callers may keep or modify it."""
+        return [
+            Price.model_construct(open=float(o), close=float(c), high=float(h), low=float(l), volume=int(v), time=str(t))
+            for (o, c, h, l), v, t in zip(self.ohlc.tolist(), self.volume.tolist(), self.times.tolist())
+        ]
+
+    def _price(self, position: int) -> Price:
+        o, c, h, l = self.ohlc[position].tolist()
+        return Price.model_construct(open=o, close=c, high=h, low=l, volume=int(self.volume[position]), time=str(self.times[position]))
+
+    def to_df(self) -> pd.DataFrame:
+        """DataFrame indexed by Date with open, close, high, low, volume and time columns."""
+        df = pd.DataFrame(self.ohlc, index=self.index, columns=OHLC_COLUMNS, copy=False)
+        df["volume"] = self.volume
+        df["time"] = self.times.astype(object)
+        return df
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only view of one price column, e.g. "close"."""
+        if name == "volume":
+            return self.volume
+        return self.ohlc[:, OHLC_COLUMNS.index(name)]
@@ -0,0 +1,57 @@
+"""Pluggable sources of financial data.
+
+HEDGE_FUND_DATA_PROVIDER selects the provider used by src.tools.api:
+  financialdatasets - the financialdatasets.ai HTTP API (default)
+  local             - bulk Parquet/CSV files under HEDGE_FUND_LOCAL_DATA_DIR
+"""
+
+import os
+import threading
+
+from src.data.providers.base import DataAPIError, DataProvider
+from src.data.providers.financial_datasets import FinancialDatasetsProvider
+from src.data.providers.local import LocalFileProvider
+
+_provider: DataProvider | None = None
+_provider_lock = threading.Lock()
+
+
+def create_provider_from_env() -> DataProvider:
+    """Build the data provider configured through the environment."""
+    name = os.environ.get("HEDGE_FUND_DATA_PROVIDER", "financialdatasets").lower()
+    if name == "financialdatasets":
+        return FinancialDatasetsProvider()
+    if name == "local":
+        directory = os.environ.get("HEDGE_FUND_LOCAL_DATA_DIR")
+        if not directory:
+            raise ValueError("HEDGE_FUND_LOCAL_DATA_DIR must be set to use the local data provider")
+        return LocalFileProvider(directory)
+    raise ValueError(f"Unknown data provider: {name}")
+
+
+def get_data_provider() -> DataProvider:
+    """Get the active data provider, created from the environment on first use."""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = create_provider_from_env()
+    return _provider
+
+
+def set_data_provider(provider: DataProvider | None):
+    """Replace the active data provider (None re-reads the environment on next use)."""
+    global _provider
+    with _provider_lock:
+        _provider = provider
+
+
+__all__ = [
+    "DataAPIError",
+    "DataProvider",
+    "FinancialDatasetsProvider",
+    "LocalFileProvider",
+    "create_provider_from_env",
+    "get_data_provider",
+    "set_data_provider",
+]
@@ -0,0 +1,64 @@
+import asyncio
+
+from src.data.models import CompanyFacts, CompanyNews, FinancialMetrics, InsiderTrade, LineItem, Price
+
+
+class DataAPIError(Exception):
+    """Raised when a data provider cannot return the requested data."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class DataProvider:
+    """
+    Source of financial data behind src.tools.api.
+
+    Providers only fetch; caching, coverage bookkeeping and request coalescing stay in
+    src.tools.api, so every provider gets them for free. The async variants used by the
+    async data functions run the sync methods on a worker thread unless a provider has a
+    native async transport.
+    """
+
+    def get_prices(self, ticker: str, start_date: str, end_date: str) -> list[Price]:
+        """Daily prices with start_date <= date <= end_date."""
+        raise NotImplementedError
+
+    def get_financial_metrics(self, ticker: str, end_date: str | None, period: str, limit: int) -> list[FinancialMetrics]:
+        """The newest `limit` reports with report_period <= end_date (or the newest overall when None), newest first."""
+        raise NotImplementedError
+
+    def search_line_items(self, ticker: str, line_items: list[str], end_date: str | None, period: str, limit: int) -> list[LineItem]:
+        """Like get_financial_metrics, holding the requested fields."""
+        raise NotImplementedError
+
+    def get_insider_trades(self, ticker: str, end_date: str, start_date: str | None, limit: int) -> list[InsiderTrade]:
+        """Trades filed up to end_date: all of them since start_date, or the newest `limit` without one."""
+        raise NotImplementedError
+
+    def get_company_news(self, ticker: str, end_date: str, start_date: str | None, limit: int) -> list[CompanyNews]:
+        """News up to end_date: all of it since start_date, or the newest `limit` without one."""
+        raise NotImplementedError
+
+    def get_company_facts(self, ticker: str) -> CompanyFacts:
+        """Current company facts, raising DataAPIError when unavailable."""
+        raise NotImplementedError
+
+    async def aget_prices(self, ticker: str, start_date: str, end_date: str) -> list[Price]:
+        return await asyncio.to_thread(self.get_prices, ticker, start_date, end_date)
+
+    async def aget_financial_metrics(self, ticker: str, end_date: str | None, period: str, limit: int) -> list[FinancialMetrics]:
+        return await asyncio.to_thread(self.get_financial_metrics, ticker, end_date, period, limit)
+
+    async def asearch_line_items(self, ticker: str, line_items: list[str], end_date: str | None, period: str, limit: int) -> list[LineItem]:
+        return await asyncio.to_thread(self.search_line_items, ticker, line_items, end_date, period, limit)
+
+    async def aget_insider_trades(self, ticker: str, end_date: str, start_date: str | None, limit: int) -> list[InsiderTrade]:
+        return await asyncio.to_thread(self.get_insider_trades, ticker, end_date, start_date, limit)
+
+    async def aget_company_news(self, ticker: str, end_date: str, start_date: str | None, limit: int) -> list[CompanyNews]:
+        return await asyncio.to_thread(self.get_company_news, ticker, end_date, start_date, limit)
+
+    async def aget_company_facts(self, ticker: str) -> CompanyFacts:
+        return await asyncio.to_thread(self.get_company_facts, ticker)
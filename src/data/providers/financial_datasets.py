@@ -0,0 +1,483 @@
+"""The financialdatasets.ai HTTP API.
+
+Every request is written once, as a flow: a generator that yields the steps it needs (an
+attempt at an HTTP request, a pause before retrying, or other flows to run concurrently) and
+receives their results. Flows hold the request building, retry policy, record/replay and
+pagination; the synchronous (requests) and asyncio (httpx) transports only carry out the steps.
+"""
+
+import asyncio
+import datetime
+import json
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Generator, Mapping, NamedTuple, TypeVar
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.data.fixtures import get_data_mode, get_fixture_store
+from src.data.metrics import get_data_metrics
+from src.data.models import (
+    CompanyFacts,
+    CompanyFactsResponse,
+    CompanyNews,
+    CompanyNewsResponse,
+    FinancialMetrics,
+    FinancialMetricsResponse,
+    InsiderTrade,
+    InsiderTradeResponse,
+    LineItem,
+    LineItemResponse,
+    Price,
+    PriceResponse,
+)
+from src.data.providers.base import DataAPIError, DataProvider
+from src.data.rate_limit import endpoint_name, get_rate_limiter
+
+T = TypeVar("T")
+
+API_BASE_URL = "https://api.financialdatasets.ai"
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Date-sharded pagination sizes shards to fill this fraction of a page, so most shards need one request
+SHARD_PAGE_FILL = 0.8
+
+# Upper bound on the shards of one window. A dense first page would otherwise split a long window
+# into hundreds of one-day shards; wider shards instead page through their records on their own.
+MAX_SHARDS = 16
+
+# Shared HTTP session, created on first use
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+# An httpx.AsyncClient is bound to the event loop it was created on, so keep one per loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+class _Attempt(NamedTuple):
+    """Flow step: send one attempt of an API request; the transport answers with a _Reply."""
+
+    method: str
+    url: str
+    body: dict | None = None
+
+
+class _Reply(NamedTuple):
+    status_code: int | None  # None when the connection failed
+    headers: Mapping[str, str]
+    text: str
+    error: Exception | None = None
+
+
+class _Sleep(NamedTuple):
+    """Flow step: wait before retrying."""
+
+    seconds: float
+
+
+class _Parallel(NamedTuple):
+    """Flow step: run flows concurrently, at most `workers` at a time; answered with their results in order."""
+
+    flows: list[Generator]
+    workers: int
+
+
+Flow = Generator[_Attempt | _Sleep | _Parallel, any, T]
+
+
+def _http_settings() -> dict[str, any]:
+    """HTTP client settings shared by the sync and async transports."""
+    return {
+        "pool_size": int(os.environ.get("FINANCIAL_DATASETS_POOL_SIZE", "16")),
+        "timeout": float(os.environ.get("FINANCIAL_DATASETS_TIMEOUT", "30")),
+        "max_retries": int(os.environ.get("FINANCIAL_DATASETS_MAX_RETRIES", "5")),
+        "backoff_factor": float(os.environ.get("FINANCIAL_DATASETS_BACKOFF_FACTOR", "0.5")),
+    }
+
+
+def _api_headers() -> dict[str, str]:
+    """Request headers for the financial data API."""
+    headers = {}
+    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
+        headers["X-API-KEY"] = api_key
+    return headers
+
+
+def _create_session() -> requests.Session:
+    """
+    Create a pooled session with keep-alive.
+
+    Configured through FINANCIAL_DATASETS_POOL_SIZE. Retries are left to the request flow
+    rather than to urllib3, so that every attempt goes through the rate limiter.
+    """
+    pool_size = _http_settings()["pool_size"]
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_session() -> requests.Session:
+    """Get the shared HTTP session."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session()
+    return _session
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the pooled async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        settings = _http_settings()
+        client = httpx.AsyncClient(
+            timeout=settings["timeout"],
+            limits=httpx.Limits(max_connections=settings["pool_size"], max_keepalive_connections=settings["pool_size"]),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def aclose_client():
+    """Close the async client of the running event loop, if one was created."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _run_requests(flow: Flow[T]) -> T:
+    """Carry out a flow through the shared session, running parallel flows on worker threads."""
+    value = None
+    while True:
+        try:
+            step = flow.send(value)
+        except StopIteration as done:
+            return done.value
+        if isinstance(step, _Attempt):
+            value = _send_attempt(step)
+        elif isinstance(step, _Sleep):
+            time.sleep(step.seconds)
+            value = None
+        else:
+            with ThreadPoolExecutor(max_workers=min(step.workers, len(step.flows))) as executor:
+                value = list(executor.map(_run_requests, step.flows))
+
+
+async def _arun_requests(flow: Flow[T]) -> T:
+    """Carry out a flow through the event loop's client, running parallel flows as tasks."""
+    value = None
+    while True:
+        try:
+            step = flow.send(value)
+        except StopIteration as done:
+            return done.value
+        if isinstance(step, _Attempt):
+            value = await _asend_attempt(step)
+        elif isinstance(step, _Sleep):
+            await asyncio.sleep(step.seconds)
+            value = None
+        else:
+            semaphore = asyncio.Semaphore(step.workers)
+
+            async def run(flow: Flow) -> any:
+                async with semaphore:
+                    return await _arun_requests(flow)
+
+            value = list(await asyncio.gather(*(run(flow) for flow in step.flows)))
+
+
+def _send_attempt(attempt: _Attempt) -> _Reply:
+    endpoint = endpoint_name(attempt.url)
+    get_rate_limiter().acquire(endpoint)
+    started = time.perf_counter()
+    try:
+        response = _get_session().request(attempt.method, attempt.url, headers=_api_headers(), json=attempt.body, timeout=_http_settings()["timeout"])
+    except (requests.ConnectionError, requests.Timeout) as e:
+        get_data_metrics().record_request(endpoint, time.perf_counter() - started, 0, None)
+        return _Reply(None, {}, "", e)
+    get_data_metrics().record_request(endpoint, time.perf_counter() - started, len(response.content), response.status_code)
+    return _Reply(response.status_code, response.headers, response.text)
+
+
+async def _asend_attempt(attempt: _Attempt) -> _Reply:
+    endpoint = endpoint_name(attempt.url)
+    await get_rate_limiter().aacquire(endpoint)
+    started = time.perf_counter()
+    try:
+        response = await _get_client().request(attempt.method, attempt.url, headers=_api_headers(), json=attempt.body)
+    except httpx.TransportError as e:
+        get_data_metrics().record_request(endpoint, time.perf_counter() - started, 0, None)
+        return _Reply(None, {}, "", e)
+    get_data_metrics().record_request(endpoint, time.perf_counter() - started, len(response.content), response.status_code)
+    return _Reply(response.status_code, response.headers, response.text)
+
+
+def _retry_delay(headers: Mapping[str, str] | None, attempt: int, backoff_factor: float) -> float:
+    """Honour Retry-After when the server sends it, otherwise back off exponentially."""
+    if headers is not None and (retry_after := headers.get("Retry-After")):
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+    return backoff_factor * (2**attempt)
+
+
+def _exchange(method: str, url: str, body: dict | None = None) -> Flow[_Reply]:
+    """
+    Send a request, retrying rate limits, transient errors and dropped connections, or replay a recorded one.
+
+    Each attempt waits for the endpoint's rate limit, and FINANCIAL_DATASETS_MAX_RETRIES and
+    FINANCIAL_DATASETS_BACKOFF_FACTOR set the retries and their exponential backoff.
+    """
+    mode = get_data_mode()
+    if mode == "replay":
+        fixture = get_fixture_store().load(method, url, body) or {"status_code": 404, "text": f"No recorded response for {method} {url}"}
+        return _Reply(fixture["status_code"], {}, fixture["text"])
+    settings = _http_settings()
+    for attempt in range(settings["max_retries"] + 1):
+        reply = yield _Attempt(method, url, body)
+        if attempt == settings["max_retries"] or (reply.error is None and reply.status_code not in RETRY_STATUS_CODES):
+            break
+        yield _Sleep(_retry_delay(reply.headers, attempt, settings["backoff_factor"]))
+    if reply.error is not None:
+        raise reply.error
+    if mode == "record" and reply.status_code not in RETRY_STATUS_CODES:
+        get_fixture_store().save(method, url, body, reply.status_code, reply.text)
+    return reply
+
+
+def _fetch_json(ticker: str, method: str, url: str, body: dict | None = None) -> Flow[dict]:
+    """Return the JSON body of a successful response, raising DataAPIError otherwise."""
+    reply = yield from _exchange(method, url, body)
+    if reply.status_code != 200:
+        raise DataAPIError(reply.status_code, f"Error fetching data: {ticker} - {reply.status_code} - {reply.text}")
+    return json.loads(reply.text)
+
+
+def _prices_url(ticker: str, start_date: str, end_date: str) -> str:
+    return f"{API_BASE_URL}/prices/?ticker={ticker}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
+
+
+def _financial_metrics_url(ticker: str, end_date: str | None, period: str, limit: int) -> str:
+    url = f"{API_BASE_URL}/financial-metrics/?ticker={ticker}"
+    if end_date:
+        url += f"&report_period_lte={end_date}"
+    return url + f"&limit={limit}&period={period}"
+
+
+LINE_ITEMS_URL = f"{API_BASE_URL}/financials/search/line-items"
+
+
+def _line_items_body(ticker: str, line_items: list[str], end_date: str | None, period: str, limit: int) -> dict[str, any]:
+    body = {
+        "tickers": [ticker],
+        "line_items": line_items,
+        "period": period,
+        "limit": limit,
+    }
+    if end_date:
+        body["end_date"] = end_date
+    return body
+
+
+def _insider_trades_url(ticker: str, end_date: str, start_date: str | None, limit: int) -> str:
+    url = f"{API_BASE_URL}/insider-trades/?ticker={ticker}&filing_date_lte={end_date}"
+    if start_date:
+        url += f"&filing_date_gte={start_date}"
+    return url + f"&limit={limit}"
+
+
+def _company_news_url(ticker: str, end_date: str, start_date: str | None, limit: int) -> str:
+    url = f"{API_BASE_URL}/news/?ticker={ticker}&end_date={end_date}"
+    if start_date:
+        url += f"&start_date={start_date}"
+    return url + f"&limit={limit}"
+
+
+def _company_facts_url(ticker: str) -> str:
+    return f"{API_BASE_URL}/company/facts/?ticker={ticker}"
+
+
+def _prices_flow(ticker: str, start_date: str, end_date: str) -> Flow[list[Price]]:
+    data = yield from _fetch_json(ticker, "GET", _prices_url(ticker, start_date, end_date))
+    return PriceResponse(**data).prices
+
+
+def _financial_metrics_flow(ticker: str, end_date: str | None, period: str, limit: int) -> Flow[list[FinancialMetrics]]:
+    data = yield from _fetch_json(ticker, "GET", _financial_metrics_url(ticker, end_date, period, limit))
+    return FinancialMetricsResponse(**data).financial_metrics
+
+
+def _line_items_flow(ticker: str, line_items: list[str], end_date: str | None, period: str, limit: int) -> Flow[list[LineItem]]:
+    data = yield from _fetch_json(ticker, "POST", LINE_ITEMS_URL, _line_items_body(ticker, line_items, end_date, period, limit))
+    return LineItemResponse(**data).search_results[:limit]
+
+
+def _insider_trades_flow(ticker: str, end_date: str, start_date: str | None, limit: int) -> Flow[list[InsiderTrade]]:
+    def fetch_page(page_end_date: str, page_start_date: str | None) -> Flow[list[InsiderTrade]]:
+        data = yield from _fetch_json(ticker, "GET", _insider_trades_url(ticker, page_end_date, page_start_date, limit))
+        return InsiderTradeResponse(**data).insider_trades
+
+    return (yield from _paginate(fetch_page, "filing_date", end_date, start_date, limit))
+
+
+def _company_news_flow(ticker: str, end_date: str, start_date: str | None, limit: int) -> Flow[list[CompanyNews]]:
+    def fetch_page(page_end_date: str, page_start_date: str | None) -> Flow[list[CompanyNews]]:
+        data = yield from _fetch_json(ticker, "GET", _company_news_url(ticker, page_end_date, page_start_date, limit))
+        return CompanyNewsResponse(**data).news
+
+    return (yield from _paginate(fetch_page, "date", end_date, start_date, limit))
+
+
+def _company_facts_flow(ticker: str) -> Flow[CompanyFacts]:
+    data = yield from _fetch_json(ticker, "GET", _company_facts_url(ticker))
+    return CompanyFactsResponse(**data).company_facts
+
+
+def _next_page_end_date(page_dates: list[str], start_date: str | None, limit: int) -> str | None:
+    """Return the end date of the next page when paging backwards, or None when done."""
+    # Only continue pagination if we have a start_date and got a full page
+    if not page_dates or not start_date or len(page_dates) < limit:
+        return None
+
+    # Continue from the oldest date of the current page
+    next_end_date = min(page_dates).split("T")[0]
+
+    # If we've reached or passed the start_date, we can stop
+    if next_end_date <= start_date:
+        return None
+    return next_end_date
+
+
+def _page_workers() -> int:
+    """Concurrent shard fetches per paginated request (FINANCIAL_DATASETS_PAGE_WORKERS, 1 pages serially)."""
+    return int(os.environ.get("FINANCIAL_DATASETS_PAGE_WORKERS", "4"))
+
+
+def _days_between(start_date: str, end_date: str) -> int:
+    """Number of days in the inclusive window [start_date, end_date]."""
+    return (datetime.date.fromisoformat(end_date[:10]) - datetime.date.fromisoformat(start_date[:10])).days + 1
+
+
+def _page_density(dates: list[str], start_date: str, end_date: str) -> float:
+    """Records per day in a window."""
+    return len(dates) / max(1, _days_between(start_date, end_date))
+
+
+def _shard_window(start_date: str, end_date: str, density: float, limit: int) -> list[tuple[str, str]]:
+    """Split [start_date, end_date] into at most MAX_SHARDS adjacent windows expected to hold about SHARD_PAGE_FILL pages each, newest first."""
+    total_days = _days_between(start_date, end_date)
+    shard_days = max(1, int(limit * SHARD_PAGE_FILL / density)) if density > 0 else total_days
+    shard_days = max(shard_days, -(-total_days // MAX_SHARDS))
+    start = datetime.date.fromisoformat(start_date)
+    shard_end = datetime.date.fromisoformat(end_date)
+    shards = []
+    while shard_end >= start:
+        shard_start = max(start, shard_end - datetime.timedelta(days=shard_days - 1))
+        shards.append((shard_start.isoformat(), shard_end.isoformat()))
+        shard_end = shard_start - datetime.timedelta(days=1)
+    return shards
+
+
+def _merge_pages(pages: list[list], date_field: str) -> list:
+    """Combine pages into one newest-first list without the records repeated across page boundaries."""
+    seen = set()
+    merged = []
+    for record in (record for page in pages for record in page):
+        key = tuple(record.model_dump().values())
+        if key not in seen:
+            seen.add(key)
+            merged.append(record)
+    merged.sort(key=lambda record: getattr(record, date_field), reverse=True)
+    return merged
+
+
+def _paginate(
+    fetch_page: Callable[[str, str | None], Flow[list]],
+    date_field: str,
+    end_date: str,
+    start_date: str | None,
+    limit: int,
+) -> Flow[list]:
+    """
+    Fetch every record in [start_date, end_date], paging backwards from end_date.
+
+    With a start_date and more than one page worker, a window that does not fit on the first
+    page is split into date shards fetched concurrently, sized from the density of that page,
+    and each shard keeps paging on its own if it was too small. The shards depend only on the
+    request and its first page, so a replay sends exactly the recorded requests.
+    """
+
+    def page_through(window_start: str | None, window_end: str) -> Flow[list]:
+        records = []
+        current_end_date = window_end
+        while current_end_date:
+            page = yield from fetch_page(current_end_date, window_start)
+            records.extend(page)
+            current_end_date = _next_page_end_date([getattr(record, date_field) for record in page], window_start, limit)
+        return records
+
+    workers = _page_workers()
+    if not start_date or workers <= 1:
+        return (yield from page_through(start_date, end_date))
+
+    first_page = yield from fetch_page(end_date, start_date)
+    dates = [getattr(record, date_field) for record in first_page]
+    remaining_end_date = _next_page_end_date(dates, start_date, limit)
+    if remaining_end_date is None:
+        return first_page
+
+    shards = _shard_window(start_date, remaining_end_date, _page_density(dates, remaining_end_date, end_date), limit)
+    pages = yield _Parallel([page_through(*shard) for shard in shards], workers)
+    return _merge_pages([first_page, *pages], date_field)
+
+
+class FinancialDatasetsProvider(DataProvider):
+    """The financialdatasets.ai HTTP API, with pooled connections, retries and record/replay."""
+
+    def get_prices(self, ticker: str, start_date: str, end_date: str) -> list[Price]:
+        return _run_requests(_prices_flow(ticker, start_date, end_date))
+
+    def get_financial_metrics(self, ticker: str, end_date: str | None, period: str, limit: int) -> list[FinancialMetrics]:
+        return _run_requests(_financial_metrics_flow(ticker, end_date, period, limit))
+
+    def search_line_items(self, ticker: str, line_items: list[str], end_date: str | None, period: str, limit: int) -> list[LineItem]:
+        return _run_requests(_line_items_flow(ticker, line_items, end_date, period, limit))
+
+    def get_insider_trades(self, ticker: str, end_date: str, start_date: str | None, limit: int) -> list[InsiderTrade]:
+        return _run_requests(_insider_trades_flow(ticker, end_date, start_date, limit))
+
+    def get_company_news(self, ticker: str, end_date: str, start_date: str | None, limit: int) -> list[CompanyNews]:
+        return _run_requests(_company_news_flow(ticker, end_date, start_date, limit))
+
+    def get_company_facts(self, ticker: str) -> CompanyFacts:
+        return _run_requests(_company_facts_flow(ticker))
+
+    async def aget_prices(self, ticker: str, start_date: str, end_date: str) -> list[Price]:
+        return await _arun_requests(_prices_flow(ticker, start_date, end_date))
+
+    async def aget_financial_metrics(self, ticker: str, end_date: str | None, period: str, limit: int) -> list[FinancialMetrics]:
+        return await _arun_requests(_financial_metrics_flow(ticker, end_date, period, limit))
+
+    async def asearch_line_items(self, ticker: str, line_items: list[str], end_date: str | None, period: str, limit: int) -> list[LineItem]:
+        return await _arun_requests(_line_items_flow(ticker, line_items, end_date, period, limit))
+
+    async def aget_insider_trades(self, ticker: str, end_date: str, start_date: str | None, limit: int) -> list[InsiderTrade]:
+        return await _arun_requests(_insider_trades_flow(ticker, end_date, start_date, limit))
+
+    async def aget_company_news(self, ticker: str, end_date: str, start_date: str | None, limit: int) -> list[CompanyNews]:
+        return await _arun_requests(_company_news_flow(ticker, end_date, start_date, limit))
+
+    async def aget_company_facts(self, ticker: str) -> CompanyFacts:
+        return await _arun_requests(_company_facts_flow(ticker))
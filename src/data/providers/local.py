@@ -0,0 +1,140 @@
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from src.data.models import CompanyFacts, CompanyNews, FinancialMetrics, InsiderTrade, LineItem, Price
+from src.data.providers.base import DataAPIError, DataProvider
+
+# Column each dataset is filtered and ordered by
+DATE_COLUMNS = {
+    "prices": "time",
+    "financial_metrics": "report_period",
+    "line_items": "report_period",
+    "insider_trades": "filing_date",
+    "company_news": "date",
+    "company_facts": None,
+}
+
+FILE_FORMATS = (".parquet", ".csv")
+
+# Column holding the YYYY-MM-DD day of each row's date, computed once when a file is loaded
+DAY_COLUMN = "_day"
+
+# CSV columns that must stay strings even when they look numeric
+CSV_STRING_COLUMNS = {"ticker": str, "period": str, "currency": str, "cik": str, "sic_code": str}
+
+
+class LocalFileProvider(DataProvider):
+    """
+    Financial data read from bulk Parquet or CSV files in a directory.
+
+    Each dataset (prices, financial_metrics, line_items, insider_trades, company_news,
+    company_facts) is either one file for all tickers with a `ticker` column, e.g.
+    prices.parquet, or a directory of per-ticker files, e.g. prices/AAPL.csv. Columns use the
+    field names of the matching models in src.data.models; line_items holds one column per
+    line item. Each file is read into memory once, on first use, and kept as per-ticker tables
+    sorted by date, so date windows are found by binary search.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory).expanduser()
+        self._lock = threading.Lock()
+        # dataset -> {ticker: rows sorted by date}
+        self._tables: dict[str, dict[str, pd.DataFrame]] = {}
+
+    def get_prices(self, ticker: str, start_date: str, end_date: str) -> list[Price]:
+        return _to_models(Price, _between(self._rows("prices", ticker), start_date, end_date))
+
+    def get_financial_metrics(self, ticker: str, end_date: str | None, period: str, limit: int) -> list[FinancialMetrics]:
+        return _to_models(FinancialMetrics, self._reports("financial_metrics", ticker, end_date, period, limit))
+
+    def search_line_items(self, ticker: str, line_items: list[str], end_date: str | None, period: str, limit: int) -> list[LineItem]:
+        rows = self._reports("line_items", ticker, end_date, period, limit)
+        # Fields missing from the files come back as None, as the API does for unreported items
+        rows = rows.reindex(columns=["ticker", "report_period", "period", "currency", *line_items])
+        return _to_models(LineItem, rows)
+
+    def get_insider_trades(self, ticker: str, end_date: str, start_date: str | None, limit: int) -> list[InsiderTrade]:
+        return _to_models(InsiderTrade, self._events("insider_trades", ticker, end_date, start_date, limit))
+
+    def get_company_news(self, ticker: str, end_date: str, start_date: str | None, limit: int) -> list[CompanyNews]:
+        return _to_models(CompanyNews, self._events("company_news", ticker, end_date, start_date, limit))
+
+    def get_company_facts(self, ticker: str) -> CompanyFacts:
+        rows = self._rows("company_facts", ticker)
+        if rows.empty:
+            raise DataAPIError(404, f"No company facts for {ticker} in {self.directory}")
+        return _to_models(CompanyFacts, rows.head(1))[0]
+
+    def _reports(self, dataset: str, ticker: str, end_date: str | None, period: str, limit: int) -> pd.DataFrame:
+        rows = self._rows(dataset, ticker)
+        if end_date:
+            rows = _between(rows, None, end_date)
+        return rows[rows["period"] == period].iloc[::-1].head(limit)
+
+    def _events(self, dataset: str, ticker: str, end_date: str, start_date: str | None, limit: int) -> pd.DataFrame:
+        rows = _between(self._rows(dataset, ticker), start_date, end_date)
+        if start_date:
+            # Like the paginated API, a start_date returns the whole window
+            return rows.iloc[::-1]
+        return rows.iloc[::-1].head(limit)
+
+    def _rows(self, dataset: str, ticker: str) -> pd.DataFrame:
+        """Rows of one ticker sorted by date, oldest first (empty when the ticker is unknown)."""
+        with self._lock:
+            if dataset not in self._tables:
+                self._tables[dataset] = {}
+                if (path := self._find_file(self.directory / dataset)) is not None:
+                    table = _prepare(_read(path), dataset)
+                    self._tables[dataset] = {str(t): rows.reset_index(drop=True) for t, rows in table.groupby("ticker", sort=False)}
+            tables = self._tables[dataset]
+            if ticker not in tables and (path := self._find_file(self.directory / dataset / ticker)) is not None:
+                tables[ticker] = _prepare(_read(path), dataset, ticker)
+        return tables.get(ticker, _empty(dataset))
+
+    @staticmethod
+    def _find_file(stem: Path) -> Path | None:
+        for suffix in FILE_FORMATS:
+            if (path := stem.with_name(stem.name + suffix)).is_file():
+                return path
+        return None
+
+
+def _read(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path, memory_map=True)
+    return pd.read_csv(path, memory_map=True, dtype=CSV_STRING_COLUMNS)
+
+
+def _prepare(df: pd.DataFrame, dataset: str, ticker: str | None = None) -> pd.DataFrame:
+    """Normalize a loaded table: ticker column, ISO date strings and their days, sorted by date."""
+    if ticker is not None and "ticker" not in df.columns:
+        df = df.assign(ticker=ticker)
+    if (date_column := DATE_COLUMNS[dataset]) is not None:
+        if pd.api.types.is_datetime64_any_dtype(df[date_column]):
+            df[date_column] = df[date_column].dt.strftime("%Y-%m-%dT%H:%M:%S")
+        df[date_column] = df[date_column].astype(str)
+        df[DAY_COLUMN] = df[date_column].str[:10]
+        df = df.sort_values(date_column, kind="stable")
+    return df
+
+
+def _between(rows: pd.DataFrame, start_date: str | None, end_date: str) -> pd.DataFrame:
+    """Rows whose day falls within [start_date, end_date] (no lower bound without start_date)."""
+    days = rows[DAY_COLUMN]
+    start = days.searchsorted(start_date, side="left") if start_date else 0
+    return rows.iloc[start : days.searchsorted(end_date, side="right")]
+
+
+def _empty(dataset: str) -> pd.DataFrame:
+    date_columns = [DATE_COLUMNS[dataset], DAY_COLUMN] if DATE_COLUMNS[dataset] else []
+    return pd.DataFrame(columns=["ticker", "period", *date_columns], dtype=str)
+
+
+def _to_models(model: type, rows: pd.DataFrame) -> list:
+    """Validate rows into models, mapping missing values (NaN) and missing columns to None."""
+    if model.model_config.get("extra") != "allow":
+        rows = rows.reindex(columns=list(model.model_fields))
+    records = rows.astype(object).where(rows.notna(), None).to_dict("records")
+    return [model(**record) for record in records]
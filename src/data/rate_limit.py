@@ -0,0 +1,214 @@
+"""Client-side rate limiting of financial data API requests.
+
+Every endpoint gets a token bucket: tokens refill at a fixed rate up to a burst size and each
+request takes one, waiting in line when the bucket is empty. Smoothing requests this way keeps
+throughput at the provider's limit instead of alternating between bursts and 429 responses.
+
+FINANCIAL_DATASETS_RATE_LIMIT sets the requests per second of every endpoint (unset or 0: no
+limit) and FINANCIAL_DATASETS_RATE_LIMIT_<ENDPOINT> overrides one endpoint, e.g.
+FINANCIAL_DATASETS_RATE_LIMIT_PRICES, FINANCIAL_DATASETS_RATE_LIMIT_LINE_ITEMS or
+FINANCIAL_DATASETS_RATE_LIMIT_COMPANY_FACTS. Every attempt of a request takes a token, retries included.
+FINANCIAL_DATASETS_RATE_BURST sets the bucket size (default: one second of requests).
+FINANCIAL_DATASETS_RATE_LIMIT_DB names a SQLite file holding the buckets, so that processes
+sharing an API key (backtests, the API server, CLI runs) also share its limit.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Token bucket shared by the threads of one process."""
+
+    def __init__(self, rate: float, burst: float | None = None):
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return 0, or return the seconds until one is available without taking it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+
+class SQLiteTokenBucket(TokenBucket):
+    """Token bucket stored in a SQLite file, shared by every process using the file."""
+
+    def __init__(self, path: str | Path, name: str, rate: float, burst: float | None = None):
+        super().__init__(rate, burst)
+        self.path = Path(path).expanduser()
+        self.name = name
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None leaves transactions to the explicit BEGIN IMMEDIATE below
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS token_buckets (name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)")
+
+    def reserve(self) -> float:
+        with self._lock:
+            # BEGIN IMMEDIATE takes the file's write lock, so the read-modify-write is atomic across processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._conn.execute("SELECT tokens, updated_at FROM token_buckets WHERE name = ?", (self.name,)).fetchone()
+                tokens = self.burst if row is None else min(self.burst, row[0] + max(0.0, now - row[1]) * self.rate)
+                wait = 0.0
+                if tokens >= 1:
+                    tokens -= 1
+                else:
+                    wait = (1 - tokens) / self.rate
+                self._conn.execute("INSERT OR REPLACE INTO token_buckets (name, tokens, updated_at) VALUES (?, ?, ?)", (self.name, tokens, now))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return wait
+
+
+class RateLimiter:
+    """Token buckets per endpoint, with queue-wait statistics."""
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        endpoint_rates: dict[str, float] | None = None,
+        burst: float | None = None,
+        db_path: str | Path | None = None,
+    ):
+        self.rate = rate
+        self.endpoint_rates = endpoint_rates or {}
+        self.burst = burst
+        self.db_path = db_path
+        self._buckets: dict[str, TokenBucket | None] = {}
+        self._stats: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, endpoint: str) -> TokenBucket | None:
+        with self._lock:
+            if endpoint not in self._buckets:
+                rate = self.endpoint_rates.get(endpoint, self.rate)
+                if not rate:
+                    self._buckets[endpoint] = None
+                elif self.db_path:
+                    self._buckets[endpoint] = SQLiteTokenBucket(self.db_path, endpoint, rate, self.burst)
+                else:
+                    self._buckets[endpoint] = TokenBucket(rate, self.burst)
+            return self._buckets[endpoint]
+
+    def acquire(self, endpoint: str) -> float:
+        """Wait for a request slot on an endpoint and return the seconds spent waiting."""
+        if (bucket := self._bucket(endpoint)) is None:
+            return 0.0
+        if (wait := bucket.reserve()) == 0:
+            return self._record(endpoint, 0.0)
+        started = time.monotonic()
+        while wait > 0:
+            time.sleep(wait)
+            wait = bucket.reserve()
+        return self._record(endpoint, time.monotonic() - started)
+
+    async def aacquire(self, endpoint: str) -> float:
+        """Async variant of acquire that waits without blocking the event loop."""
+        if (bucket := self._bucket(endpoint)) is None:
+            return 0.0
+        if (wait := bucket.reserve()) == 0:
+            return self._record(endpoint, 0.0)
+        started = time.monotonic()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = bucket.reserve()
+        return self._record(endpoint, time.monotonic() - started)
+
+    def _record(self, endpoint: str, waited: float) -> float:
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, {"requests": 0, "queued": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0})
+            stats["requests"] += 1
+            stats["queued"] += waited > 0
+            stats["wait_seconds"] += waited
+            stats["max_wait_seconds"] = max(stats["max_wait_seconds"], waited)
+        for listener in list(_wait_listeners):
+            listener(endpoint, waited)
+        return waited
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Per endpoint: requests, how many had to queue, total and longest wait in seconds."""
+        with self._lock:
+            return {endpoint: dict(stats) for endpoint, stats in self._stats.items()}
+
+
+# Endpoint of each API path; FINANCIAL_DATASETS_RATE_LIMIT_<ENDPOINT> uses the upper-cased name with underscores
+ENDPOINTS = {
+    "prices": "prices",
+    "financial-metrics": "financial-metrics",
+    "financials/search/line-items": "line-items",
+    "insider-trades": "insider-trades",
+    "news": "news",
+    "company/facts": "company-facts",
+}
+
+# Callbacks receiving (endpoint, seconds waited) for every rate limited request
+_wait_listeners: list[Callable[[str, float], None]] = []
+
+_rate_limiter: RateLimiter | None = None
+_rate_limiter_lock = threading.Lock()
+
+
+def add_wait_listener(listener: Callable[[str, float], None]) -> None:
+    """Report queue waits to a metrics collector."""
+    if listener not in _wait_listeners:
+        _wait_listeners.append(listener)
+
+
+def endpoint_name(url: str) -> str:
+    """The endpoint of a request URL, e.g. "prices", "line-items" or "company-facts"."""
+    path = urlparse(url).path.strip("/")
+    # Unknown paths are keyed on the whole path, so they never share a bucket with a known endpoint
+    return ENDPOINTS.get(path, path.replace("/", "-"))
+
+
+def create_rate_limiter_from_env() -> RateLimiter:
+    """Build the rate limiter configured through the environment."""
+    prefix = "FINANCIAL_DATASETS_RATE_LIMIT_"
+    endpoint_rates = {
+        name[len(prefix) :].lower().replace("_", "-"): float(value)
+        for name, value in os.environ.items()
+        if name.startswith(prefix) and name != prefix + "DB" and value
+    }
+    burst = os.environ.get("FINANCIAL_DATASETS_RATE_BURST")
+    return RateLimiter(
+        rate=float(os.environ.get("FINANCIAL_DATASETS_RATE_LIMIT") or 0),
+        endpoint_rates=endpoint_rates,
+        burst=float(burst) if burst else None,
+        db_path=os.environ.get("FINANCIAL_DATASETS_RATE_LIMIT_DB") or None,
+    )
+
+
+def get_rate_limiter() -> RateLimiter:
+    """The process-wide rate limiter, configured from the environment on first use."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = create_rate_limiter_from_env()
+    return _rate_limiter
+
+
+def set_rate_limiter(rate_limiter: RateLimiter | None) -> None:
+    """Replace the rate limiter; None rebuilds it from the environment on next use."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = rate_limiter
@@ -0,0 +1,70 @@
+"""Coverage bookkeeping for point-in-time datasets indexed by report_period.
+
+A window records that every report with start <= report_period <= end has been fetched,
+and whether the history below start is exhausted (complete). No report can have a period
+after the day it was fetched (fetched_at), so a window whose end reaches that day covers
+every later end date as well.
+"""
+
+import datetime
+
+
+def fetched_window(report_periods: list[str], end_date: str | None, fetch_limit: int) -> dict[str, any]:
+    """Describe the window covered by one API response requested with report_period <= end_date (None: the newest reports)."""
+    today = datetime.date.today().isoformat()
+    end = min(end_date, today) if end_date else today
+    return {
+        "start": min(report_periods) if report_periods else end,
+        "end": end,
+        "fetched_at": today,
+        # A short page means there is no older history to fetch
+        "complete": len(report_periods) < fetch_limit,
+    }
+
+
+def window_covers(window: dict[str, any] | None, report_periods: list[str], end_date: str, limit: int) -> bool:
+    """Check whether the newest `limit` reports up to end_date can be answered from the window."""
+    if not window or window["end"] < _covered_through(window, end_date):
+        return False
+    if window["complete"]:
+        return True
+    available = sum(1 for report_period in report_periods if window["start"] <= report_period <= end_date)
+    return available >= limit
+
+
+def next_fetch_end_date(window: dict[str, any] | None, end_date: str) -> str | None:
+    """
+    End date of the fetch that extends a window towards a request it does not cover.
+
+    A window that stops short of end_date is refreshed with the newest reports (None), so the
+    following requests of a backtest are answered from it; one that ends late enough but holds
+    too few reports is extended backwards from its oldest report.
+    """
+    if not window or window["end"] < _covered_through(window, end_date):
+        return None
+    return window["start"]
+
+
+def merge_windows(existing: dict[str, any] | None, new: dict[str, any]) -> dict[str, any]:
+    """Combine two windows when they overlap, otherwise keep the newly fetched one."""
+    if not existing or existing["start"] > new["end"] or new["start"] > existing["end"]:
+        return new
+    start = min(existing["start"], new["start"])
+    latest = max((existing, new), key=lambda window: (window["end"], window.get("fetched_at") or ""))
+    return {
+        "start": start,
+        "end": latest["end"],
+        "fetched_at": latest.get("fetched_at"),
+        "complete": any(window["complete"] for window in (existing, new) if window["start"] == start),
+    }
+
+
+def _covered_through(window: dict[str, any], end_date: str) -> str:
+    """The last report period a window must reach to answer end_date."""
+    today = datetime.date.today().isoformat()
+    fetched_at = window.get("fetched_at")
+    # Windows recorded before fetched_at was tracked only vouch for their end, and requests
+    # running up to today may pick up a report published since an earlier day's fetch
+    if fetched_at is None or (end_date >= today and fetched_at < today):
+        return end_date
+    return min(end_date, fetched_at)
@@ -0,0 +1,35 @@
+from pydantic import BaseModel
+
+
+class FinancialMetricsRequirement(BaseModel):
+    period: str = "ttm"
+    limit: int = 10
+
+
+class LineItemsRequirement(BaseModel):
+    line_items: list[str]
+    period: str = "ttm"
+    limit: int = 10
+
+
+class EventsRequirement(BaseModel):
+    """Insider trades or company news up to end_date."""
+
+    limit: int = 1000
+    lookback_days: int | None = None  # None requests without a start_date
+
+
+class DataRequirements(BaseModel):
+    """
+    Data an agent reads for each ticker, declared so it can be fetched before the agent runs.
+
+    Each agent module declares its requirements as DATA_REQUIREMENTS, and plan_prefetch
+    combines those of the selected analysts into the calls to make before a run.
+    """
+
+    financial_metrics: list[FinancialMetricsRequirement] = []
+    line_items: list[LineItemsRequirement] = []
+    market_cap: bool = False
+    insider_trades: list[EventsRequirement] = []
+    company_news: list[EventsRequirement] = []
+    prices: bool = False  # Prices over the run's [start_date, end_date]
@@ -0,0 +1,104 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class CacheStore:
+    """Interface for a persistent tier behind the in-memory Cache."""
+
+    def load(self, category: str, key: str) -> any:
+        """Load a cached value, or None if it has not been stored."""
+        raise NotImplementedError
+
+    def save(self, category: str, key: str, data: any, expires_at: float | None = None) -> None:
+        """Persist a cached value, replacing any previous one. Expired values are no longer loaded."""
+        raise NotImplementedError
+
+    def delete(self, category: str, key: str) -> None:
+        """Remove a cached value if present."""
+        raise NotImplementedError
+
+    def clear(self, category: str | None = None) -> None:
+        """Remove all values, or only the values of one category."""
+        raise NotImplementedError
+
+
+class SQLiteCacheStore(CacheStore):
+    """Persistent cache tier stored as JSON documents in a single SQLite file."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # One connection shared across threads, serialized by the lock above
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        # WAL lets several processes (CLI runs, uvicorn workers) read while one writes
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                category TEXT NOT NULL,
+                key TEXT NOT NULL,
+                data TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                expires_at REAL,
+                PRIMARY KEY (category, key)
+            )
+            """
+        )
+        # Cache files created before entries could expire lack the expires_at column
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(cache_entries)")}
+        if "expires_at" not in columns:
+            self._conn.execute("ALTER TABLE cache_entries ADD COLUMN expires_at REAL")
+        self._conn.commit()
+
+    def load(self, category: str, key: str) -> any:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM cache_entries WHERE category = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (category, key, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def save(self, category: str, key: str, data: any, expires_at: float | None = None) -> None:
+        payload = json.dumps(data, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (category, key, data, updated_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (category, key, payload, time.time(), expires_at),
+            )
+            self._conn.commit()
+
+    def delete(self, category: str, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries WHERE category = ? AND key = ?", (category, key))
+            self._conn.commit()
+
+    def clear(self, category: str | None = None) -> None:
+        with self._lock:
+            if category is None:
+                self._conn.execute("DELETE FROM cache_entries")
+            else:
+                self._conn.execute("DELETE FROM cache_entries WHERE category = ?", (category,))
+            self._conn.commit()
+
+
+def create_store_from_env() -> CacheStore | None:
+    """
+    Build the persistent cache tier configured through the environment.
+
+    HEDGE_FUND_CACHE_DIR enables persistence and selects the directory holding the cache file.
+    HEDGE_FUND_CACHE_BACKEND selects the backend ("sqlite" by default, "memory" disables persistence).
+    """
+    cache_dir = os.environ.get("HEDGE_FUND_CACHE_DIR")
+    backend = os.environ.get("HEDGE_FUND_CACHE_BACKEND", "sqlite").lower()
+    if not cache_dir or backend == "memory":
+        return None
+    if backend == "sqlite":
+        return SQLiteCacheStore(Path(cache_dir).expanduser() / "financial_data.sqlite")
+    raise ValueError(f"Unknown cache backend: {backend}")
@@ -0,0 +1,126 @@
+"""Cache of structured LLM responses keyed by a fingerprint of the request.
+
+A response is reused when the model, provider, rendered prompt messages and output schema are
+all identical, which is the case when a backtest or a web UI run is repeated with unchanged data.
+Responses live in memory and, when HEDGE_FUND_LLM_CACHE_DIR (or else HEDGE_FUND_CACHE_DIR) is
+set, in a SQLite file there so they survive restarts. HEDGE_FUND_LLM_CACHE_TTL sets their expiry
+in seconds (default one week, 0 for none) and HEDGE_FUND_LLM_CACHE=0 turns the cache off;
+call_llm(use_cache=False) bypasses it for a single call.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from src.data.lru import LRUCache
+from src.data.store import CacheStore, SQLiteCacheStore
+
+DEFAULT_TTL = 7 * 24 * 3600
+
+# In-memory budget; override with HEDGE_FUND_LLM_CACHE_MAX_MB (0 for no limit)
+DEFAULT_MEMORY_BUDGET_MB = 16
+
+STORE_CATEGORY = "llm_responses"
+
+
+def render_messages(prompt: any) -> list[list[str]] | str:
+    """The prompt as (role, content) pairs, or as is when it is a plain string."""
+    if hasattr(prompt, "to_messages"):
+        prompt = prompt.to_messages()
+    if isinstance(prompt, list):
+        return [[getattr(message, "type", ""), str(getattr(message, "content", message))] for message in prompt]
+    return str(prompt)
+
+
+def response_fingerprint(model_name: str, model_provider: str, prompt: any, pydantic_model: type[BaseModel]) -> str:
+    """SHA-256 of the model, provider, rendered messages and output schema."""
+    payload = {
+        "model_name": model_name,
+        "model_provider": str(getattr(model_provider, "value", model_provider)),
+        "messages": render_messages(prompt),
+        "schema": pydantic_model.model_json_schema(),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """Structured responses in an LRU memory tier in front of an optional persistent store."""
+
+    def __init__(self, store: CacheStore | None = None, ttl: float | None = DEFAULT_TTL, max_bytes: int | None = None, enabled: bool = True):
+        self.store = store
+        self.ttl = ttl
+        self.enabled = enabled
+        self._memory = LRUCache(max_bytes=max_bytes, ttl=ttl)
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str, pydantic_model: type[BaseModel]) -> BaseModel | None:
+        """The cached response for a fingerprint, or None."""
+        if not self.enabled:
+            return None
+        data = self._memory.get(key)
+        if data is None and self.store is not None:
+            data = self.store.load(STORE_CATEGORY, key)
+            if data is not None:
+                self._memory.set(key, data)
+        with self._lock:
+            if data is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        # Stored as a dump rather than the object, so a changed schema fails validation instead of leaking through
+        return pydantic_model.model_validate(data) if data is not None else None
+
+    def set(self, key: str, response: BaseModel) -> None:
+        if not self.enabled:
+            return
+        data = response.model_dump(mode="json")
+        self._memory.set(key, data)
+        if self.store is not None:
+            self.store.save(STORE_CATEGORY, key, data, expires_at=time.time() + self.ttl if self.ttl else None)
+
+    def clear(self) -> None:
+        self._memory.clear()
+        if self.store is not None:
+            self.store.clear(STORE_CATEGORY)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses}
+
+
+def create_llm_cache_from_env() -> LLMResponseCache:
+    """Build the response cache configured through the environment."""
+    enabled = os.environ.get("HEDGE_FUND_LLM_CACHE", "1").lower() not in ("0", "false", "no")
+    ttl = float(os.environ.get("HEDGE_FUND_LLM_CACHE_TTL", DEFAULT_TTL)) or None
+    budget_mb = float(os.environ.get("HEDGE_FUND_LLM_CACHE_MAX_MB", DEFAULT_MEMORY_BUDGET_MB))
+    cache_dir = os.environ.get("HEDGE_FUND_LLM_CACHE_DIR") or os.environ.get("HEDGE_FUND_CACHE_DIR")
+    store = SQLiteCacheStore(Path(cache_dir).expanduser() / "llm_responses.sqlite") if enabled and cache_dir else None
+    return LLMResponseCache(store, ttl=ttl, max_bytes=int(budget_mb * 1024 * 1024) if budget_mb > 0 else None, enabled=enabled)
+
+
+_llm_cache: LLMResponseCache | None = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """The process-wide response cache, configured from the environment on first use."""
+    global _llm_cache
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = create_llm_cache_from_env()
+    return _llm_cache
+
+
+def set_llm_cache(llm_cache: LLMResponseCache | None) -> None:
+    """Replace the response cache; None rebuilds it from the environment on next use."""
+    global _llm_cache
+    with _llm_cache_lock:
+        _llm_cache = llm_cache
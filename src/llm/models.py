@@ -1,5 +1,6 @@
 import os
 import json
+import threading
 from langchain_anthropic import ChatAnthropic
 from langchain_deepseek import ChatDeepSeek
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -31,6 +32,9 @@ class LLMModel(BaseModel):
     display_name: str
     model_name: str
     provider: ModelProvider
+    # List prices in USD per million tokens, used for cost accounting; None when unknown
+    input_cost_per_million: float | None = None
+    output_cost_per_million: float | None = None
 
     def to_choice_tuple(self) -> Tuple[str, str, str]:
         """Convert to format needed for questionary choices"""
@@ -76,7 +80,9 @@ def load_models_from_json(json_path: str) -> List[LLMModel]:
             LLMModel(
                 display_name=model_data["display_name"],
                 model_name=model_data["model_name"],
-                provider=provider_enum
+                provider=provider_enum,
+                input_cost_per_million=model_data.get("input_cost_per_million"),
+                output_cost_per_million=model_data.get("output_cost_per_million"),
             )
         )
     return models
@@ -100,10 +106,13 @@ LLM_ORDER = [model.to_choice_tuple() for model in AVAILABLE_MODELS]
 OLLAMA_LLM_ORDER = [model.to_choice_tuple() for model in OLLAMA_MODELS]
 
 
+# Model information by (model_name, provider value)
+_MODEL_INDEX = {(model.model_name, model.provider.value): model for model in reversed(AVAILABLE_MODELS + OLLAMA_MODELS)}
+
+
 def get_model_info(model_name: str, model_provider: str) -> LLMModel | None:
     """Get model information by model_name"""
-    all_models = AVAILABLE_MODELS + OLLAMA_MODELS
-    return next((model for model in all_models if model.model_name == model_name and model.provider == model_provider), None)
+    return _MODEL_INDEX.get((model_name, getattr(model_provider, "value", model_provider)))
 
 
 def get_model(model_name: str, model_provider: ModelProvider) -> ChatOpenAI | ChatGroq | ChatOllama | None:
@@ -150,3 +159,37 @@ def get_model(model_name: str, model_provider: ModelProvider) -> ChatOpenAI | Ch
             model=model_name,
             base_url=base_url,
         )
+
+
+# Clients per (provider, model, output schema), where the schema is None for the plain chat model
+_clients: dict[tuple[str, str, type[BaseModel] | None], any] = {}
+_clients_lock = threading.RLock()
+
+
+def get_client(model_name: str, model_provider: ModelProvider | str, pydantic_model: type[BaseModel] | None = None):
+    """
+    Get the process-wide client for a model, built on first use.
+
+    With a pydantic_model, returns the chat model wrapped for JSON mode structured output, which
+    also returns the raw message so its token usage can be read.
+    Chat models are safe to share between threads, so every call reuses one client and its
+    HTTP connection pool instead of building a new one (and opening new connections) per call.
+    """
+    key = (getattr(model_provider, "value", model_provider), model_name, pydantic_model)
+    if (client := _clients.get(key)) is not None:
+        return client
+    with _clients_lock:
+        if (client := _clients.get(key)) is None:
+            if pydantic_model is None:
+                client = get_model(model_name, model_provider)
+            else:
+                client = get_client(model_name, model_provider).with_structured_output(pydantic_model, method="json_mode", include_raw=True)
+            if client is not None:
+                _clients[key] = client
+    return client
+
+
+def clear_clients() -> None:
+    """Drop the shared clients, e.g. after API keys changed; the next calls build new ones."""
+    with _clients_lock:
+        _clients.clear()
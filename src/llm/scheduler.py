@@ -0,0 +1,216 @@
+"""Provider-aware scheduling of LLM calls within requests-per-minute and tokens-per-minute budgets.
+
+Each provider gets a budget that refills continuously. A call reserves one request and its
+estimated tokens before it is sent, waiting in line until the budget allows it, and the estimate
+is corrected with the usage the provider reports. A rate limited (429) response pauses the
+provider's queue for its Retry-After or an exponential, jittered backoff, and the call is queued
+again rather than counted as a failed attempt, so throughput settles at the provider's ceiling.
+
+HEDGE_FUND_LLM_RPM and HEDGE_FUND_LLM_TPM set the budgets of every provider (unset or 0: no
+limit) and e.g. HEDGE_FUND_LLM_RPM_OPENAI or HEDGE_FUND_LLM_TPM_ANTHROPIC override one provider.
+HEDGE_FUND_LLM_MAX_QUEUE_SECONDS bounds the time a call keeps re-queueing after rate limits
+(default 600) before the error is handed to call_llm's retries.
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+
+from src.llm.cache import render_messages
+
+# Rough size of a token in characters, used to estimate prompts before they are sent
+CHARS_PER_TOKEN = 4
+
+# Tokens reserved for the completion until the provider reports the actual usage
+COMPLETION_TOKENS_ESTIMATE = 1000
+
+# Backoff after a 429 without Retry-After: BASE * 2**n seconds, at most MAX, with full jitter
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+
+
+def estimate_tokens(prompt: any) -> int:
+    """Estimated prompt and completion tokens of a call."""
+    messages = render_messages(prompt)
+    chars = len(messages) if isinstance(messages, str) else sum(len(content) for _, content in messages)
+    return chars // CHARS_PER_TOKEN + COMPLETION_TOKENS_ESTIMATE
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether a provider SDK error is a rate limit (HTTP 429 or a quota error)."""
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    return status == 429 or type(error).__name__ in ("RateLimitError", "ResourceExhausted", "TooManyRequests")
+
+
+def retry_after(error: Exception) -> float | None:
+    """The Retry-After of a rate limited response in seconds, if the error carries one."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class ProviderBudget:
+    """Requests and tokens per minute of one provider, each bucket refilling continuously."""
+
+    def __init__(self, rpm: float | None = None, tpm: float | None = None):
+        self.rpm = rpm or None
+        self.tpm = tpm or None
+        self._requests = self.rpm or 0.0
+        self._tokens = self.tpm or 0.0
+        self._paused_until = 0.0
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int) -> float:
+        """Take a request and `tokens` and return 0, or return the seconds to wait without taking them."""
+        with self._lock:
+            now = self._refill()
+            wait = max(0.0, self._paused_until - now)
+            if self.rpm and self._requests < 1:
+                wait = max(wait, (1 - self._requests) * 60 / self.rpm)
+            # A call larger than the whole budget waits for a full bucket rather than forever
+            needed = min(tokens, self.tpm) if self.tpm else 0
+            if self.tpm and self._tokens < needed:
+                wait = max(wait, (needed - self._tokens) * 60 / self.tpm)
+            if wait > 0:
+                return wait
+            self._requests -= 1
+            self._tokens -= tokens
+            return 0.0
+
+    def settle(self, estimated: int, used: int) -> None:
+        """Correct a reservation with the tokens the call actually used; overruns leave the bucket in debt."""
+        with self._lock:
+            self._refill()
+            if self.tpm:
+                self._tokens = min(self.tpm, self._tokens + estimated - used)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every call to the provider for `seconds`, e.g. after a 429."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _refill(self) -> float:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+        return now
+
+
+class LLMScheduler:
+    """Budgets per provider, with queue and rate limit statistics."""
+
+    def __init__(
+        self,
+        rpm: float | None = None,
+        tpm: float | None = None,
+        provider_rpm: dict[str, float] | None = None,
+        provider_tpm: dict[str, float] | None = None,
+        max_queue_seconds: float = 600.0,
+    ):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.provider_rpm = provider_rpm or {}
+        self.provider_tpm = provider_tpm or {}
+        self.max_queue_seconds = max_queue_seconds
+        self._budgets: dict[str, ProviderBudget] = {}
+        self._stats: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def budget(self, provider: str) -> ProviderBudget:
+        provider = _provider_key(provider)
+        with self._lock:
+            if provider not in self._budgets:
+                self._budgets[provider] = ProviderBudget(self.provider_rpm.get(provider, self.rpm), self.provider_tpm.get(provider, self.tpm))
+            return self._budgets[provider]
+
+    def acquire(self, provider: str, tokens: int) -> float:
+        """Wait until the provider's budget allows a call of `tokens` and return the seconds waited."""
+        budget = self.budget(provider)
+        started = time.monotonic()
+        while (wait := budget.reserve(tokens)) > 0:
+            time.sleep(wait)
+        return self._record(provider, "wait_seconds", time.monotonic() - started)
+
+    async def aacquire(self, provider: str, tokens: int) -> float:
+        """Async variant of acquire that waits without blocking the event loop."""
+        budget = self.budget(provider)
+        started = time.monotonic()
+        while (wait := budget.reserve(tokens)) > 0:
+            await asyncio.sleep(wait)
+        return self._record(provider, "wait_seconds", time.monotonic() - started)
+
+    def settle(self, provider: str, estimated: int, used: int | None) -> None:
+        if used is not None:
+            self.budget(provider).settle(estimated, used)
+
+    def backoff(self, provider: str, attempt: int, retry_after_seconds: float | None = None) -> float:
+        """Pause the provider after its `attempt`-th consecutive 429 and return the pause in seconds."""
+        if retry_after_seconds is not None:
+            # A little jitter so the queued calls do not all resume at the same instant
+            delay = retry_after_seconds + random.uniform(0, 1)
+        else:
+            delay = random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt))
+        self.budget(provider).pause(delay)
+        self._record(provider, "rate_limited", 1)
+        return delay
+
+    def _record(self, provider: str, name: str, value: float) -> float:
+        with self._lock:
+            stats = self._stats.setdefault(_provider_key(provider), {"calls": 0, "wait_seconds": 0.0, "rate_limited": 0})
+            stats["calls"] += name == "wait_seconds"
+            stats[name] += value
+        return value
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Per provider: calls scheduled, seconds spent queued and 429 responses."""
+        with self._lock:
+            return {provider: dict(stats) for provider, stats in self._stats.items()}
+
+
+def _provider_key(provider: any) -> str:
+    return str(getattr(provider, "value", provider)).upper()
+
+
+def create_llm_scheduler_from_env() -> LLMScheduler:
+    """Build the scheduler configured through the environment."""
+
+    def per_provider(prefix: str) -> dict[str, float]:
+        return {name[len(prefix) :]: float(value) for name, value in os.environ.items() if name.startswith(prefix) and value}
+
+    return LLMScheduler(
+        rpm=float(os.environ.get("HEDGE_FUND_LLM_RPM") or 0),
+        tpm=float(os.environ.get("HEDGE_FUND_LLM_TPM") or 0),
+        provider_rpm=per_provider("HEDGE_FUND_LLM_RPM_"),
+        provider_tpm=per_provider("HEDGE_FUND_LLM_TPM_"),
+        max_queue_seconds=float(os.environ.get("HEDGE_FUND_LLM_MAX_QUEUE_SECONDS", "600")),
+    )
+
+
+_llm_scheduler: LLMScheduler | None = None
+_llm_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """The process-wide scheduler, configured from the environment on first use."""
+    global _llm_scheduler
+    if _llm_scheduler is None:
+        with _llm_scheduler_lock:
+            if _llm_scheduler is None:
+                _llm_scheduler = create_llm_scheduler_from_env()
+    return _llm_scheduler
+
+
+def set_llm_scheduler(llm_scheduler: LLMScheduler | None) -> None:
+    """Replace the scheduler; None rebuilds it from the environment on next use."""
+    global _llm_scheduler
+    with _llm_scheduler_lock:
+        _llm_scheduler = llm_scheduler
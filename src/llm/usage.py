@@ -0,0 +1,89 @@
+"""Token, cost and latency accounting of LLM calls.
+
+call_llm and acall_llm record every call with its agent, ticker, model, prompt and completion
+tokens (as reported by the provider), cost, latency, retries, rate limit waits and whether it
+fell back to a default response. Calls are totalled per process (get_llm_usage) and per run,
+when the run's state metadata holds an LLMUsage under "llm_usage" as run_hedge_fund does.
+Listeners registered with add_usage_listener receive each call, which is how the backend's
+SystemMetrics collector exposes them.
+"""
+
+import threading
+from typing import Callable
+
+# Fields of a call record that are summed in totals
+TOTAL_FIELDS = ("prompt_tokens", "completion_tokens", "cost", "latency_seconds", "retries", "rate_limited")
+
+
+def call_cost(model_info, prompt_tokens: int, completion_tokens: int) -> float | None:
+    """Cost of a call in USD from the model's per-million-token prices, or None when they are unknown."""
+    if model_info is not None and model_info.is_ollama():
+        return 0.0
+    if model_info is None or model_info.input_cost_per_million is None or model_info.output_cost_per_million is None:
+        return None
+    return (prompt_tokens * model_info.input_cost_per_million + completion_tokens * model_info.output_cost_per_million) / 1_000_000
+
+
+def _empty_totals() -> dict[str, float]:
+    return {"calls": 0, "cached": 0, "fallbacks": 0, **{field: 0 for field in TOTAL_FIELDS}}
+
+
+def _add(totals: dict[str, float], call: dict[str, any]) -> None:
+    totals["calls"] += 1
+    totals["cached"] += call["cached"]
+    totals["fallbacks"] += call["fallback"]
+    for field in TOTAL_FIELDS:
+        totals[field] += call[field] or 0
+
+
+class LLMUsage:
+    """Thread-safe totals of LLM calls overall and per agent, ticker and model."""
+
+    def __init__(self):
+        self._totals = _empty_totals()
+        self._by: dict[str, dict[str, dict[str, float]]] = {"agent": {}, "ticker": {}, "model": {}}
+        self._lock = threading.Lock()
+
+    def record(self, call: dict[str, any]) -> None:
+        keys = {"agent": call["agent"], "ticker": call["ticker"], "model": f"{call['provider']}:{call['model']}"}
+        with self._lock:
+            _add(self._totals, call)
+            for dimension, key in keys.items():
+                if key is not None:
+                    _add(self._by[dimension].setdefault(key, _empty_totals()), call)
+
+    def summary(self) -> dict[str, any]:
+        """Totals with average latency: {"total": ..., "by_agent": {...}, "by_ticker": {...}, "by_model": {...}}."""
+        with self._lock:
+            summary = {"total": dict(self._totals), **{f"by_{dimension}": {key: dict(totals) for key, totals in groups.items()} for dimension, groups in self._by.items()}}
+        for totals in [summary["total"], *(totals for dimension in ("by_agent", "by_ticker", "by_model") for totals in summary[dimension].values())]:
+            # Cached responses take no time, so they are left out of the average
+            sent = totals["calls"] - totals["cached"]
+            totals["mean_latency_seconds"] = totals["latency_seconds"] / sent if sent else 0.0
+        return summary
+
+
+# Callbacks receiving every call record
+_usage_listeners: list[Callable[[dict[str, any]], None]] = []
+
+_llm_usage = LLMUsage()
+
+
+def add_usage_listener(listener: Callable[[dict[str, any]], None]) -> None:
+    """Report LLM calls to a metrics collector."""
+    if listener not in _usage_listeners:
+        _usage_listeners.append(listener)
+
+
+def get_llm_usage() -> LLMUsage:
+    """Totals of every LLM call made by this process."""
+    return _llm_usage
+
+
+def record_llm_call(call: dict[str, any], run_usage: LLMUsage | None = None) -> None:
+    """Add a call to the process totals, the run's totals if given, and the listeners."""
+    _llm_usage.record(call)
+    if run_usage is not None:
+        run_usage.record(call)
+    for listener in list(_usage_listeners):
+        listener(call)
@@ -6,13 +6,16 @@ from langgraph.graph import END, StateGraph
 from colorama import Fore, Style, init
 import questionary
 from src.agents.portfolio_manager import portfolio_management_agent
-from src.agents.risk_manager import risk_management_agent
+from src.agents.risk_manager import risk_management_agent, DATA_REQUIREMENTS as RISK_MANAGEMENT_DATA_REQUIREMENTS
 from src.graph.state import AgentState
 from src.utils.display import print_trading_output
-from src.utils.analysts import ANALYST_ORDER, get_analyst_nodes
+from src.utils.analysts import ANALYST_ORDER, get_analyst_data_requirements, get_analyst_nodes
 from src.utils.progress import progress
 from src.llm.models import LLM_ORDER, OLLAMA_LLM_ORDER, get_model_info, ModelProvider
+from src.llm.usage import LLMUsage
 from src.utils.ollama import ensure_ollama_and_model
+from src.tools.prefetch import create_prefetch_node
+from src.data.fixtures import DATA_MODES, set_data_mode
 
 import argparse
 from datetime import datetime
@@ -63,6 +66,8 @@ def run_hedge_fund(
         else:
             agent = app
 
+        # Tokens, cost and latency of this run's LLM calls, per agent, ticker and model
+        llm_usage = LLMUsage()
         final_state = agent.invoke(
             {
                 "messages": [
@@ -81,6 +86,7 @@ def run_hedge_fund(
                     "show_reasoning": show_reasoning,
                     "model_name": model_name,
                     "model_provider": model_provider,
+                    "llm_usage": llm_usage,
                 },
             },
         )
@@ -88,6 +94,7 @@ def run_hedge_fund(
         return {
             "decisions": parse_hedge_fund_response(final_state["messages"][-1].content),
             "analyst_signals": final_state["data"]["analyst_signals"],
+            "llm_usage": llm_usage.summary(),
         }
     finally:
         # Stop progress tracking
@@ -110,11 +117,17 @@ def create_workflow(selected_analysts=None):
     # Default to all analysts if none selected
     if selected_analysts is None:
         selected_analysts = list(analyst_nodes.keys())
+
+    # Fetch the data every selected analyst (and risk management) needs in one concurrent pass
+    requirements = get_analyst_data_requirements(selected_analysts) + [RISK_MANAGEMENT_DATA_REQUIREMENTS]
+    workflow.add_node("data_prefetch", create_prefetch_node(requirements))
+    workflow.add_edge("start_node", "data_prefetch")
+
     # Add selected analyst nodes
     for analyst_key in selected_analysts:
         node_name, node_func = analyst_nodes[analyst_key]
         workflow.add_node(node_name, node_func)
-        workflow.add_edge("start_node", node_name)
+        workflow.add_edge("data_prefetch", node_name)
 
     # Always add risk and portfolio management
     workflow.add_node("risk_management_agent", risk_management_agent)
@@ -146,8 +159,11 @@ if __name__ == "__main__":
     parser.add_argument("--show-reasoning", action="store_true", help="Show reasoning from each agent")
     parser.add_argument("--show-agent-graph", action="store_true", help="Show the agent graph")
     parser.add_argument("--ollama", action="store_true", help="Use Ollama for local LLM inference")
+    parser.add_argument("--data-mode", choices=DATA_MODES, help="Fetch live data, record API responses as fixtures, or replay recorded fixtures without network access")
+    parser.add_argument("--fixtures-dir", type=str, help="Directory of recorded API responses. Defaults to fixtures/financial_data")
 
     args = parser.parse_args()
+    set_data_mode(args.data_mode, args.fixtures_dir)
 
     # Parse tickers from comma-separated string
     tickers = [ticker.strip() for ticker in args.tickers.split(",")]
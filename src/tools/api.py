@@ -1,56 +1,153 @@
 import datetime
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Generator, NamedTuple, Sequence, TypeVar
 import pandas as pd
-import requests
 
 from src.data.cache import get_cache
+from src.data.date_ranges import missing_ranges
+from src.data.lru import LRUCache
+from src.data.metrics import get_data_metrics
+from src.data.price_series import PriceSeries
+from src.data.providers import DataAPIError, get_data_provider
+from src.data.report_periods import fetched_window, merge_windows, next_fetch_end_date, window_covers
 from src.data.models import (
+    CompanyFacts,
     CompanyNews,
-    CompanyNewsResponse,
     FinancialMetrics,
-    FinancialMetricsResponse,
     Price,
-    PriceResponse,
     LineItem,
-    LineItemResponse,
     InsiderTrade,
-    InsiderTradeResponse,
-    CompanyFactsResponse,
 )
+from src.tools.single_flight import AsyncSingleFlight, SingleFlight
+
+T = TypeVar("T")
 
 # Global cache instance
 _cache = get_cache()
 
+# Financial metrics are fetched with at least this many periods so that later requests with
+# other limits or earlier end dates are answered from the cached index
+FINANCIAL_METRICS_FETCH_LIMIT = 40
+
+# Same idea for line items, which agents request with limits of up to 10 periods
+LINE_ITEMS_FETCH_LIMIT = 20
+
+# Concurrent identical requests (e.g. parallel analysts missing the cache for the same ticker)
+# wait for a single provider call instead of each making their own
+_single_flight = SingleFlight()
+_async_single_flight = AsyncSingleFlight()
+
+# Days through which insider trades and news were recently fetched, per (category, ticker).
+# Today is only complete once it has passed, so windows ending today re-fetch just today's
+# events, at most once per HEDGE_FUND_CACHE_LIVE_TTL.
+_live_tails = LRUCache()
+
+
+class _Fetch(NamedTuple):
+    """A provider call a data function needs before it can answer from the cache."""
+
+    key: tuple  # Identical concurrent calls share one provider call
+    method: str  # DataProvider method; its async variant is "a" + method
+    args: tuple
+    store: Callable[[any], any]  # Caches the provider's result and returns what the data function receives
+
+
+# Each data function is written once as a generator that yields the provider calls it needs and
+# returns its result; _run_fetches and _arun_fetches make those calls for the sync and async variants
+Fetches = Generator[_Fetch, any, T]
+
+
+def _run_fetches(fetches: Fetches[T]) -> T:
+    send, value = fetches.send, None
+    while True:
+        try:
+            fetch = send(value)
+        except StopIteration as done:
+            return done.value
+        try:
+            send, value = fetches.send, _single_flight.do(fetch.key, partial(_call_provider, fetch))
+        except DataAPIError as e:
+            send, value = fetches.throw, e
+
+
+async def _arun_fetches(fetches: Fetches[T]) -> T:
+    send, value = fetches.send, None
+    while True:
+        try:
+            fetch = send(value)
+        except StopIteration as done:
+            return done.value
+        try:
+            send, value = fetches.send, await _async_single_flight.do(fetch.key, partial(_acall_provider, fetch))
+        except DataAPIError as e:
+            send, value = fetches.throw, e
+
+
+def _call_provider(fetch: _Fetch) -> any:
+    return fetch.store(getattr(get_data_provider(), fetch.method)(*fetch.args))
+
+
+async def _acall_provider(fetch: _Fetch) -> any:
+    return fetch.store(await getattr(get_data_provider(), "a" + fetch.method)(*fetch.args))
+
 
 def get_prices(ticker: str, start_date: str, end_date: str) -> list[Price]:
     """Fetch price data from cache or API."""
-    # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{start_date}_{end_date}"
-    
-    # Check cache first - simple exact match
-    if cached_data := _cache.get_prices(cache_key):
-        return [Price(**price) for price in cached_data]
+    return get_price_series(ticker, start_date, end_date).to_prices()
 
-    # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
 
-    url = f"https://api.financialdatasets.ai/prices/?ticker={ticker}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
-    response = requests.get(url, headers=headers)
-    if response.status_code != 200:
-        raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
+def get_price_series(ticker: str, start_date: str, end_date: str) -> PriceSeries:
+    """Fetch price data from cache or API as a columnar series.
 
-    # Parse response with Pydantic model
-    price_response = PriceResponse(**response.json())
-    prices = price_response.prices
+    Prices are cached per ticker together with the date ranges already fetched, so any
+    [start_date, end_date] query is answered by slicing the cached series and only the
+    missing edges of the range are requested from the API.
+    """
+    return _run_fetches(_price_series_fetches(ticker, start_date, end_date))
 
-    if not prices:
-        return []
 
-    # Cache the results using the comprehensive cache key
-    _cache.set_prices(cache_key, [p.model_dump() for p in prices])
-    return prices
+def _price_series_fetches(ticker: str, start_date: str, end_date: str) -> Fetches[PriceSeries]:
+    for gap_start, gap_end in _missing_price_ranges(ticker, start_date, end_date):
+        yield _Fetch(("prices", ticker, gap_start, gap_end), "get_prices", (ticker, gap_start, gap_end), partial(_store_prices, ticker, gap_start, gap_end))
+    return _cached_prices(ticker, start_date, end_date)
+
+
+def _missing_price_ranges(ticker: str, start_date: str, end_date: str) -> list[list[str]]:
+    coverage = _cache.get_price_coverage(ticker)
+    gaps = missing_ranges(coverage, start_date, end_date)
+    get_data_metrics().record_lookup("prices", _miss_reason(gaps, bool(coverage)))
+    return gaps
+
+
+def _miss_reason(gaps: list[list[str]], cached: bool) -> str | None:
+    """Why a window with these uncached date ranges misses the cache, or None for a hit."""
+    if not gaps:
+        return None
+    if not cached:
+        return "cold"
+    if all(gap_start >= datetime.date.today().isoformat() for gap_start, _ in gaps):
+        return "live"
+    return "partial"
+
+
+def _store_prices(ticker: str, start_date: str, end_date: str, prices: list[Price]):
+    """Cache prices fetched for [start_date, end_date] and record the range as covered."""
+    # Today's bar may still change, so only ranges that are fully in the past count as covered
+    last_complete_date = (datetime.date.today() - datetime.timedelta(days=1)).isoformat()
+    with _cache.lock("prices", ticker):
+        if prices:
+            _cache.set_prices(ticker, prices)
+        if start_date <= last_complete_date:
+            _cache.add_price_coverage(ticker, start_date, min(end_date, last_complete_date))
+
+
+def _cached_prices(ticker: str, start_date: str, end_date: str) -> PriceSeries:
+    cached_data = _cache.get_prices(ticker)
+    if cached_data is None:
+        return PriceSeries.from_prices([])
+    return cached_data.slice(start_date, end_date)
 
 
 def get_financial_metrics(
@@ -59,34 +156,53 @@ def get_financial_metrics(
     period: str = "ttm",
     limit: int = 10,
 ) -> list[FinancialMetrics]:
-    """Fetch financial metrics from cache or API."""
-    # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{period}_{end_date}_{limit}"
-    
-    # Check cache first - simple exact match
-    if cached_data := _cache.get_financial_metrics(cache_key):
-        return [FinancialMetrics(**metric) for metric in cached_data]
-
-    # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
+    """Fetch financial metrics from cache or API.
+
+    Metrics are indexed per ticker and period by report_period. Any (end_date, limit) request is
+    answered by taking the newest `limit` reports with report_period <= end_date. The API is only
+    called when the fetched window does not cover the request, and then for the newest reports,
+    so the later end dates of a backtest are answered from the same fetch.
+    """
+    return _run_fetches(_financial_metrics_fetches(ticker, end_date, period, limit))
+
+
+def _financial_metrics_fetches(ticker: str, end_date: str, period: str, limit: int) -> Fetches[list[FinancialMetrics]]:
+    if fetch := _financial_metrics_fetch(ticker, end_date, period, limit):
+        fetch_end_date, fetch_limit = fetch
+        yield _Fetch(
+            ("financial_metrics", ticker, fetch_end_date, period, fetch_limit),
+            "get_financial_metrics",
+            (ticker, fetch_end_date, period, fetch_limit),
+            partial(_store_financial_metrics, ticker, fetch_end_date, period, fetch_limit),
+        )
+    return _cached_financial_metrics(ticker, end_date, period, limit)
+
+
+def _financial_metrics_fetch(ticker: str, end_date: str, period: str, limit: int) -> tuple[str | None, int] | None:
+    """Return the (end date, limit) to fetch with, or None when the cached window already covers the request."""
+    cache_key = f"{ticker}_{period}"
+    cached_data = _cache.get_financial_metrics(cache_key) or []
+    coverage = _cache.get_financial_metrics_coverage(cache_key)
+    if window_covers(coverage, [metric.report_period for metric in cached_data], end_date, limit):
+        get_data_metrics().record_lookup("financial_metrics")
+        return None
+    get_data_metrics().record_lookup("financial_metrics", "partial" if coverage and cached_data else "cold")
+    return next_fetch_end_date(coverage, end_date), max(limit, FINANCIAL_METRICS_FETCH_LIMIT)
 
-    url = f"https://api.financialdatasets.ai/financial-metrics/?ticker={ticker}&report_period_lte={end_date}&limit={limit}&period={period}"
-    response = requests.get(url, headers=headers)
-    if response.status_code != 200:
-        raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
 
-    # Parse response with Pydantic model
-    metrics_response = FinancialMetricsResponse(**response.json())
-    financial_metrics = metrics_response.financial_metrics
+def _store_financial_metrics(ticker: str, end_date: str | None, period: str, fetch_limit: int, financial_metrics: list[FinancialMetrics]):
+    """Cache fetched metrics and extend the covered report period window."""
+    cache_key = f"{ticker}_{period}"
+    fetched = fetched_window([m.report_period for m in financial_metrics], end_date, fetch_limit)
+    with _cache.lock("financial_metrics", cache_key):
+        if financial_metrics:
+            _cache.set_financial_metrics(cache_key, financial_metrics)
+        _cache.set_financial_metrics_coverage(cache_key, merge_windows(_cache.get_financial_metrics_coverage(cache_key), fetched))
 
-    if not financial_metrics:
-        return []
 
-    # Cache the results as dicts using the comprehensive cache key
-    _cache.set_financial_metrics(cache_key, [m.model_dump() for m in financial_metrics])
-    return financial_metrics
+def _cached_financial_metrics(ticker: str, end_date: str, period: str, limit: int) -> list[FinancialMetrics]:
+    cached_data = _cache.get_financial_metrics(f"{ticker}_{period}") or []
+    return [metric for metric in cached_data if metric.report_period <= end_date][:limit]
 
 
 def search_line_items(
@@ -96,32 +212,61 @@ def search_line_items(
     period: str = "ttm",
     limit: int = 10,
 ) -> list[LineItem]:
-    """Fetch line items from API."""
-    # If not in cache or insufficient data, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
-
-    url = "https://api.financialdatasets.ai/financials/search/line-items"
-
-    body = {
-        "tickers": [ticker],
-        "line_items": line_items,
-        "end_date": end_date,
-        "period": period,
-        "limit": limit,
-    }
-    response = requests.post(url, headers=headers, json=body)
-    if response.status_code != 200:
-        raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
-    data = response.json()
-    response_model = LineItemResponse(**data)
-    search_results = response_model.search_results
-    if not search_results:
-        return []
-
-    # Cache the results
-    return search_results[:limit]
+    """Fetch line items from cache or API.
+
+    Line items are cached per ticker and period as one row per report_period holding the union
+    of all fields fetched so far. Only the fields whose fetched window does not cover the
+    request are sent to the API, like get_financial_metrics for the newest reports.
+    """
+    return _run_fetches(_line_items_fetches(ticker, line_items, end_date, period, limit))
+
+
+def _line_items_fetches(ticker: str, line_items: list[str], end_date: str, period: str, limit: int) -> Fetches[list[LineItem]]:
+    fetch_limit = max(limit, LINE_ITEMS_FETCH_LIMIT)
+    for fetch_end_date, missing_fields in _missing_line_item_fields(ticker, line_items, end_date, period, limit).items():
+        yield _Fetch(
+            ("line_items", ticker, tuple(missing_fields), fetch_end_date, period, fetch_limit),
+            "search_line_items",
+            (ticker, missing_fields, fetch_end_date, period, fetch_limit),
+            partial(_store_line_items, ticker, missing_fields, fetch_end_date, period, fetch_limit),
+        )
+    return _cached_line_items(ticker, line_items, end_date, period, limit)
+
+
+def _missing_line_item_fields(ticker: str, line_items: list[str], end_date: str, period: str, limit: int) -> dict[str | None, list[str]]:
+    """Return the requested fields whose cached window does not cover the request, grouped by the end date to fetch them with."""
+    cache_key = f"{ticker}_{period}"
+    coverage = _cache.get_line_items_coverage(cache_key)
+    report_periods = [row["report_period"] for row in _cache.get_line_items(cache_key) or []]
+    missing_fields: dict[str | None, list[str]] = {}
+    for field in line_items:
+        if not window_covers(coverage.get(field), report_periods, end_date, limit):
+            missing_fields.setdefault(next_fetch_end_date(coverage.get(field), end_date), []).append(field)
+    # Fetching only some of the fields, or a longer window of cached fields, is a partial miss
+    if not missing_fields:
+        get_data_metrics().record_lookup("line_items")
+    else:
+        get_data_metrics().record_lookup("line_items", "partial" if report_periods and set(coverage) & set(line_items) else "cold")
+    return missing_fields
+
+
+def _store_line_items(ticker: str, fields: list[str], end_date: str | None, period: str, fetch_limit: int, search_results: list[LineItem]):
+    """Merge fetched line items into the cache and extend the covered window of each field."""
+    cache_key = f"{ticker}_{period}"
+    fetched = fetched_window([item.report_period for item in search_results], end_date, fetch_limit)
+    with _cache.lock("line_items", cache_key):
+        if search_results:
+            _cache.set_line_items(cache_key, [item.model_dump() for item in search_results])
+        coverage = _cache.get_line_items_coverage(cache_key)
+        _cache.set_line_items_coverage(cache_key, {**coverage, **{field: merge_windows(coverage.get(field), fetched) for field in fields}})
+
+
+def _cached_line_items(ticker: str, line_items: list[str], end_date: str, period: str, limit: int) -> list[LineItem]:
+    # Only expose the requested fields, as a direct API response would
+    fields = {"ticker", "report_period", "period", "currency", *line_items}
+    rows = [row for row in _cache.get_line_items(f"{ticker}_{period}") or [] if row["report_period"] <= end_date][:limit]
+    # Rows were validated when fetched, so skip validation when rebuilding them
+    return [LineItem.model_construct(**{key: value for key, value in row.items() if key in fields}) for row in rows]
 
 
 def get_insider_trades(
@@ -129,59 +274,15 @@ def get_insider_trades(
     end_date: str,
     start_date: str | None = None,
     limit: int = 1000,
-) -> list[InsiderTrade]:
-    """Fetch insider trades from cache or API."""
-    # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
-    
-    # Check cache first - simple exact match
-    if cached_data := _cache.get_insider_trades(cache_key):
-        return [InsiderTrade(**trade) for trade in cached_data]
+) -> Sequence[InsiderTrade]:
+    """Fetch insider trades from cache or API.
 
-    # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
-
-    all_trades = []
-    current_end_date = end_date
-
-    while True:
-        url = f"https://api.financialdatasets.ai/insider-trades/?ticker={ticker}&filing_date_lte={current_end_date}"
-        if start_date:
-            url += f"&filing_date_gte={start_date}"
-        url += f"&limit={limit}"
-
-        response = requests.get(url, headers=headers)
-        if response.status_code != 200:
-            raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
-
-        data = response.json()
-        response_model = InsiderTradeResponse(**data)
-        insider_trades = response_model.insider_trades
-
-        if not insider_trades:
-            break
-
-        all_trades.extend(insider_trades)
-
-        # Only continue pagination if we have a start_date and got a full page
-        if not start_date or len(insider_trades) < limit:
-            break
-
-        # Update end_date to the oldest filing date from current batch for next iteration
-        current_end_date = min(trade.filing_date for trade in insider_trades).split("T")[0]
-
-        # If we've reached or passed the start_date, we can stop
-        if current_end_date <= start_date:
-            break
-
-    if not all_trades:
-        return []
-
-    # Cache the results using the comprehensive cache key
-    _cache.set_insider_trades(cache_key, [trade.model_dump() for trade in all_trades])
-    return all_trades
+    Windows with a start_date are served from a per-ticker series, and only the date ranges
+    not fetched yet are requested, so refreshing a window that ends today downloads just the
+    newest filings. Requests without a start_date (the newest `limit` trades) are cached as is.
+    Cached trades come back as a read-only EventSeries that builds the models while iterated.
+    """
+    return _run_fetches(_events_fetches("insider_trades", ticker, end_date, start_date, limit))
 
 
 def get_company_news(
@@ -189,59 +290,105 @@ def get_company_news(
     end_date: str,
     start_date: str | None = None,
     limit: int = 1000,
-) -> list[CompanyNews]:
-    """Fetch company news from cache or API."""
+) -> Sequence[CompanyNews]:
+    """Fetch company news from cache or API, refreshing windows with a start_date incrementally like get_insider_trades."""
+    return _run_fetches(_events_fetches("company_news", ticker, end_date, start_date, limit))
+
+
+def _events_fetches(category: str, ticker: str, end_date: str, start_date: str | None, limit: int) -> Fetches[Sequence]:
+    """Insider trades or company news, by the cache name of their category."""
+    method = f"get_{category}"
+    if start_date:
+        # Fetch the uncached date ranges of [start_date, end_date] and return the window
+        for gap_start, gap_end in _missing_event_ranges(category, ticker, start_date, end_date):
+            yield _Fetch((category, ticker, gap_start, gap_end), method, (ticker, gap_end, gap_start, limit), partial(_store_events, category, ticker, gap_start, gap_end))
+        return _cached_events(category, ticker, start_date, end_date)
+
     # Create a cache key that includes all parameters to ensure exact matches
     cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
-    
+
     # Check cache first - simple exact match
-    if cached_data := _cache.get_company_news(cache_key):
-        return [CompanyNews(**news) for news in cached_data]
+    if cached_data := getattr(_cache, method)(cache_key):
+        get_data_metrics().record_lookup(category)
+        return cached_data
 
     # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
+    get_data_metrics().record_lookup(category, "cold")
+    return list((yield _Fetch((category, cache_key), method, (ticker, end_date, start_date, limit), partial(_store_event_list, category, cache_key, end_date))))
 
-    all_news = []
-    current_end_date = end_date
 
-    while True:
-        url = f"https://api.financialdatasets.ai/news/?ticker={ticker}&end_date={current_end_date}"
-        if start_date:
-            url += f"&start_date={start_date}"
-        url += f"&limit={limit}"
+def _store_event_list(category: str, cache_key: str, end_date: str, events: list) -> list:
+    if not events:
+        return []
 
-        response = requests.get(url, headers=headers)
-        if response.status_code != 200:
-            raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
+    # Cache the results using the comprehensive cache key
+    getattr(_cache, f"set_{category}")(cache_key, events, ttl=_live_ttl(end_date))
+    return events
+
+
+def _missing_event_ranges(category: str, ticker: str, start_date: str, end_date: str) -> list[list[str]]:
+    coverage = getattr(_cache, f"get_{category}_coverage")(ticker)
+    # Coverage without its series (e.g. after the series expired) describes nothing
+    if getattr(_cache, f"get_{category}")(ticker) is None:
+        get_data_metrics().record_lookup(category, "expired" if coverage else "cold")
+        return [[start_date, end_date]]
+    if tail := _live_tails.get(f"{category}_{ticker}"):
+        coverage = coverage + [tail]
+    gaps = missing_ranges(coverage, start_date, end_date)
+    get_data_metrics().record_lookup(category, _miss_reason(gaps, True))
+    return gaps
+
+
+def _store_events(category: str, ticker: str, start_date: str, end_date: str, events: list):
+    """Merge events fetched for [start_date, end_date] into the ticker's series and record the range as covered."""
+    today = datetime.date.today()
+    last_complete_date = (today - datetime.timedelta(days=1)).isoformat()
+    # Concurrent windows of the same ticker merge one after the other, each with its coverage
+    with _cache.lock(category, ticker):
+        # Keep an empty series so the coverage below stays meaningful
+        getattr(_cache, f"set_{category}")(ticker, events)
+        if start_date <= last_complete_date:
+            getattr(_cache, f"add_{category}_coverage")(ticker, start_date, min(end_date, last_complete_date))
+    if end_date >= today.isoformat():
+        _live_tails.set(f"{category}_{ticker}", [max(start_date, today.isoformat()), end_date], ttl=_live_ttl(end_date))
+
+
+def _cached_events(category: str, ticker: str, start_date: str, end_date: str) -> Sequence:
+    series = getattr(_cache, f"get_{category}")(ticker)
+    return series.slice(start_date, end_date) if series is not None else []
+
+
+def _live_ttl(end_date: str) -> float | None:
+    """Expiry for event lists that run up to today, which keep growing during the day."""
+    if end_date < datetime.date.today().isoformat():
+        return None
+    return float(os.environ.get("HEDGE_FUND_CACHE_LIVE_TTL", "300"))
 
-        data = response.json()
-        response_model = CompanyNewsResponse(**data)
-        company_news = response_model.news
 
-        if not company_news:
-            break
+def get_company_facts(ticker: str) -> CompanyFacts | None:
+    """Fetch current company facts from cache or API, or None when unavailable.
 
-        all_news.extend(company_news)
+    Facts are cached for HEDGE_FUND_CACHE_COMPANY_FACTS_TTL seconds (default 300), since the
+    market cap they carry moves with the price.
+    """
+    return _run_fetches(_company_facts_fetches(ticker))
 
-        # Only continue pagination if we have a start_date and got a full page
-        if not start_date or len(company_news) < limit:
-            break
 
-        # Update end_date to the oldest date from current batch for next iteration
-        current_end_date = min(news.date for news in company_news).split("T")[0]
+def _company_facts_fetches(ticker: str) -> Fetches[CompanyFacts | None]:
+    if cached_data := _cache.get_company_facts(ticker):
+        get_data_metrics().record_lookup("company_facts")
+        return cached_data
+    get_data_metrics().record_lookup("company_facts", "cold")
+    try:
+        return (yield _Fetch(("company_facts", ticker), "get_company_facts", (ticker,), partial(_store_company_facts, ticker)))
+    except DataAPIError as e:
+        print(f"Error fetching company facts: {ticker} - {e.status_code}")
+        return None
 
-        # If we've reached or passed the start_date, we can stop
-        if current_end_date <= start_date:
-            break
 
-    if not all_news:
-        return []
-
-    # Cache the results using the comprehensive cache key
-    _cache.set_company_news(cache_key, [news.model_dump() for news in all_news])
-    return all_news
+def _store_company_facts(ticker: str, company_facts: CompanyFacts) -> CompanyFacts:
+    _cache.set_company_facts(ticker, company_facts)
+    return company_facts
 
 
 def get_market_cap(
@@ -249,24 +396,17 @@ def get_market_cap(
     end_date: str,
 ) -> float | None:
     """Fetch market cap from the API."""
+    return _run_fetches(_market_cap_fetches(ticker, end_date))
+
+
+def _market_cap_fetches(ticker: str, end_date: str) -> Fetches[float | None]:
     # Check if end_date is today
     if end_date == datetime.datetime.now().strftime("%Y-%m-%d"):
         # Get the market cap from company facts API
-        headers = {}
-        if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-            headers["X-API-KEY"] = api_key
-
-        url = f"https://api.financialdatasets.ai/company/facts/?ticker={ticker}"
-        response = requests.get(url, headers=headers)
-        if response.status_code != 200:
-            print(f"Error fetching company facts: {ticker} - {response.status_code}")
-            return None
-
-        data = response.json()
-        response_model = CompanyFactsResponse(**data)
-        return response_model.company_facts.market_cap
+        company_facts = yield from _company_facts_fetches(ticker)
+        return company_facts.market_cap if company_facts else None
 
-    financial_metrics = get_financial_metrics(ticker, end_date)
+    financial_metrics = yield from _financial_metrics_fetches(ticker, end_date, "ttm", 10)
     if not financial_metrics:
         return None
 
@@ -278,19 +418,59 @@ def get_market_cap(
     return market_cap
 
 
-def prices_to_df(prices: list[Price]) -> pd.DataFrame:
+def get_market_caps(tickers: list[str], end_date: str, max_workers: int | None = None) -> dict[str, float | None]:
+    """Fetch the market caps of many tickers concurrently (FINANCIAL_DATASETS_MAX_CONCURRENCY workers by default)."""
+    if max_workers is None:
+        max_workers = int(os.environ.get("FINANCIAL_DATASETS_MAX_CONCURRENCY", "10"))
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as executor:
+        return dict(zip(tickers, executor.map(lambda ticker: get_market_cap(ticker, end_date), tickers)))
+
+
+async def aget_prices(ticker: str, start_date: str, end_date: str) -> list[Price]:
+    """Async variant of get_prices."""
+    return (await _arun_fetches(_price_series_fetches(ticker, start_date, end_date))).to_prices()
+
+
+async def aget_financial_metrics(ticker: str, end_date: str, period: str = "ttm", limit: int = 10) -> list[FinancialMetrics]:
+    """Async variant of get_financial_metrics."""
+    return await _arun_fetches(_financial_metrics_fetches(ticker, end_date, period, limit))
+
+
+async def asearch_line_items(ticker: str, line_items: list[str], end_date: str, period: str = "ttm", limit: int = 10) -> list[LineItem]:
+    """Async variant of search_line_items."""
+    return await _arun_fetches(_line_items_fetches(ticker, line_items, end_date, period, limit))
+
+
+async def aget_insider_trades(ticker: str, end_date: str, start_date: str | None = None, limit: int = 1000) -> Sequence[InsiderTrade]:
+    """Async variant of get_insider_trades."""
+    return await _arun_fetches(_events_fetches("insider_trades", ticker, end_date, start_date, limit))
+
+
+async def aget_company_news(ticker: str, end_date: str, start_date: str | None = None, limit: int = 1000) -> Sequence[CompanyNews]:
+    """Async variant of get_company_news."""
+    return await _arun_fetches(_events_fetches("company_news", ticker, end_date, start_date, limit))
+
+
+async def aget_company_facts(ticker: str) -> CompanyFacts | None:
+    """Async variant of get_company_facts."""
+    return await _arun_fetches(_company_facts_fetches(ticker))
+
+
+async def aget_market_cap(ticker: str, end_date: str) -> float | None:
+    """Async variant of get_market_cap."""
+    return await _arun_fetches(_market_cap_fetches(ticker, end_date))
+
+
+def prices_to_df(prices: list[Price] | PriceSeries) -> pd.DataFrame:
     """Convert prices to a DataFrame."""
-    df = pd.DataFrame([p.model_dump() for p in prices])
-    df["Date"] = pd.to_datetime(df["time"])
-    df.set_index("Date", inplace=True)
-    numeric_cols = ["open", "close", "high", "low", "volume"]
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    df.sort_index(inplace=True)
-    return df
+    if not isinstance(prices, PriceSeries):
+        prices = PriceSeries.from_prices(prices)
+    return prices.to_df()
 
 
-# Update the get_price_data function to use the new functions
 def get_price_data(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
-    prices = get_prices(ticker, start_date, end_date)
-    return prices_to_df(prices)
+    """Fetch prices as a DataFrame built directly from the cached columnar series."""
+    return get_price_series(ticker, start_date, end_date).to_df()
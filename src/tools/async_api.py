@@ -0,0 +1,77 @@
+"""Asyncio front end of the data functions in src.tools.api.
+
+The async variants (aget_prices, aget_financial_metrics, ...) share the cache, its bookkeeping
+and the providers' request handling with the synchronous functions, so data fetched through
+either path serves both. The financialdatasets.ai provider sends them through an httpx client
+on the running event loop; other providers are called on worker threads.
+"""
+
+import asyncio
+import os
+
+from src.data.providers.financial_datasets import aclose_client
+from src.tools.api import (
+    aget_company_facts,
+    aget_company_news,
+    aget_financial_metrics,
+    aget_insider_trades,
+    aget_market_cap,
+    aget_prices,
+    asearch_line_items,
+)
+
+__all__ = [
+    "aclose_client",
+    "aget_company_facts",
+    "aget_company_news",
+    "aget_financial_metrics",
+    "aget_insider_trades",
+    "aget_market_cap",
+    "aget_prices",
+    "asearch_line_items",
+    "fetch_many",
+]
+
+
+async def fetch_many(
+    tickers: list[str],
+    end_date: str,
+    start_date: str | None = None,
+    datasets: tuple[str, ...] = ("prices", "financial_metrics", "market_cap", "insider_trades", "company_news"),
+    metrics_period: str = "ttm",
+    metrics_limit: int = 10,
+    max_concurrency: int | None = None,
+) -> dict[str, dict[str, any]]:
+    """
+    Fetch several datasets for many tickers concurrently.
+
+    At most `max_concurrency` fetches run at once (FINANCIAL_DATASETS_MAX_CONCURRENCY, default 10).
+    Prices require a start_date. Returns {ticker: {dataset: result}}; a failed fetch raises
+    after all other fetches have completed.
+    """
+    if max_concurrency is None:
+        max_concurrency = int(os.environ.get("FINANCIAL_DATASETS_MAX_CONCURRENCY", "10"))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    def fetchers(ticker: str) -> dict[str, any]:
+        return {
+            "prices": lambda: aget_prices(ticker, start_date, end_date),
+            "financial_metrics": lambda: aget_financial_metrics(ticker, end_date, period=metrics_period, limit=metrics_limit),
+            "market_cap": lambda: aget_market_cap(ticker, end_date),
+            "insider_trades": lambda: aget_insider_trades(ticker, end_date, start_date=start_date),
+            "company_news": lambda: aget_company_news(ticker, end_date, start_date=start_date),
+        }
+
+    async def bounded(fetch) -> any:
+        async with semaphore:
+            return await fetch()
+
+    jobs = [(ticker, dataset, fetchers(ticker)[dataset]) for ticker in tickers for dataset in datasets]
+    results = await asyncio.gather(*(bounded(fetch) for _, _, fetch in jobs), return_exceptions=True)
+
+    market_data: dict[str, dict[str, any]] = {ticker: {} for ticker in tickers}
+    for (ticker, dataset, _), result in zip(jobs, results):
+        if isinstance(result, BaseException):
+            raise result
+        market_data[ticker][dataset] = result
+    return market_data
@@ -0,0 +1,115 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable
+
+from src.data.requirements import DataRequirements
+from src.graph.state import AgentState
+from src.tools.api import (
+    get_company_news,
+    get_financial_metrics,
+    get_insider_trades,
+    get_market_cap,
+    get_prices,
+    search_line_items,
+)
+from src.utils.progress import progress
+
+
+def plan_prefetch(
+    requirements: list[DataRequirements],
+    tickers: list[str],
+    start_date: str,
+    end_date: str,
+) -> list[tuple[Callable, dict[str, any]]]:
+    """
+    Combine the data requirements of several agents into one deduplicated list of API calls.
+
+    Financial metrics and line items are merged per period (largest limit, union of fields)
+    since the cache answers smaller requests from a larger fetch. Insider trades and news are
+    deduplicated by their exact (start_date, limit) parameters.
+    """
+    metrics_limits: dict[str, int] = {}
+    line_item_fields: dict[str, set[str]] = {}
+    line_item_limits: dict[str, int] = {}
+    insider_windows: set[tuple[str | None, int]] = set()
+    news_windows: set[tuple[str | None, int]] = set()
+    needs_prices = False
+    needs_market_cap = False
+
+    def window_start(lookback_days: int | None) -> str | None:
+        if lookback_days is None:
+            return None
+        return (datetime.fromisoformat(end_date) - timedelta(days=lookback_days)).date().isoformat()
+
+    for requirement in requirements:
+        for metrics in requirement.financial_metrics:
+            metrics_limits[metrics.period] = max(metrics_limits.get(metrics.period, 0), metrics.limit)
+        if requirement.market_cap:
+            # get_market_cap reads the default TTM metrics for historical dates
+            metrics_limits["ttm"] = max(metrics_limits.get("ttm", 0), 10)
+        for items in requirement.line_items:
+            line_item_fields.setdefault(items.period, set()).update(items.line_items)
+            line_item_limits[items.period] = max(line_item_limits.get(items.period, 0), items.limit)
+        insider_windows.update((window_start(events.lookback_days), events.limit) for events in requirement.insider_trades)
+        news_windows.update((window_start(events.lookback_days), events.limit) for events in requirement.company_news)
+        needs_prices = needs_prices or requirement.prices
+        needs_market_cap = needs_market_cap or requirement.market_cap
+
+    calls = []
+    for ticker in tickers:
+        for period, limit in metrics_limits.items():
+            calls.append((get_financial_metrics, {"ticker": ticker, "end_date": end_date, "period": period, "limit": limit}))
+        for period, fields in line_item_fields.items():
+            calls.append((search_line_items, {"ticker": ticker, "line_items": sorted(fields), "end_date": end_date, "period": period, "limit": line_item_limits[period]}))
+        for window_start_date, limit in insider_windows:
+            calls.append((get_insider_trades, {"ticker": ticker, "end_date": end_date, "start_date": window_start_date, "limit": limit}))
+        for window_start_date, limit in news_windows:
+            calls.append((get_company_news, {"ticker": ticker, "end_date": end_date, "start_date": window_start_date, "limit": limit}))
+        if needs_prices:
+            calls.append((get_prices, {"ticker": ticker, "start_date": start_date, "end_date": end_date}))
+        if needs_market_cap:
+            # Live runs read company facts, which are cached for a short while
+            calls.append((get_market_cap, {"ticker": ticker, "end_date": end_date}))
+    return calls
+
+
+def run_prefetch(calls: list[tuple[Callable, dict[str, any]]], max_workers: int | None = None) -> dict[str, int]:
+    """
+    Execute planned API calls concurrently so their results land in the shared cache.
+
+    Failures are counted but not raised: the agent that needs the data will retry and report it.
+    """
+    if max_workers is None:
+        max_workers = int(os.environ.get("HEDGE_FUND_PREFETCH_WORKERS", "8"))
+
+    def execute(call: tuple[Callable, dict[str, any]]) -> bool:
+        func, kwargs = call
+        try:
+            func(**kwargs)
+            return True
+        except Exception:
+            return False
+
+    if not calls:
+        return {"calls": 0, "failed": 0}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(execute, calls))
+    return {"calls": len(results), "failed": results.count(False)}
+
+
+def create_prefetch_node(requirements: list[DataRequirements]) -> Callable[[AgentState], dict]:
+    """Create a workflow node that fetches the union of the given requirements before the agents run."""
+
+    def data_prefetch(state: AgentState):
+        data = state["data"]
+        progress.update_status("data_prefetch", None, "Planning data requests")
+        calls = plan_prefetch(requirements, data["tickers"], data["start_date"], data["end_date"])
+
+        progress.update_status("data_prefetch", None, f"Fetching {len(calls)} datasets")
+        stats = run_prefetch(calls)
+
+        progress.update_status("data_prefetch", None, "Done")
+        return {"metadata": {"prefetch": stats}}
+
+    return data_prefetch
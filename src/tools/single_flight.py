@@ -0,0 +1,75 @@
+"""Coalescing of concurrent identical requests.
+
+When several callers ask for the same key at the same time, only the first (the leader) runs
+the request; the others wait for it and share its result or exception. Once the request has
+finished the key is released, so later calls run again (and are normally served by the cache).
+"""
+
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces identical calls made concurrently from different threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Run func for key, or wait for the call already in flight for the same key."""
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(func())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        return future.result()
+
+
+class AsyncSingleFlight:
+    """Coalesces identical awaitables requested concurrently from tasks on the same event loop."""
+
+    def __init__(self):
+        # Futures are bound to their event loop, so in-flight calls are tracked per loop
+        self._in_flight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, asyncio.Future]]" = weakref.WeakKeyDictionary()
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Await func() for key, or wait for the call already in flight for the same key."""
+        loop = asyncio.get_running_loop()
+        in_flight = self._in_flight.setdefault(loop, {})
+        if (future := in_flight.get(key)) is not None:
+            # Shield so that a cancelled waiter does not cancel the leader's request
+            return await asyncio.shield(future)
+
+        future = in_flight[key] = loop.create_future()
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del in_flight[key]
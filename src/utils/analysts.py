@@ -1,96 +1,112 @@
 """Constants and utilities related to analysts configuration."""
 
-from src.agents.aswath_damodaran import aswath_damodaran_agent
-from src.agents.ben_graham import ben_graham_agent
-from src.agents.bill_ackman import bill_ackman_agent
-from src.agents.cathie_wood import cathie_wood_agent
-from src.agents.charlie_munger import charlie_munger_agent
-from src.agents.fundamentals import fundamentals_analyst_agent
-from src.agents.michael_burry import michael_burry_agent
-from src.agents.phil_fisher import phil_fisher_agent
-from src.agents.peter_lynch import peter_lynch_agent
-from src.agents.sentiment import sentiment_analyst_agent
-from src.agents.stanley_druckenmiller import stanley_druckenmiller_agent
-from src.agents.technicals import technical_analyst_agent
-from src.agents.valuation import valuation_analyst_agent
-from src.agents.warren_buffett import warren_buffett_agent
-from src.agents.rakesh_jhunjhunwala import rakesh_jhunjhunwala_agent
+from src.data.requirements import DataRequirements
+from src.agents.aswath_damodaran import aswath_damodaran_agent, DATA_REQUIREMENTS as ASWATH_DAMODARAN_DATA_REQUIREMENTS
+from src.agents.ben_graham import ben_graham_agent, DATA_REQUIREMENTS as BEN_GRAHAM_DATA_REQUIREMENTS
+from src.agents.bill_ackman import bill_ackman_agent, DATA_REQUIREMENTS as BILL_ACKMAN_DATA_REQUIREMENTS
+from src.agents.cathie_wood import cathie_wood_agent, DATA_REQUIREMENTS as CATHIE_WOOD_DATA_REQUIREMENTS
+from src.agents.charlie_munger import charlie_munger_agent, DATA_REQUIREMENTS as CHARLIE_MUNGER_DATA_REQUIREMENTS
+from src.agents.fundamentals import fundamentals_analyst_agent, DATA_REQUIREMENTS as FUNDAMENTALS_DATA_REQUIREMENTS
+from src.agents.michael_burry import michael_burry_agent, DATA_REQUIREMENTS as MICHAEL_BURRY_DATA_REQUIREMENTS
+from src.agents.phil_fisher import phil_fisher_agent, DATA_REQUIREMENTS as PHIL_FISHER_DATA_REQUIREMENTS
+from src.agents.peter_lynch import peter_lynch_agent, DATA_REQUIREMENTS as PETER_LYNCH_DATA_REQUIREMENTS
+from src.agents.sentiment import sentiment_analyst_agent, DATA_REQUIREMENTS as SENTIMENT_DATA_REQUIREMENTS
+from src.agents.stanley_druckenmiller import stanley_druckenmiller_agent, DATA_REQUIREMENTS as STANLEY_DRUCKENMILLER_DATA_REQUIREMENTS
+from src.agents.technicals import technical_analyst_agent, DATA_REQUIREMENTS as TECHNICALS_DATA_REQUIREMENTS
+from src.agents.valuation import valuation_analyst_agent, DATA_REQUIREMENTS as VALUATION_DATA_REQUIREMENTS
+from src.agents.warren_buffett import warren_buffett_agent, DATA_REQUIREMENTS as WARREN_BUFFETT_DATA_REQUIREMENTS
+from src.agents.rakesh_jhunjhunwala import rakesh_jhunjhunwala_agent, DATA_REQUIREMENTS as RAKESH_JHUNJHUNWALA_DATA_REQUIREMENTS
 
 # Define analyst configuration - single source of truth
 ANALYST_CONFIG = {
     "aswath_damodaran": {
         "display_name": "Aswath Damodaran",
         "agent_func": aswath_damodaran_agent,
+        "data_requirements": ASWATH_DAMODARAN_DATA_REQUIREMENTS,
         "order": 0,
     },
     "ben_graham": {
         "display_name": "Ben Graham",
         "agent_func": ben_graham_agent,
+        "data_requirements": BEN_GRAHAM_DATA_REQUIREMENTS,
         "order": 1,
     },
     "bill_ackman": {
         "display_name": "Bill Ackman",
         "agent_func": bill_ackman_agent,
+        "data_requirements": BILL_ACKMAN_DATA_REQUIREMENTS,
         "order": 2,
     },
     "cathie_wood": {
         "display_name": "Cathie Wood",
         "agent_func": cathie_wood_agent,
+        "data_requirements": CATHIE_WOOD_DATA_REQUIREMENTS,
         "order": 3,
     },
     "charlie_munger": {
         "display_name": "Charlie Munger",
         "agent_func": charlie_munger_agent,
+        "data_requirements": CHARLIE_MUNGER_DATA_REQUIREMENTS,
         "order": 4,
     },
     "michael_burry": {
         "display_name": "Michael Burry",
         "agent_func": michael_burry_agent,
+        "data_requirements": MICHAEL_BURRY_DATA_REQUIREMENTS,
         "order": 5,
     },
     "peter_lynch": {
         "display_name": "Peter Lynch",
         "agent_func": peter_lynch_agent,
+        "data_requirements": PETER_LYNCH_DATA_REQUIREMENTS,
         "order": 6,
     },
     "phil_fisher": {
         "display_name": "Phil Fisher",
         "agent_func": phil_fisher_agent,
+        "data_requirements": PHIL_FISHER_DATA_REQUIREMENTS,
         "order": 7,
     },
     "rakesh_jhunjhunwala": {
         "display_name": "Rakesh Jhunjhunwala",
         "agent_func": rakesh_jhunjhunwala_agent,
+        "data_requirements": RAKESH_JHUNJHUNWALA_DATA_REQUIREMENTS,
         "order": 8,
     },
     "stanley_druckenmiller": {
         "display_name": "Stanley Druckenmiller",
         "agent_func": stanley_druckenmiller_agent,
+        "data_requirements": STANLEY_DRUCKENMILLER_DATA_REQUIREMENTS,
         "order": 9,
     },
     "warren_buffett": {
         "display_name": "Warren Buffett",
         "agent_func": warren_buffett_agent,
+        "data_requirements": WARREN_BUFFETT_DATA_REQUIREMENTS,
         "order": 10,
     },
     "technical_analyst": {
         "display_name": "Technical Analyst",
         "agent_func": technical_analyst_agent,
+        "data_requirements": TECHNICALS_DATA_REQUIREMENTS,
         "order": 11,
     },
     "fundamentals_analyst": {
         "display_name": "Fundamentals Analyst",
         "agent_func": fundamentals_analyst_agent,
+        "data_requirements": FUNDAMENTALS_DATA_REQUIREMENTS,
         "order": 12,
     },
     "sentiment_analyst": {
         "display_name": "Sentiment Analyst",
         "agent_func": sentiment_analyst_agent,
+        "data_requirements": SENTIMENT_DATA_REQUIREMENTS,
         "order": 13,
     },
     "valuation_analyst": {
         "display_name": "Valuation Analyst",
         "agent_func": valuation_analyst_agent,
+        "data_requirements": VALUATION_DATA_REQUIREMENTS,
         "order": 14,
     },
 }
@@ -102,3 +118,10 @@ ANALYST_ORDER = [(config["display_name"], key) for key, config in sorted(ANALYST
 def get_analyst_nodes():
     """Get the mapping of analyst keys to their (node_name, agent_func) tuples."""
     return {key: (f"{key}_agent", config["agent_func"]) for key, config in ANALYST_CONFIG.items()}
+
+
+def get_analyst_data_requirements(selected_analysts: list[str] | None = None) -> list[DataRequirements]:
+    """Get the declared data requirements of the selected analysts (all analysts by default)."""
+    if selected_analysts is None:
+        selected_analysts = list(ANALYST_CONFIG.keys())
+    return [ANALYST_CONFIG[key]["data_requirements"] for key in selected_analysts if key in ANALYST_CONFIG]
@@ -1,11 +1,23 @@
 """Helper functions for LLM"""
 
+import asyncio
 import json
+import os
+import threading
+import time
+from typing import Awaitable, Callable, Hashable, TypeVar
+
 from pydantic import BaseModel
-from src.llm.models import get_model, get_model_info
+from src.llm.cache import get_llm_cache, response_fingerprint
+from src.llm.models import get_client, get_model_info
+from src.llm.scheduler import estimate_tokens, get_llm_scheduler, is_rate_limit_error, retry_after
+from src.llm.usage import call_cost, record_llm_call
 from src.utils.progress import progress
 from src.graph.state import AgentState
 
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
 
 def call_llm(
     prompt: any,
@@ -14,6 +26,8 @@ def call_llm(
     state: AgentState | None = None,
     max_retries: int = 3,
     default_factory=None,
+    use_cache: bool = True,
+    ticker: str | None = None,
 ) -> BaseModel:
     """
     Makes an LLM call with retry logic, handling both JSON supported and non-JSON supported models.
@@ -25,44 +39,29 @@ def call_llm(
         state: Optional state object to extract agent-specific model configuration
         max_retries: Maximum number of retries (default: 3)
         default_factory: Optional factory function to create default response on failure
+        use_cache: Reuse the response to an identical earlier request (default: True)
+        ticker: Optional ticker the call is about, used for usage accounting
 
     Returns:
         An instance of the specified Pydantic model
     """
-    
-    # Extract model configuration if state is provided and agent_name is available
-    if state and agent_name:
-        model_name, model_provider = get_agent_model_config(state, agent_name)
-    
-    # Fallback to defaults if still not provided
-    if not model_name:
-        model_name = "gpt-4o"
-    if not model_provider:
-        model_provider = "OPENAI"
+    started = time.perf_counter()
+    model_name, model_provider = _resolve_model(agent_name, state)
+    call = _new_call(agent_name, ticker, model_name, model_provider)
 
-    model_info = get_model_info(model_name, model_provider)
-    llm = get_model(model_name, model_provider)
+    # Identical requests (e.g. a re-run backtest) get the earlier response; failures are never cached
+    cache_key = response_fingerprint(model_name, model_provider, prompt, pydantic_model) if use_cache else None
+    if cache_key and (cached := get_llm_cache().get(cache_key, pydantic_model)) is not None:
+        return _finish_call(call, started, state, None, cached, cached=True)
 
-    # For non-JSON support models, we can use structured output
-    if not (model_info and not model_info.has_json_mode()):
-        llm = llm.with_structured_output(
-            pydantic_model,
-            method="json_mode",
-        )
+    model_info, llm = _prepare_llm(model_name, model_provider, pydantic_model)
 
     # Call the LLM with retries
     for attempt in range(max_retries):
+        call["retries"] = attempt
         try:
-            # Call the LLM
-            result = llm.invoke(prompt)
-
-            # For non-JSON support models, we need to extract and parse the JSON manually
-            if model_info and not model_info.has_json_mode():
-                parsed_result = extract_json_from_response(result.content)
-                if parsed_result:
-                    return pydantic_model(**parsed_result)
-            else:
-                return result
+            if (response := _structured_response(_invoke(llm, prompt, model_provider, agent_name, call), pydantic_model, model_info, cache_key)) is not None:
+                return _finish_call(call, started, state, model_info, response)
 
         except Exception as e:
             if agent_name:
@@ -72,11 +71,234 @@ def call_llm(
                 print(f"Error in LLM call after {max_retries} attempts: {e}")
                 # Use default_factory if provided, otherwise create a basic default
                 if default_factory:
-                    return default_factory()
-                return create_default_response(pydantic_model)
+                    return _finish_call(call, started, state, model_info, default_factory(), fallback=True)
+                return _finish_call(call, started, state, model_info, create_default_response(pydantic_model), fallback=True)
 
     # This should never be reached due to the retry logic above
-    return create_default_response(pydantic_model)
+    return _finish_call(call, started, state, model_info, create_default_response(pydantic_model), fallback=True)
+
+
+async def acall_llm(
+    prompt: any,
+    pydantic_model: type[BaseModel],
+    agent_name: str | None = None,
+    state: AgentState | None = None,
+    max_retries: int = 3,
+    default_factory=None,
+    use_cache: bool = True,
+    ticker: str | None = None,
+) -> BaseModel:
+    """
+    Async variant of call_llm.
+
+    Calls run on a shared background event loop, so the async clients' connection pools are
+    reused, and at most HEDGE_FUND_LLM_CONCURRENCY calls per provider (default 8, overridable
+    with e.g. HEDGE_FUND_LLM_CONCURRENCY_OPENAI) are in flight at once across all agents.
+    """
+    loop = _get_llm_loop()
+    if asyncio.get_running_loop() is not loop:
+        future = asyncio.run_coroutine_threadsafe(
+            acall_llm(prompt, pydantic_model, agent_name, state, max_retries, default_factory, use_cache, ticker), loop
+        )
+        return await asyncio.wrap_future(future)
+
+    started = time.perf_counter()
+    model_name, model_provider = _resolve_model(agent_name, state)
+    call = _new_call(agent_name, ticker, model_name, model_provider)
+    cache_key = response_fingerprint(model_name, model_provider, prompt, pydantic_model) if use_cache else None
+    if cache_key and (cached := get_llm_cache().get(cache_key, pydantic_model)) is not None:
+        return _finish_call(call, started, state, None, cached, cached=True)
+
+    model_info, llm = _prepare_llm(model_name, model_provider, pydantic_model)
+
+    for attempt in range(max_retries):
+        call["retries"] = attempt
+        try:
+            result = await _ainvoke(llm, prompt, model_provider, agent_name, call)
+            if (response := _structured_response(result, pydantic_model, model_info, cache_key)) is not None:
+                return _finish_call(call, started, state, model_info, response)
+
+        except Exception as e:
+            if agent_name:
+                progress.update_status(agent_name, None, f"Error - retry {attempt + 1}/{max_retries}")
+
+            if attempt == max_retries - 1:
+                print(f"Error in LLM call after {max_retries} attempts: {e}")
+                if default_factory:
+                    return _finish_call(call, started, state, model_info, default_factory(), fallback=True)
+                return _finish_call(call, started, state, model_info, create_default_response(pydantic_model), fallback=True)
+
+    return _finish_call(call, started, state, model_info, create_default_response(pydantic_model), fallback=True)
+
+
+async def acall_llm_batch(calls: dict[K, Callable[[], Awaitable[T]]]) -> dict[K, T]:
+    """Start acall_llm calls concurrently and return their results by key."""
+    results = await asyncio.gather(*(call() for call in calls.values()))
+    return dict(zip(calls, results))
+
+
+def call_llm_batch(calls: dict[K, Callable[[], Awaitable[T]]]) -> dict[K, T]:
+    """
+    Run acall_llm calls (e.g. one per ticker) concurrently from synchronous code such as an agent.
+
+    Calls are queued as functions that start them, e.g. partial(acall_llm, prompt=...), so an
+    agent that fails before running the batch leaves no coroutine behind unawaited.
+    Blocks until every call has finished and returns the results by key, in the order of `calls`.
+    """
+    if not calls:
+        return {}
+    return asyncio.run_coroutine_threadsafe(acall_llm_batch(calls), _get_llm_loop()).result()
+
+
+def _invoke(llm, prompt: any, model_provider: str, agent_name: str | None, call: dict[str, any]) -> any:
+    """Send a prompt within the provider's RPM/TPM budget, queueing it again after rate limits."""
+    scheduler = get_llm_scheduler()
+    tokens = estimate_tokens(prompt)
+    started = time.monotonic()
+    while True:
+        scheduler.acquire(model_provider, tokens)
+        try:
+            result = llm.invoke(prompt)
+        except Exception as e:
+            if not is_rate_limit_error(e) or time.monotonic() - started > scheduler.max_queue_seconds:
+                raise
+            _queue_after_rate_limit(scheduler, model_provider, agent_name, call, e)
+            continue
+        scheduler.settle(model_provider, tokens, _add_token_usage(call, result))
+        return result
+
+
+async def _ainvoke(llm, prompt: any, model_provider: str, agent_name: str | None, call: dict[str, any]) -> any:
+    """Async variant of _invoke, also bounded by the provider's concurrency limit."""
+    scheduler = get_llm_scheduler()
+    tokens = estimate_tokens(prompt)
+    started = time.monotonic()
+    while True:
+        async with _provider_semaphore(model_provider):
+            await scheduler.aacquire(model_provider, tokens)
+            try:
+                result = await llm.ainvoke(prompt)
+            except Exception as e:
+                if not is_rate_limit_error(e) or time.monotonic() - started > scheduler.max_queue_seconds:
+                    raise
+                _queue_after_rate_limit(scheduler, model_provider, agent_name, call, e)
+                continue
+        scheduler.settle(model_provider, tokens, _add_token_usage(call, result))
+        return result
+
+
+def _queue_after_rate_limit(scheduler, model_provider: str, agent_name: str | None, call: dict[str, any], error: Exception) -> None:
+    # Pausing the provider holds every queued call, so they resume together once the limit resets
+    delay = scheduler.backoff(model_provider, call["rate_limited"], retry_after(error))
+    call["rate_limited"] += 1
+    if agent_name:
+        progress.update_status(agent_name, None, f"Rate limited - queued for {delay:.0f}s")
+
+
+def _add_token_usage(call: dict[str, any], result: any) -> int | None:
+    """Add the tokens the provider reports for a response to the call and return their total, if reported."""
+    # Structured output carries the provider's message under "raw"
+    message = result.get("raw") if isinstance(result, dict) else result
+    usage = getattr(message, "usage_metadata", None)
+    if not usage:
+        return None
+    call["prompt_tokens"] += usage.get("input_tokens", 0)
+    call["completion_tokens"] += usage.get("output_tokens", 0)
+    return usage.get("total_tokens")
+
+
+def _new_call(agent_name: str | None, ticker: str | None, model_name: str, model_provider: str) -> dict[str, any]:
+    return {
+        "agent": agent_name,
+        "ticker": ticker,
+        "model": model_name,
+        "provider": str(getattr(model_provider, "value", model_provider)),
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "cost": None,
+        "latency_seconds": 0.0,
+        "retries": 0,
+        "rate_limited": 0,
+        "cached": False,
+        "fallback": False,
+    }
+
+
+def _finish_call(call: dict[str, any], started: float, state: AgentState | None, model_info, response: BaseModel, cached: bool = False, fallback: bool = False) -> BaseModel:
+    """Record a finished call in the process and run usage totals and return its response."""
+    call["latency_seconds"] = time.perf_counter() - started
+    call["cached"] = cached
+    call["fallback"] = fallback
+    # Every attempt's tokens are billed, including those of attempts that failed to parse
+    call["cost"] = 0.0 if cached else call_cost(model_info, call["prompt_tokens"], call["completion_tokens"])
+    record_llm_call(call, (state or {}).get("metadata", {}).get("llm_usage"))
+    return response
+
+
+def _resolve_model(agent_name: str | None, state: AgentState | None) -> tuple[str, str]:
+    """The model name and provider configured for an agent, defaulting to gpt-4o."""
+    # Extract model configuration if state is provided and agent_name is available
+    model_name = model_provider = None
+    if state and agent_name:
+        model_name, model_provider = get_agent_model_config(state, agent_name)
+
+    # Fallback to defaults if still not provided
+    if not model_name:
+        model_name = "gpt-4o"
+    if not model_provider:
+        model_provider = "OPENAI"
+    return model_name, model_provider
+
+
+def _prepare_llm(model_name: str, model_provider: str, pydantic_model: type[BaseModel]) -> tuple[any, any]:
+    """The model's info and its shared client, wrapped for structured output when the model has JSON mode."""
+    model_info = get_model_info(model_name, model_provider)
+    # Models without JSON mode get the plain client and their responses are parsed by _structured_response
+    json_mode = not (model_info and not model_info.has_json_mode())
+    return model_info, get_client(model_name, model_provider, pydantic_model if json_mode else None)
+
+
+def _structured_response(result: any, pydantic_model: type[BaseModel], model_info, cache_key: str | None) -> BaseModel | None:
+    """The LLM result as a pydantic_model instance, cached under cache_key, or None when it holds no JSON."""
+    if isinstance(result, dict):
+        # Structured output with its raw message: raise a parsing error so the call is retried
+        if result.get("parsing_error") is not None:
+            raise result["parsing_error"]
+        result = result["parsed"]
+    # For non-JSON support models, we need to extract and parse the JSON manually
+    if model_info and not model_info.has_json_mode():
+        parsed_result = extract_json_from_response(result.content)
+        if not parsed_result:
+            return None
+        result = pydantic_model(**parsed_result)
+    if cache_key and isinstance(result, BaseModel):
+        get_llm_cache().set(cache_key, result)
+    return result
+
+
+# Event loop of the async LLM calls, running in a daemon thread once started
+_llm_loop: asyncio.AbstractEventLoop | None = None
+_llm_loop_lock = threading.Lock()
+
+# Concurrency limit per provider; only used on the LLM loop
+_provider_semaphores: dict[str, asyncio.Semaphore] = {}
+
+
+def _get_llm_loop() -> asyncio.AbstractEventLoop:
+    global _llm_loop
+    with _llm_loop_lock:
+        if _llm_loop is None:
+            _llm_loop = asyncio.new_event_loop()
+            threading.Thread(target=_llm_loop.run_forever, name="llm-calls", daemon=True).start()
+    return _llm_loop
+
+
+def _provider_semaphore(model_provider: str) -> asyncio.Semaphore:
+    provider = str(getattr(model_provider, "value", model_provider))
+    if provider not in _provider_semaphores:
+        limit = os.environ.get(f"HEDGE_FUND_LLM_CONCURRENCY_{provider.upper()}") or os.environ.get("HEDGE_FUND_LLM_CONCURRENCY", "8")
+        _provider_semaphores[provider] = asyncio.Semaphore(max(1, int(limit)))
+    return _provider_semaphores[provider]
 
 
 def create_default_response(model_class: type[BaseModel]) -> BaseModel:
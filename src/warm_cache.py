@@ -0,0 +1,139 @@
+"""Fill the financial data cache ahead of time, e.g. before the market opens.
+
+    poetry run python src/warm_cache.py --tickers AAPL,MSFT,NVDA --start-date 2024-01-01
+
+Fetches everything the selected analysts (all by default) and the risk manager need for the
+tickers and date window, using the same functions and cache as a regular run, and reports the
+time and data volume per dataset. Set HEDGE_FUND_CACHE_DIR so the warmed cache outlives the
+process; the backend can also run the warm-up daily (see schedule_warm_cache).
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable
+
+from dotenv import load_dotenv
+from tabulate import tabulate
+
+from src.agents.risk_manager import DATA_REQUIREMENTS as RISK_MANAGEMENT_DATA_REQUIREMENTS
+from src.data.fixtures import DATA_MODES, set_data_mode
+from src.data.lru import estimate_size
+from src.tools.api import get_company_news, get_financial_metrics, get_insider_trades, get_market_cap, get_prices, search_line_items
+from src.tools.prefetch import plan_prefetch
+from src.utils.analysts import ANALYST_CONFIG, get_analyst_data_requirements
+
+logger = logging.getLogger(__name__)
+
+# Dataset reported for each data function
+DATASETS = {
+    get_prices: "prices",
+    get_financial_metrics: "financial_metrics",
+    search_line_items: "line_items",
+    get_insider_trades: "insider_trades",
+    get_company_news: "company_news",
+    get_market_cap: "market_cap",
+}
+
+
+def warm_cache(
+    tickers: list[str],
+    start_date: str,
+    end_date: str,
+    analysts: list[str] | None = None,
+    max_workers: int | None = None,
+) -> dict[str, dict[str, float]]:
+    """
+    Fetch the data the analysts need into the cache and return statistics per dataset.
+
+    Each dataset reports its number of calls, failed calls, seconds spent in calls (summed over
+    the concurrent workers) and the estimated in-memory bytes of the data returned. Insider
+    trades and news are also fetched for the whole window, which covers the live loop's windows.
+    """
+    if max_workers is None:
+        max_workers = int(os.environ.get("HEDGE_FUND_PREFETCH_WORKERS", "8"))
+    requirements = get_analyst_data_requirements(analysts) + [RISK_MANAGEMENT_DATA_REQUIREMENTS]
+    calls = plan_prefetch(requirements, tickers, start_date, end_date)
+    for ticker in tickers:
+        calls.append((get_insider_trades, {"ticker": ticker, "end_date": end_date, "start_date": start_date}))
+        calls.append((get_company_news, {"ticker": ticker, "end_date": end_date, "start_date": start_date}))
+
+    def execute(call: tuple[Callable, dict[str, any]]) -> tuple[str, bool, float, int]:
+        func, kwargs = call
+        started = time.perf_counter()
+        try:
+            result = func(**kwargs)
+        except Exception as e:
+            logger.warning("Warm-up call %s(%s) failed: %s", func.__name__, kwargs, e)
+            return DATASETS.get(func, func.__name__), False, time.perf_counter() - started, 0
+        return DATASETS.get(func, func.__name__), True, time.perf_counter() - started, estimate_size(result)
+
+    stats: dict[str, dict[str, float]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for dataset, ok, seconds, size in executor.map(execute, calls):
+            dataset_stats = stats.setdefault(dataset, {"calls": 0, "failed": 0, "seconds": 0.0, "bytes": 0})
+            dataset_stats["calls"] += 1
+            dataset_stats["failed"] += not ok
+            dataset_stats["seconds"] += seconds
+            dataset_stats["bytes"] += size
+    return stats
+
+
+def print_warm_cache_report(stats: dict[str, dict[str, float]], elapsed: float) -> None:
+    rows = [[dataset, s["calls"], s["failed"], f"{s['seconds']:.2f}", f"{s['bytes'] / 1024:,.1f}"] for dataset, s in sorted(stats.items())]
+    print(tabulate(rows, headers=["Dataset", "Calls", "Failed", "Call seconds", "KB"], tablefmt="grid"))
+    print(f"Cache warmed in {elapsed:.2f}s")
+
+
+def _seconds_until(at: str) -> float:
+    """Seconds until the next local HH:MM."""
+    now = datetime.now()
+    hour, minute = map(int, at.split(":"))
+    next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+
+async def schedule_warm_cache(tickers: list[str], at: str, lookback_days: int = 365, analysts: list[str] | None = None) -> None:
+    """Warm the cache every day at the local time `at` (HH:MM) for the window ending that day, until cancelled."""
+    while True:
+        await asyncio.sleep(_seconds_until(at))
+        end_date = datetime.now().date()
+        start_date = end_date - timedelta(days=lookback_days)
+        started = time.perf_counter()
+        try:
+            stats = await asyncio.to_thread(warm_cache, tickers, start_date.isoformat(), end_date.isoformat(), analysts)
+        except Exception:
+            logger.exception("Scheduled cache warm-up failed")
+            continue
+        logger.info("Cache warmed for %d tickers in %.2fs: %s", len(tickers), time.perf_counter() - started, stats)
+
+
+if __name__ == "__main__":
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Fill the financial data cache ahead of a run")
+    parser.add_argument("--tickers", type=str, required=True, help="Comma-separated list of stock ticker symbols")
+    parser.add_argument("--start-date", type=str, help="Start date (YYYY-MM-DD). Defaults to one year before end date")
+    parser.add_argument("--end-date", type=str, help="End date (YYYY-MM-DD). Defaults to today")
+    parser.add_argument("--analysts", type=str, help=f"Comma-separated analysts to warm the data of. Defaults to all: {', '.join(ANALYST_CONFIG)}")
+    parser.add_argument("--workers", type=int, help="Concurrent requests. Defaults to HEDGE_FUND_PREFETCH_WORKERS or 8")
+    parser.add_argument("--data-mode", choices=DATA_MODES, help="Fetch live data, record API responses as fixtures, or replay recorded fixtures without network access")
+    parser.add_argument("--fixtures-dir", type=str, help="Directory of recorded API responses. Defaults to fixtures/financial_data")
+
+    args = parser.parse_args()
+    set_data_mode(args.data_mode, args.fixtures_dir)
+
+    tickers = [ticker.strip() for ticker in args.tickers.split(",")]
+    analysts = [analyst.strip() for analyst in args.analysts.split(",")] if args.analysts else None
+    end_date = args.end_date or datetime.now().strftime("%Y-%m-%d")
+    start_date = args.start_date or (datetime.strptime(end_date, "%Y-%m-%d") - timedelta(days=365)).strftime("%Y-%m-%d")
+
+    started = time.perf_counter()
+    stats = warm_cache(tickers, start_date, end_date, analysts, args.workers)
+    print_warm_cache_report(stats, time.perf_counter() - started)
@@ -0,0 +1,175 @@
+import datetime
+import threading
+import time
+
+import pytest
+
+from src.data.cache import Cache
+from src.data.models import CompanyNews, FinancialMetrics, InsiderTrade, LineItem, Price
+from src.data.price_series import PriceSeries
+from src.data.providers import set_data_provider
+from src.tools import api
+
+
+class FakeProvider:
+    """Serves one record per day and holds every call until `parallel` calls are in flight."""
+
+    def __init__(self, parallel: int = 2):
+        self.calls = []
+        self._barrier = threading.Barrier(parallel, timeout=5)
+
+    def _arrive(self, *call):
+        self.calls.append(call)
+        self._barrier.wait()
+
+    def get_company_news(self, ticker, end_date, start_date=None, limit=1000):
+        self._arrive("news", start_date, end_date)
+        return [CompanyNews(ticker=ticker, title=day, author="a", source="s", date=f"{day}T00:00:00Z", url="u") for day in _days(start_date, end_date)]
+
+    def get_prices(self, ticker, start_date, end_date):
+        self._arrive("prices", start_date, end_date)
+        return [Price(open=1.0, close=1.0, high=1.0, low=1.0, volume=1, time=f"{day}T00:00:00Z") for day in _days(start_date, end_date)]
+
+    def get_financial_metrics(self, ticker, end_date, period="ttm", limit=10):
+        self._arrive("financial_metrics", end_date, limit)
+        return _financial_metrics(ticker, [report_period for report_period in REPORT_PERIODS if end_date is None or report_period <= end_date][:limit])
+
+    def search_line_items(self, ticker, line_items, end_date, period="ttm", limit=10):
+        self._arrive("line_items", tuple(line_items), end_date)
+        return [LineItem(ticker=ticker, report_period=report_period, period=period, currency="USD", **dict.fromkeys(line_items, 1.0)) for report_period in REPORT_PERIODS[:limit]]
+
+    def get_insider_trades(self, ticker, end_date, start_date=None, limit=1000):
+        self._arrive("insider_trades", start_date, end_date)
+        fields = dict.fromkeys(InsiderTrade.model_fields)
+        return [InsiderTrade(**{**fields, "ticker": ticker, "filing_date": day}) for day in _days(start_date, end_date)]
+
+
+# Newest first, like API responses
+REPORT_PERIODS = [f"{year}-12-31" for year in range(2023, 1963, -1)]
+
+
+def _financial_metrics(ticker: str, report_periods: list[str]) -> list[FinancialMetrics]:
+    fields = dict.fromkeys(FinancialMetrics.model_fields)
+    return [FinancialMetrics(**{**fields, "ticker": ticker, "report_period": report_period, "period": "ttm", "currency": "USD"}) for report_period in report_periods]
+
+
+def _days(start_date: str, end_date: str) -> list[str]:
+    start, end = datetime.date.fromisoformat(start_date), datetime.date.fromisoformat(end_date)
+    return [(start + datetime.timedelta(days=i)).isoformat() for i in range((end - start).days + 1)]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = Cache()
+    cache.set_store(None)
+    monkeypatch.setattr(api, "_cache", cache)
+    yield cache
+    set_data_provider(None)
+
+
+def _slow_down(monkeypatch, owner, name):
+    """Widen the window between reading and writing a cached entry, where updates used to be lost."""
+    func = getattr(owner, name)
+    monkeypatch.setattr(owner, name, lambda *args: (func(*args), time.sleep(0.02))[0])
+
+
+def _run_concurrently(*calls):
+    threads = [threading.Thread(target=call) for call in calls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.mark.parametrize("get_events", [api.get_company_news, api.get_insider_trades])
+def test_concurrent_event_windows_keep_both(cache, monkeypatch, get_events):
+    _slow_down(monkeypatch, cache, "_merge_events")
+    provider = FakeProvider()
+    set_data_provider(provider)
+    windows = [("2024-01-01", "2024-01-10"), ("2024-02-01", "2024-02-10")]
+    _run_concurrently(*[lambda start=start, end=end: get_events("AAPL", end, start) for start, end in windows])
+    assert len(provider.calls) == 2
+
+    # Both windows are covered and served from the cache with all their events
+    for start, end in windows:
+        assert len(get_events("AAPL", end, start)) == 10
+    assert len(provider.calls) == 2
+
+
+def test_concurrent_price_ranges_keep_both(cache, monkeypatch):
+    _slow_down(monkeypatch, PriceSeries, "merge")
+    provider = FakeProvider()
+    set_data_provider(provider)
+    # The first range leaves a series behind, so both concurrent writes merge into it
+    cache.set_prices("AAPL", [Price(open=1.0, close=1.0, high=1.0, low=1.0, volume=1, time="2023-12-31T00:00:00Z")])
+    windows = [("2024-01-01", "2024-01-10"), ("2024-02-01", "2024-02-10")]
+    _run_concurrently(*[lambda start=start, end=end: api.get_prices("AAPL", start, end) for start, end in windows])
+    assert len(provider.calls) == 2
+
+    for start, end in windows:
+        assert len(api.get_prices("AAPL", start, end)) == 10
+    assert len(provider.calls) == 2
+
+
+def test_concurrent_line_item_fields_keep_both(cache, monkeypatch):
+    for name in ("get_line_items", "get_line_items_coverage"):
+        _slow_down(monkeypatch, cache, name)
+    provider = FakeProvider()
+    set_data_provider(provider)
+    fields = [["revenue"], ["net_income"]]
+    _run_concurrently(*[lambda line_items=line_items: api.search_line_items("AAPL", line_items, "2023-12-31", limit=5) for line_items in fields])
+    assert len(provider.calls) == 2
+
+    line_items = api.search_line_items("AAPL", ["revenue", "net_income"], "2023-12-31", limit=5)
+    assert [item.report_period for item in line_items] == REPORT_PERIODS[:5]
+    assert all(item.revenue == item.net_income == 1.0 for item in line_items)
+    assert len(provider.calls) == 2
+
+
+def test_concurrent_financial_metrics_windows_keep_both(cache, monkeypatch):
+    for name in ("get_financial_metrics", "get_financial_metrics_coverage"):
+        _slow_down(monkeypatch, cache, name)
+    # The newest reports and the older ones extending them backwards, stored at the same time
+    _run_concurrently(
+        lambda: api._store_financial_metrics("AAPL", None, "ttm", 10, _financial_metrics("AAPL", REPORT_PERIODS[:10])),
+        lambda: api._store_financial_metrics("AAPL", REPORT_PERIODS[9], "ttm", 10, _financial_metrics("AAPL", REPORT_PERIODS[9:19])),
+    )
+    provider = FakeProvider(parallel=1)
+    set_data_provider(provider)
+    assert [metric.report_period for metric in api.get_financial_metrics("AAPL", "2023-12-31", limit=19)] == REPORT_PERIODS[:19]
+    assert provider.calls == []
+
+
+def test_financial_metrics_window_serves_later_and_earlier_end_dates(cache):
+    provider = FakeProvider(parallel=1)
+    set_data_provider(provider)
+    # A backtest moving forward is answered from the first fetch of the newest reports
+    for end_date in ("2015-06-30", "2019-03-31", "2023-12-31"):
+        metrics = api.get_financial_metrics("AAPL", end_date, limit=5)
+        assert [metric.report_period for metric in metrics] == [p for p in REPORT_PERIODS if p <= end_date][:5]
+    assert provider.calls == [("financial_metrics", None, api.FINANCIAL_METRICS_FETCH_LIMIT)]
+
+    # Earlier end dates within the window are answered too; deeper ones extend it backwards
+    api.get_financial_metrics("AAPL", "1990-12-31", limit=5)
+    assert len(provider.calls) == 1
+    oldest = REPORT_PERIODS[api.FINANCIAL_METRICS_FETCH_LIMIT - 1]
+    metrics = api.get_financial_metrics("AAPL", "1975-12-31", limit=5)
+    assert [metric.report_period for metric in metrics] == [p for p in REPORT_PERIODS if p <= "1975-12-31"][:5]
+    assert provider.calls[1:] == [("financial_metrics", oldest, api.FINANCIAL_METRICS_FETCH_LIMIT)]
+    api.get_financial_metrics("AAPL", "1980-12-31", limit=5)
+    assert len(provider.calls) == 2
+
+
+def test_financial_metrics_refetched_after_stale_fetch(cache):
+    provider = FakeProvider(parallel=1)
+    set_data_provider(provider)
+    today = datetime.date.today()
+    yesterday = (today - datetime.timedelta(days=1)).isoformat()
+    cache.set_financial_metrics("AAPL_ttm", _financial_metrics("AAPL", REPORT_PERIODS[:10]))
+    cache.set_financial_metrics_coverage("AAPL_ttm", {"start": REPORT_PERIODS[9], "end": yesterday, "fetched_at": yesterday, "complete": False})
+
+    api.get_financial_metrics("AAPL", yesterday, limit=5)
+    assert provider.calls == []
+    # A report may have been published since yesterday's fetch
+    api.get_financial_metrics("AAPL", today.isoformat(), limit=5)
+    assert provider.calls == [("financial_metrics", None, api.FINANCIAL_METRICS_FETCH_LIMIT)]
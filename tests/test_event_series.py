@@ -0,0 +1,34 @@
+import zlib
+
+from src.data import event_series
+from src.data.event_series import COMPRESSED_BLOCK_ROWS, EventSeries
+from src.data.models import CompanyNews
+
+
+def _news(count: int) -> list[dict]:
+    return [
+        {"ticker": "AAPL", "title": None if i % 7 == 0 else f"Headline {i} é", "author": "a", "source": "s", "date": f"2024-01-01T00:{i % 60:02d}:{i // 60 % 60:02d}Z", "url": "u", "sentiment": None}
+        for i in range(count)
+    ]
+
+
+def test_compressed_titles_round_trip():
+    records = _news(3 * COMPRESSED_BLOCK_ROWS + 5)
+    plain = EventSeries.from_records(CompanyNews, "date", records, compress=False)
+    compressed = EventSeries.from_records(CompanyNews, "date", records, compress=True)
+    assert compressed.to_rows() == plain.to_rows()
+    assert [news.title for news in compressed[100:600]] == [news.title for news in plain[100:600]]
+    assert compressed[-1] == plain[-1]
+
+
+def test_reading_one_item_decompresses_one_block(monkeypatch):
+    series = EventSeries.from_records(CompanyNews, "date", _news(4 * COMPRESSED_BLOCK_ROWS), compress=True)
+    calls = []
+    decompress = zlib.decompress
+    monkeypatch.setattr(event_series.zlib, "decompress", lambda data: (calls.append(len(data)), decompress(data))[1])
+    series[2 * COMPRESSED_BLOCK_ROWS + 3]
+    assert len(calls) == 1
+    calls.clear()
+    # Iterating decompresses each block about once rather than once per item
+    list(series)
+    assert len(calls) <= 4
@@ -0,0 +1,120 @@
+import gc
+import warnings
+from functools import partial
+
+import pytest
+from langchain_core.prompts import ChatPromptTemplate
+from pydantic import BaseModel
+
+from src.agents import warren_buffett
+from src.llm.cache import LLMResponseCache, response_fingerprint, set_llm_cache
+from src.utils import llm
+from src.utils.llm import call_llm_batch
+
+
+async def _echo(value):
+    return value
+
+
+def test_call_llm_batch_returns_results_by_key():
+    assert call_llm_batch({"MSFT": partial(_echo, 1), "AAPL": partial(_echo, 2)}) == {"MSFT": 1, "AAPL": 2}
+    assert call_llm_batch({}) == {}
+
+
+def test_agent_failing_before_the_batch_starts_no_call(monkeypatch):
+    started = []
+
+    async def fake_acall_llm(**kwargs):
+        started.append(kwargs["ticker"])
+
+    def get_financial_metrics(ticker, *args, **kwargs):
+        if ticker == "MSFT":
+            raise RuntimeError("data unavailable")
+        return []
+
+    monkeypatch.setattr(warren_buffett, "acall_llm", fake_acall_llm)
+    monkeypatch.setattr(warren_buffett, "get_financial_metrics", get_financial_metrics)
+    monkeypatch.setattr(warren_buffett, "search_line_items", lambda *args, **kwargs: [])
+    monkeypatch.setattr(warren_buffett, "get_market_cap", lambda *args, **kwargs: None)
+    state = {"data": {"end_date": "2024-12-31", "tickers": ["AAPL", "MSFT"], "analyst_signals": {}}, "metadata": {}, "messages": []}
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        with pytest.raises(RuntimeError):
+            warren_buffett.warren_buffett_agent(state)
+        gc.collect()
+    assert started == []
+    assert not [warning for warning in caught if "never awaited" in str(warning.message)]
+
+
+class Signal(BaseModel):
+    signal: str
+    confidence: float
+
+
+class OtherSignal(BaseModel):
+    signal: str
+
+
+def test_fingerprint_changes_with_every_part_of_the_request():
+    base = ("gpt-4o", "OpenAI", "Analyze AAPL", Signal)
+    fingerprint = response_fingerprint(*base)
+    assert response_fingerprint(*base) == fingerprint
+    for changed in (
+        ("gpt-4o-mini", "OpenAI", "Analyze AAPL", Signal),
+        ("gpt-4o", "Azure OpenAI", "Analyze AAPL", Signal),
+        ("gpt-4o", "OpenAI", "Analyze MSFT", Signal),
+        ("gpt-4o", "OpenAI", "Analyze AAPL", OtherSignal),
+    ):
+        assert response_fingerprint(*changed) != fingerprint
+
+
+def test_fingerprint_of_chat_prompts():
+    template = ChatPromptTemplate.from_messages([("system", "You are {name}"), ("human", "Analyze {ticker}")])
+    prompt = template.invoke({"name": "Buffett", "ticker": "AAPL"})
+    assert response_fingerprint("gpt-4o", "OpenAI", prompt, Signal) == response_fingerprint("gpt-4o", "OpenAI", template.invoke({"name": "Buffett", "ticker": "AAPL"}), Signal)
+    assert response_fingerprint("gpt-4o", "OpenAI", prompt, Signal) != response_fingerprint("gpt-4o", "OpenAI", template.invoke({"name": "Munger", "ticker": "AAPL"}), Signal)
+
+
+class FakeLLM:
+    def __init__(self, response=None):
+        self.response = response
+        self.prompts = []
+
+    def invoke(self, prompt):
+        self.prompts.append(prompt)
+        if self.response is None:
+            raise ValueError("unparseable response")
+        return self.response
+
+
+@pytest.fixture
+def llm_cache(monkeypatch):
+    cache = LLMResponseCache()
+    set_llm_cache(cache)
+    monkeypatch.setattr(llm, "record_llm_call", lambda *args: None)
+    yield cache
+    set_llm_cache(None)
+
+
+def test_responses_are_cached(llm_cache, monkeypatch):
+    fake = FakeLLM(Signal(signal="bullish", confidence=80.0))
+    monkeypatch.setattr(llm, "_prepare_llm", lambda *args: (None, fake))
+    assert llm.call_llm("Analyze AAPL", Signal).signal == "bullish"
+    assert llm.call_llm("Analyze AAPL", Signal).signal == "bullish"
+    assert len(fake.prompts) == 1
+    llm.call_llm("Analyze AAPL", Signal, use_cache=False)
+    assert len(fake.prompts) == 2
+
+
+def test_fallback_responses_are_not_cached(llm_cache, monkeypatch):
+    fake = FakeLLM()
+    monkeypatch.setattr(llm, "_prepare_llm", lambda *args: (None, fake))
+    default = lambda: Signal(signal="neutral", confidence=0.0)
+    assert llm.call_llm("Analyze AAPL", Signal, max_retries=2, default_factory=default).signal == "neutral"
+    assert llm_cache.get(response_fingerprint("gpt-4o", "OPENAI", "Analyze AAPL", Signal), Signal) is None
+
+    # The next call asks the model again rather than reusing the fallback
+    fake.response = Signal(signal="bullish", confidence=80.0)
+    assert llm.call_llm("Analyze AAPL", Signal, max_retries=2, default_factory=default).signal == "bullish"
+    assert len(fake.prompts) == 3
@@ -0,0 +1,105 @@
+import pytest
+
+from src.llm import scheduler
+from src.llm.scheduler import BACKOFF_MAX_SECONDS, LLMScheduler, ProviderBudget, set_llm_scheduler
+from src.utils import llm
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(scheduler, "time", clock)
+    # The longest jittered delay, so backoff is deterministic
+    monkeypatch.setattr(scheduler.random, "uniform", lambda low, high: high)
+    return clock
+
+
+def test_requests_per_minute(clock):
+    budget = ProviderBudget(rpm=60)
+    assert all(budget.reserve(0) == 0 for _ in range(60))
+    assert budget.reserve(0) == pytest.approx(1.0)
+    clock.now += 0.5
+    assert budget.reserve(0) == pytest.approx(0.5)
+    clock.now += 0.5
+    assert budget.reserve(0) == 0
+
+
+def test_tokens_per_minute(clock):
+    budget = ProviderBudget(tpm=1000)
+    assert budget.reserve(600) == 0
+    # 200 tokens short, refilled at 1000 a minute
+    assert budget.reserve(600) == pytest.approx(12.0)
+    # A call larger than the whole budget waits for a full bucket
+    assert budget.reserve(5000) == pytest.approx(36.0)
+    clock.now += 36
+    assert budget.reserve(5000) == 0
+
+
+def test_settle_returns_unused_tokens(clock):
+    budget = ProviderBudget(tpm=1000)
+    budget.reserve(1000)
+    budget.settle(estimated=1000, used=400)
+    assert budget.reserve(600) == 0
+    assert budget.reserve(1) > 0
+
+
+def test_acquire_waits_for_the_budget(clock):
+    llm_scheduler = LLMScheduler(rpm=60, provider_rpm={"ANTHROPIC": 30})
+    for _ in range(60):
+        llm_scheduler.acquire("OpenAI", 0)
+    assert llm_scheduler.acquire("OpenAI", 0) == pytest.approx(1.0)
+    assert clock.slept == [pytest.approx(1.0)]
+    assert llm_scheduler.budget("anthropic").rpm == 30
+    assert llm_scheduler.stats()["OPENAI"]["calls"] == 61
+
+
+def test_backoff_pauses_the_provider(clock):
+    llm_scheduler = LLMScheduler()
+    assert llm_scheduler.backoff("OPENAI", 0) == 1.0
+    assert llm_scheduler.budget("OPENAI").reserve(0) == pytest.approx(1.0)
+    assert llm_scheduler.backoff("OPENAI", 3) == 8.0
+    assert llm_scheduler.backoff("OPENAI", 20) == BACKOFF_MAX_SECONDS
+    # Retry-After is honoured, with up to a second of jitter
+    assert llm_scheduler.backoff("ANTHROPIC", 0, retry_after_seconds=30) == 31.0
+    assert llm_scheduler.stats()["OPENAI"]["rate_limited"] == 3
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class FlakyLLM:
+    def __init__(self, failures: int):
+        self.failures = failures
+
+    def invoke(self, prompt):
+        if self.failures:
+            self.failures -= 1
+            raise RateLimitError()
+        return "response"
+
+
+def test_rate_limited_calls_are_queued_again(clock):
+    llm_scheduler = LLMScheduler()
+    set_llm_scheduler(llm_scheduler)
+    try:
+        call = llm._new_call("agent", "AAPL", "gpt-4o", "OPENAI")
+        assert llm._invoke(FlakyLLM(failures=2), "prompt", "OPENAI", None, call) == "response"
+    finally:
+        set_llm_scheduler(None)
+    assert call["rate_limited"] == 2
+    # Exponential backoff between the attempts
+    assert clock.slept == [pytest.approx(1.0), pytest.approx(2.0)]
@@ -0,0 +1,41 @@
+import pandas as pd
+
+from src.data.providers.local import LocalFileProvider
+
+
+def _write(directory, name, rows):
+    pd.DataFrame(rows).to_csv(directory / f"{name}.csv", index=False)
+
+
+def test_windows_from_one_file(tmp_path):
+    _write(tmp_path, "prices", [
+        {"ticker": ticker, "time": f"2024-01-{day:02d}T05:00:00Z", "open": day, "close": day, "high": day, "low": day, "volume": day}
+        for ticker in ("AAPL", "MSFT")
+        for day in (5, 2, 3, 4, 1)
+    ])
+    provider = LocalFileProvider(tmp_path)
+    prices = provider.get_prices("AAPL", "2024-01-02", "2024-01-04")
+    assert [price.time[:10] for price in prices] == ["2024-01-02", "2024-01-03", "2024-01-04"]
+    assert all(price.volume == int(price.time[8:10]) for price in prices)
+    assert provider.get_prices("GOOG", "2024-01-01", "2024-01-31") == []
+
+
+def test_reports_and_events_from_per_ticker_files(tmp_path):
+    (tmp_path / "line_items").mkdir()
+    _write(tmp_path / "line_items", "AAPL", [
+        {"report_period": f"{year}-12-31", "period": period, "currency": "USD", "revenue": year}
+        for year in range(2019, 2024)
+        for period in ("ttm", "annual")
+    ])
+    (tmp_path / "company_news").mkdir()
+    _write(tmp_path / "company_news", "AAPL", [
+        {"title": f"n{day}", "author": "a", "source": "s", "date": f"2024-03-{day:02d}T10:00:00Z", "url": "u"} for day in range(1, 11)
+    ])
+    provider = LocalFileProvider(tmp_path)
+
+    line_items = provider.search_line_items("AAPL", ["revenue", "net_income"], "2022-06-30", "ttm", 2)
+    assert [(item.report_period, item.revenue, item.net_income) for item in line_items] == [("2021-12-31", 2021, None), ("2020-12-31", 2020, None)]
+    assert len(provider.search_line_items("AAPL", ["revenue"], None, "annual", 10)) == 5
+
+    assert [news.title for news in provider.get_company_news("AAPL", "2024-03-05", "2024-03-03", 1)] == ["n5", "n4", "n3"]
+    assert [news.title for news in provider.get_company_news("AAPL", "2024-03-05", None, 2)] == ["n5", "n4"]
@@ -0,0 +1,75 @@
+import pytest
+
+from src.data import lru
+from src.data.cache import Cache
+from src.data.lru import LRUCache, estimate_size
+from src.data.models import Price
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(lru.time, "time", lambda: clock[0])
+    return clock
+
+
+def test_evicts_least_recently_used_beyond_budget():
+    evicted = []
+    size = estimate_size("x" * 100)
+    cache = LRUCache(max_bytes=3 * size, on_evict=evicted.append)
+    for key in "abc":
+        cache.set(key, "x" * 100)
+    cache.get("a")
+    cache.set("d", "x" * 100)
+    assert evicted == ["b"]
+    assert "b" not in cache and "a" in cache
+    assert cache.stats()["bytes"] <= 3 * size
+    assert cache.stats()["evictions"] == 1
+
+
+def test_oversized_entry_is_kept_alone():
+    cache = LRUCache(max_bytes=10)
+    cache.set("a", "x" * 100)
+    cache.set("b", "y" * 100)
+    assert len(cache) == 1 and cache.get("b") == "y" * 100
+
+
+def test_replacing_an_entry_updates_its_size():
+    cache = LRUCache()
+    cache.set("a", "x" * 1000)
+    cache.set("a", "x")
+    assert cache.stats()["bytes"] == estimate_size("x")
+
+
+def test_entries_expire(now):
+    expired = []
+    cache = LRUCache(ttl=60, on_evict=expired.append)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=600)
+    now[0] += 61
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert expired == ["a"]
+    assert cache.stats()["expirations"] == 1
+
+
+def test_eviction_drops_coverage():
+    cache = Cache(memory_budgets={"prices": 1}, ttls={})
+    cache.set_store(None)
+    for ticker in ("AAPL", "MSFT"):
+        cache.set_prices(ticker, [Price(open=1, close=1, high=1, low=1, volume=1, time="2024-01-02T00:00:00Z")])
+        cache.add_price_coverage(ticker, "2024-01-01", "2024-01-31")
+    # Only the newest series fits, and the evicted one is no longer reported as covered
+    assert cache.get_prices("AAPL") is None
+    assert cache.get_price_coverage("AAPL") == []
+    assert cache.get_price_coverage("MSFT") == [["2024-01-01", "2024-01-31"]]
+
+
+def test_expiry_drops_coverage(now):
+    cache = Cache(memory_budgets={}, ttls={"company_news": 60})
+    cache.set_store(None)
+    cache.set_company_news("AAPL", [])
+    cache.add_company_news_coverage("AAPL", "2024-01-01", "2024-01-31")
+    now[0] += 61
+    assert cache.get_company_news("AAPL") is None
+    assert cache.get_company_news_coverage("AAPL") == []
@@ -0,0 +1,49 @@
+import datetime
+import json
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from src.data.providers import financial_datasets
+from src.data.providers.financial_datasets import MAX_SHARDS, FinancialDatasetsProvider, _shard_window
+
+
+def test_shards_cover_the_window():
+    shards = _shard_window("2024-01-01", "2024-03-31", density=1.0, limit=10)
+    assert shards[0][1] == "2024-03-31" and shards[-1][0] == "2024-01-01"
+    for (newer_start, _), (_, older_end) in zip(shards, shards[1:]):
+        assert datetime.date.fromisoformat(older_end) + datetime.timedelta(days=1) == datetime.date.fromisoformat(newer_start)
+    assert all(financial_datasets._days_between(start, end) == 8 for start, end in shards[:-1])
+
+
+def test_dense_first_page_is_clamped():
+    shards = _shard_window("2020-01-01", "2024-12-31", density=500.0, limit=100)
+    assert len(shards) <= MAX_SHARDS
+    assert shards[0][1] == "2024-12-31" and shards[-1][0] == "2020-01-01"
+
+
+def test_dense_recent_news_pages_a_long_window(monkeypatch):
+    # 20 articles a day over the last five days of a three year window, none before
+    latest = datetime.date(2024, 12, 31)
+    news = [
+        {"ticker": "AAPL", "title": f"{day}-{i}", "author": "a", "source": "s", "date": f"{day}T{i:02d}:00:00Z", "url": "u"}
+        for day in (latest - datetime.timedelta(days=n) for n in range(5))
+        for i in range(20)
+    ]
+    urls = []
+
+    def fake_request(self, method, url, **kwargs):
+        urls.append(url)
+        query = {key: values[0] for key, values in parse_qs(urlparse(url).query).items()}
+        page = [item for item in news if query["start_date"] <= item["date"][:10] <= query["end_date"]][: int(query["limit"])]
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({"news": page}).encode()
+        return response
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    monkeypatch.setenv("FINANCIAL_DATASETS_PAGE_WORKERS", "4")
+    result = FinancialDatasetsProvider().get_company_news("AAPL", "2024-12-31", "2022-01-01", 100)
+    assert len(result) == len(news)
+    # The first page, at most MAX_SHARDS shards, and the page the newest shard continues with
+    assert len(urls) <= MAX_SHARDS + 2
@@ -0,0 +1,68 @@
+import pandas as pd
+import pytest
+
+from src.data.lru import estimate_size
+from src.data.models import Price
+from src.data.price_series import PriceSeries
+from src.tools.api import prices_to_df
+
+
+def _prices(days: list[int]) -> list[Price]:
+    return [Price(open=day + 0.5, close=day + 0.25, high=day + 1.0, low=day - 1.0, volume=1000 * day, time=f"2024-01-{day:02d}T05:00:00Z") for day in days]
+
+
+def _reference_df(prices: list[Price]) -> pd.DataFrame:
+    """prices_to_df as it was before PriceSeries."""
+    df = pd.DataFrame([p.model_dump() for p in prices])
+    df["Date"] = pd.to_datetime(df["time"])
+    df.set_index("Date", inplace=True)
+    for col in ["open", "close", "high", "low", "volume"]:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df.sort_index(inplace=True)
+    return df
+
+
+def test_dataframe_matches_the_model_based_conversion():
+    prices = _prices([5, 2, 9, 3])
+    pd.testing.assert_frame_equal(prices_to_df(prices), _reference_df(prices))
+    pd.testing.assert_frame_equal(prices_to_df(PriceSeries.from_prices(prices)), _reference_df(prices))
+
+
+def test_round_trips():
+    prices = _prices([3, 1, 2])
+    series = PriceSeries.from_prices(prices)
+    ordered = sorted(prices, key=lambda price: price.time)
+    assert series.to_prices() == ordered
+    assert list(series) == ordered
+    assert PriceSeries.from_rows(series.to_rows()).to_prices() == ordered
+    assert series[0] == ordered[0] and series[-1] == ordered[-1] and series[1:] == ordered[1:]
+    with pytest.raises(IndexError):
+        series[3]
+
+
+def test_slice_matches_filtering_the_dataframe():
+    prices = _prices(list(range(1, 21)))
+    series = PriceSeries.from_prices(prices)
+    window = series.slice("2024-01-05", "2024-01-10")
+    expected = _reference_df([price for price in prices if "2024-01-05" <= price.time[:10] <= "2024-01-10"])
+    pd.testing.assert_frame_equal(window.to_df(), expected)
+    # Slices share the arrays of the series they come from
+    assert window.ohlc.base is series.ohlc or window.ohlc.base is series.ohlc.base
+    assert len(series.slice("2024-02-01", "2024-02-28")) == 0
+    assert series.slice("2023-01-01", "2025-01-01") is series
+
+
+def test_merge_keeps_existing_bars():
+    series = PriceSeries.from_prices(_prices([1, 2, 3]))
+    update = PriceSeries.from_prices([Price(open=0, close=0, high=0, low=0, volume=0, time="2024-01-03T05:00:00Z"), *_prices([4])])
+    merged = series.merge(update)
+    assert [price.time[:10] for price in merged] == ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]
+    assert merged[2].close == 3.25
+
+
+def test_reading_prices_does_not_grow_the_series():
+    series = PriceSeries.from_prices(_prices(list(range(1, 29))))
+    size = estimate_size(series)
+    series.to_prices()
+    list(series)
+    assert estimate_size(series) == size
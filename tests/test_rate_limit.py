@@ -0,0 +1,42 @@
+import requests
+
+from src.data.providers import financial_datasets
+from src.data.rate_limit import RateLimiter, create_rate_limiter_from_env, endpoint_name, set_rate_limiter
+
+API = "https://api.financialdatasets.ai"
+
+
+def test_endpoint_names():
+    assert endpoint_name(f"{API}/prices/?ticker=AAPL&interval=day") == "prices"
+    assert endpoint_name(f"{API}/financials/search/line-items") == "line-items"
+    assert endpoint_name(f"{API}/news/?ticker=AAPL") == "news"
+    assert endpoint_name(f"{API}/company/facts/?ticker=AAPL") == "company-facts"
+
+
+def test_company_facts_override(monkeypatch):
+    monkeypatch.setenv("FINANCIAL_DATASETS_RATE_LIMIT_COMPANY_FACTS", "2")
+    limiter = create_rate_limiter_from_env()
+    assert limiter.endpoint_rates == {"company-facts": 2.0}
+    assert limiter._bucket(endpoint_name(f"{API}/company/facts/?ticker=AAPL")).rate == 2.0
+    assert limiter._bucket(endpoint_name(f"{API}/prices/?ticker=AAPL")) is None
+
+
+def test_retries_take_a_token(monkeypatch):
+    statuses = iter([429, 503, 200])
+
+    def fake_request(self, method, url, **kwargs):
+        response = requests.Response()
+        response.status_code = next(statuses)
+        response._content = b'{"company_facts": {"ticker": "AAPL", "name": "Apple"}}'
+        return response
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    monkeypatch.setattr(financial_datasets, "_retry_delay", lambda *args: 0.0)
+    limiter = RateLimiter(rate=1000)
+    set_rate_limiter(limiter)
+    try:
+        company_facts = financial_datasets.FinancialDatasetsProvider().get_company_facts("AAPL")
+    finally:
+        set_rate_limiter(None)
+    assert company_facts.name == "Apple"
+    assert limiter.stats()["company-facts"]["requests"] == 3
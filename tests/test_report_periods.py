@@ -0,0 +1,76 @@
+import datetime
+
+from src.data.report_periods import fetched_window, merge_windows, next_fetch_end_date, window_covers
+
+TODAY = datetime.date.today()
+YESTERDAY = (TODAY - datetime.timedelta(days=1)).isoformat()
+PERIODS = ["2023-12-31", "2023-09-30", "2023-06-30", "2023-03-31"]
+
+
+def _window(start, end, fetched_at, complete=False):
+    return {"start": start, "end": end, "fetched_at": fetched_at, "complete": complete}
+
+
+def test_fetched_window():
+    newest = fetched_window(PERIODS, None, 4)
+    assert newest == _window("2023-03-31", TODAY.isoformat(), TODAY.isoformat())
+    # A short page exhausts the history, and end dates past today are capped
+    assert fetched_window(PERIODS, "2999-01-01", 10)["complete"]
+    assert fetched_window(PERIODS, "2999-01-01", 10)["end"] == TODAY.isoformat()
+    assert fetched_window([], "2020-06-30", 10)["start"] == "2020-06-30"
+
+
+def test_window_covers_earlier_and_later_end_dates():
+    window = _window("2023-03-31", "2024-03-01", "2024-03-01")
+    assert window_covers(window, PERIODS, "2023-12-31", 4)
+    # Only three reports precede this end date and the window may hold older ones
+    assert not window_covers(window, PERIODS, "2023-10-15", 4)
+    assert window_covers(window, PERIODS, "2023-10-15", 3)
+    # Nothing published after the fetch can have a period before it, so later end dates are covered
+    assert window_covers(window, PERIODS, "2025-06-30", 4)
+    assert not window_covers(None, PERIODS, "2023-12-31", 1)
+
+
+def test_window_covers_complete_history():
+    window = _window("2023-03-31", "2024-03-01", "2024-03-01", complete=True)
+    assert window_covers(window, PERIODS, "2023-10-15", 10)
+
+
+def test_window_ending_before_the_request():
+    window = _window("2023-03-31", "2023-06-30", "2024-03-01")
+    assert not window_covers(window, PERIODS, "2023-12-31", 1)
+    # Refreshed with the newest reports rather than from the requested end date
+    assert next_fetch_end_date(window, "2023-12-31") is None
+    assert next_fetch_end_date(None, "2023-12-31") is None
+
+
+def test_stale_fetch_does_not_cover_today():
+    window = _window("2023-03-31", YESTERDAY, YESTERDAY)
+    assert window_covers(window, PERIODS, YESTERDAY, 1)
+    assert not window_covers(window, PERIODS, TODAY.isoformat(), 1)
+    assert next_fetch_end_date(window, TODAY.isoformat()) is None
+
+
+def test_short_window_extends_backwards():
+    window = _window("2023-03-31", "2024-03-01", "2024-03-01")
+    assert next_fetch_end_date(window, "2023-12-31") == "2023-03-31"
+
+
+def test_merge_windows():
+    newer = _window("2023-03-31", "2024-03-01", "2024-03-01")
+    older = _window("2020-03-31", "2023-03-31", "2024-03-02", complete=True)
+    merged = merge_windows(newer, older)
+    assert merged == _window("2020-03-31", "2024-03-01", "2024-03-01", complete=True)
+    # Disjoint windows cannot vouch for the gap between them
+    assert merge_windows(_window("2020-03-31", "2021-03-31", "2024-03-01"), newer) == newer
+    assert merge_windows(None, newer) == newer
+
+
+def test_merge_windows_keeps_the_latest_fetch():
+    earlier = _window("2023-03-31", "2024-03-01", "2024-03-01")
+    refreshed = _window("2023-06-30", "2024-06-01", "2024-06-01")
+    assert merge_windows(earlier, refreshed) == _window("2023-03-31", "2024-06-01", "2024-06-01")
+    # Windows recorded before fetched_at was tracked vouch for their end only
+    legacy = {"start": "2023-03-31", "end": "2024-03-01", "complete": False}
+    assert merge_windows(legacy, refreshed)["fetched_at"] == "2024-06-01"
+    assert not window_covers(legacy, PERIODS, "2024-06-30", 1)
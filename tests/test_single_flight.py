@@ -0,0 +1,122 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.tools.single_flight import AsyncSingleFlight, SingleFlight
+
+
+def _in_threads(count: int, target) -> list:
+    results = [None] * count
+
+    def run(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_calls_share_one_result():
+    single_flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    def call():
+        return single_flight.do("AAPL", fetch)
+
+    # Let every thread reach the in-flight call before the leader finishes
+    threading.Timer(0.1, release.set).start()
+    assert _in_threads(5, call) == ["value"] * 5
+    assert len(calls) == 1
+    # The key is released once the call finished
+    assert single_flight.do("AAPL", lambda: "again") == "again"
+
+
+def test_errors_reach_every_waiter():
+    single_flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        raise ValueError("provider down")
+
+    threading.Timer(0.1, release.set).start()
+    results = _in_threads(4, lambda: single_flight.do("AAPL", fetch))
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) and str(result) == "provider down" for result in results)
+    assert single_flight.do("AAPL", lambda: "recovered") == "recovered"
+
+
+def test_different_keys_run_separately():
+    single_flight = SingleFlight()
+    assert single_flight.do("AAPL", lambda: 1) == 1
+    assert single_flight.do("MSFT", lambda: 2) == 2
+
+
+def test_async_calls_share_one_result():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def main():
+        return await asyncio.gather(*(single_flight.do("AAPL", fetch) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["value"] * 5
+    assert len(calls) == 1
+
+
+def test_async_errors_reach_every_waiter():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("provider down")
+
+    async def main():
+        results = await asyncio.gather(*(single_flight.do("AAPL", fetch) for _ in range(4)), return_exceptions=True)
+        return results, await single_flight.do("AAPL", lambda: asyncio.sleep(0, "recovered"))
+
+    results, recovered = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    assert recovered == "recovered"
+
+
+def test_cancelled_waiter_does_not_cancel_the_leader():
+    single_flight = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "value"
+
+    async def main():
+        leader = asyncio.ensure_future(single_flight.do("AAPL", fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(single_flight.do("AAPL", fetch))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return await leader
+
+    assert asyncio.run(main()) == "value"